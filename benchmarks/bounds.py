@@ -0,0 +1,92 @@
+# Compares the vertex bounds engine against the original per-vertex loop.
+#
+# usage: blender --background --python benchmarks/bounds.py -- [--vertices 200000] [--repeat 5]
+
+import os
+import sys
+import time
+import random
+import argparse
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from io_scene_gltf2_omi_collision import addon
+from io_scene_gltf2_omi_collision.core import bounds
+
+def _parse_args():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog='bounds.py')
+    parser.add_argument('--vertices', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=5)
+
+    return parser.parse_args(argv)
+
+def _create_mesh(vertex_count):
+    mesh = bpy.data.meshes.new('OMIColliderBoundsBenchmark')
+    mesh.vertices.add(vertex_count)
+    mesh.vertices.foreach_set('co', [random.uniform(-10.0, 10.0) for _ in range(vertex_count * 3)])
+    return mesh
+
+def _legacy_axis_min_and_max(mesh):
+    x_min, x_max = None, None
+    y_min, y_max = None, None
+    z_min, z_max = None, None
+
+    for vertex in mesh.vertices:
+        x, y, z = vertex.co
+
+        if x_min is None: x_min = x
+        if x_max is None: x_max = x
+
+        if y_min is None: y_min = y
+        if y_max is None: y_max = y
+
+        if z_min is None: z_min = z
+        if z_max is None: z_max = z
+
+        if x < x_min: x_min = x
+        elif x > x_max: x_max = x
+
+        if y < y_min: y_min = y
+        elif y > y_max: y_max = y
+
+        if z < z_min: z_min = z
+        elif z > z_max: z_max = z
+
+    return ((x_min, x_max), (y_min, y_max), (z_min, z_max))
+
+def _time(func, mesh, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(mesh)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best: best = elapsed
+    return best
+
+def main():
+    args = _parse_args()
+    mesh = _create_mesh(args.vertices)
+
+    candidates = [
+        ('legacy loop', _legacy_axis_min_and_max),
+        ('foreach_get + python', lambda m: bounds.get_coordinate_bounds_python(addon._read_mesh_coordinates(m)))
+    ]
+
+    if bounds.np is not None:
+        candidates.append(('foreach_get + numpy', lambda m: bounds.get_coordinate_bounds_numpy(addon._read_mesh_coordinates(m))))
+
+    print('vertices: {}'.format(args.vertices))
+
+    baseline = None
+    for name, func in candidates:
+        elapsed = _time(func, mesh, args.repeat)
+        if baseline is None: baseline = elapsed
+        print('{:<24} {:>10.2f} ms {:>8.1f}x'.format(name, elapsed * 1000, baseline / elapsed))
+
+    bpy.data.meshes.remove(mesh)
+
+main()
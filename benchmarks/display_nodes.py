@@ -0,0 +1,81 @@
+# Times gather_gltf_extensions_hook() on synthetic node graphs to check that
+# display mesh node insertion scales linearly with the node count.
+#
+# usage: blender --background --python benchmarks/display_nodes.py -- [--nodes 1000 10000 100000] [--display-ratio 0.1]
+
+import os
+import sys
+import time
+import random
+import argparse
+
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io_scene_gltf2_omi_collision as omi_collider
+
+from io_scene_gltf2.io.com.gltf2_io import Node
+
+def _parse_args():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog='display_nodes.py')
+    parser.add_argument('--nodes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--display-ratio', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=0)
+
+    return parser.parse_args(argv)
+
+def _create_glTF(node_count, display_ratio, rng):
+    nodes = []
+    scene_nodes = []
+
+    for index in range(node_count):
+        node = Node(
+            None, [], {}, None, None, None, 'Node{}'.format(index), [0, 0, 0, 1], [1, 1, 1],
+            None, [0, 0, 0], None)
+
+        if index % 100 == 0: scene_nodes.append(index)
+        else: nodes[rng.randrange(index)].children.append(index)
+
+        # box colliders shown with their render mesh, as _gather_collider_node() leaves them
+        if rng.random() < display_ratio:
+            node.extensions[omi_collider.glTF_extension_name] = {'type': 'box', 'extents': [1.0, 1.0, 1.0]}
+            node.is_display_mesh = True
+            node._collider_type = 'box'
+            node._collider_mesh = None
+            node._display_mesh = 0
+
+        nodes.append(node)
+
+    return SimpleNamespace(nodes=nodes, scenes=[SimpleNamespace(nodes=scene_nodes)])
+
+def main():
+    args = _parse_args()
+    rng = random.Random(args.seed)
+
+    omi_collider.register()
+
+    try:
+        extension = omi_collider.glTF2ExportUserExtension()
+
+        print('{:>10} {:>14} {:>12} {:>14}'.format('nodes', 'display nodes', 'hook (ms)', 'us per node'))
+
+        for node_count in args.nodes:
+            glTF = _create_glTF(node_count, args.display_ratio, rng)
+            display_count = sum(1 for n in glTF.nodes if getattr(n, 'is_display_mesh', False))
+
+            start = time.perf_counter()
+            extension.gather_gltf_extensions_hook(glTF, {'gltf_yup': True})
+            elapsed = time.perf_counter() - start
+
+            assert len(glTF.nodes) == node_count + display_count, 'expected {} display nodes, got {}'.format(
+                display_count, len(glTF.nodes) - node_count)
+
+            print('{:>10} {:>14} {:>12.2f} {:>14.3f}'.format(
+                node_count, display_count, elapsed * 1000, elapsed * 1e6 / node_count))
+    finally:
+        omi_collider.unregister()
+
+main()
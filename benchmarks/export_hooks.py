@@ -0,0 +1,246 @@
+# Times the exporter hooks on generated scenes and checks them against a baseline.
+#
+# usage:
+#   blender --background --python benchmarks/export_hooks.py -- \
+#       [--objects 2000] [--vertices 500] [--mix box=1,sphere=1,capsule=1,hull=1,mesh=1] \
+#       [--display-ratio 0.1] [--offset-ratio 0.1] [--repeat 3] [--output FILE] \
+#       [--save-baseline FILE] [--baseline FILE] [--threshold 0.25]
+#
+# The scene is exported --repeat times with the add-on's caches cleared before
+# each export, and the median seconds of every timed function are kept. With
+# --save-baseline the results and the allowed slowdown of every function are
+# written as JSON. With --baseline the results are compared against such a file
+# and the script exits with 1 when a function got slower than its threshold.
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+import bpy
+import bmesh
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from io_scene_gltf2_omi_collision import addon, batch_export
+from io_scene_gltf2_omi_collision.core.shapes import collider_type_names
+
+baseline_version = 1
+
+# differences below this many seconds are noise, however large the ratio
+noise_seconds = 0.005
+
+timed_methods = ['gather_node_hook', '_collect_extension_data', 'gather_gltf_extensions_hook']
+timed_functions = ['_is_valid_hull_mesh']
+
+def _parse_args():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog='export_hooks.py')
+    parser.add_argument('--objects', type=int, default=2000)
+    parser.add_argument('--vertices', type=int, default=500, help='approximate vertices per mesh')
+    parser.add_argument('--mix', default='box=1,sphere=1,capsule=1,hull=1,mesh=1', help='collider type weights')
+    parser.add_argument('--display-ratio', type=float, default=0.1)
+    parser.add_argument('--offset-ratio', type=float, default=0.1)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help='write the results here instead of stdout')
+    parser.add_argument('--save-baseline', default=None)
+    parser.add_argument('--baseline', default=None)
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown saved with a baseline')
+
+    return parser.parse_args(argv)
+
+def _parse_mix(mix):
+    weights = {}
+
+    for entry in mix.split(','):
+        collider_type, _, weight = entry.partition('=')
+        collider_type = collider_type.strip()
+        if collider_type not in collider_type_names: raise SystemExit('unknown collider type: {}'.format(collider_type))
+        weights[collider_type] = float(weight) if weight else 1.0
+
+    return weights
+
+def _create_mesh(name, vertex_count, rng):
+    # uv spheres are convex, so hull colliders stay valid, and scaled apart so no two share a fingerprint
+    segments = max(int(vertex_count ** 0.5), 3)
+
+    bm = bmesh.new()
+    bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=segments, radius=1.0)
+    bmesh.ops.scale(bm, vec=(rng.uniform(0.5, 2.0), rng.uniform(0.5, 2.0), rng.uniform(0.5, 2.0)), verts=bm.verts)
+
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+
+    return mesh
+
+def _create_scene(args, rng):
+    weights = _parse_mix(args.mix)
+    collider_types = list(weights.keys())
+
+    scene = bpy.data.scenes.new('OMIColliderBenchmark')
+
+    for index in range(args.objects):
+        name = 'Collider{}'.format(index)
+        obj = bpy.data.objects.new(name, _create_mesh(name, args.vertices, rng))
+        obj.location = (rng.uniform(-100.0, 100.0), rng.uniform(-100.0, 100.0), rng.uniform(-100.0, 100.0))
+        scene.collection.objects.link(obj)
+
+        collider_props = obj.OMIColliderProperties
+        collider_props.is_collider = True
+        collider_props.collider_type = rng.choices(collider_types, [weights[t] for t in collider_types])[0]
+        collider_props.is_display_mesh = rng.random() < args.display_ratio
+
+        if rng.random() < args.offset_ratio:
+            collider_props.use_offsets = True
+            collider_props.offset_location = (rng.uniform(-1.0, 1.0), rng.uniform(-1.0, 1.0), rng.uniform(-1.0, 1.0))
+            collider_props.offset_rotation = (rng.uniform(-1.0, 1.0), rng.uniform(-1.0, 1.0), rng.uniform(-1.0, 1.0))
+
+    return scene
+
+def _remove_scene(scene):
+    meshes = [obj.data for obj in scene.objects]
+
+    for obj in list(scene.objects): bpy.data.objects.remove(obj)
+    for mesh in meshes: bpy.data.meshes.remove(mesh)
+
+    bpy.data.scenes.remove(scene)
+
+def _wrap_timer(func, name, timings):
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try: return func(*args, **kwargs)
+        finally:
+            timing = timings.setdefault(name, {'calls': 0, 'seconds': 0.0})
+            timing['calls'] += 1
+            timing['seconds'] += time.perf_counter() - start
+
+    return timed
+
+def _install_timers(timings):
+    originals = []
+
+    extension_class = addon.glTF2ExportUserExtension
+    for name in timed_methods:
+        originals.append((extension_class, name, getattr(extension_class, name)))
+        setattr(extension_class, name, _wrap_timer(getattr(extension_class, name), name, timings))
+
+    for name in timed_functions:
+        originals.append((addon, name, getattr(addon, name)))
+        setattr(addon, name, _wrap_timer(getattr(addon, name), name, timings))
+
+    return originals
+
+def _remove_timers(originals):
+    for owner, name, original in reversed(originals): setattr(owner, name, original)
+
+def _export(scene, filepath):
+    addon._hull_validation_cache.clear()
+    addon._collider_bake_store.clear()
+
+    timings = {}
+    originals = _install_timers(timings)
+
+    try:
+        with bpy.context.temp_override(scene=scene):
+            start = time.perf_counter()
+            bpy.ops.export_scene.gltf(filepath=filepath, export_format='GLB', use_active_scene=True)
+            timings['export'] = {'calls': 1, 'seconds': time.perf_counter() - start}
+    finally:
+        _remove_timers(originals)
+
+    return timings
+
+def _get_medians(runs):
+    names = sorted(set(name for timings in runs for name in timings))
+
+    medians = {}
+    for name in names:
+        seconds = [timings[name]['seconds'] if name in timings else 0.0 for timings in runs]
+        calls = max(timings[name]['calls'] if name in timings else 0 for timings in runs)
+        medians[name] = {'calls': calls, 'seconds': statistics.median(seconds)}
+
+    return medians
+
+def _compare(results, baseline):
+    regressions = []
+
+    if baseline.get('scene') != results['scene']:
+        print('warning: the baseline was recorded on a different scene, timings may not be comparable')
+
+    for name, expected in baseline['functions'].items():
+        measured = results['functions'].get(name, None)
+        if measured is None: continue
+
+        threshold = baseline['thresholds'].get(name, 0.0)
+        limit = expected['seconds'] * (1.0 + threshold)
+
+        is_regression = measured['seconds'] > limit and measured['seconds'] - expected['seconds'] > noise_seconds
+        if is_regression: regressions.append(name)
+
+        print('{:<32} {:>10.2f} ms {:>10.2f} ms {:>8.2f}x {}'.format(
+            name, expected['seconds'] * 1000, measured['seconds'] * 1000,
+            measured['seconds'] / expected['seconds'] if expected['seconds'] > 0.0 else 1.0,
+            'REGRESSION' if is_regression else ''))
+
+    return regressions
+
+def main():
+    args = _parse_args()
+    rng = random.Random(args.seed)
+
+    batch_export._enable_addon()
+
+    scene = _create_scene(args, rng)
+
+    # the exporter reads the extension properties of the scene it exports
+    scene.OMIColliderExportExtensionProperties.enabled = True
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, 'benchmark.glb')
+            runs = [_export(scene, filepath) for _ in range(max(args.repeat, 1))]
+    finally:
+        _remove_scene(scene)
+
+    results = {
+        'version': baseline_version,
+        'blender': bpy.app.version_string,
+        'scene': {
+            'objects': args.objects,
+            'vertices': args.vertices,
+            'mix': _parse_mix(args.mix),
+            'display_ratio': args.display_ratio,
+            'offset_ratio': args.offset_ratio,
+            'seed': args.seed
+        },
+        'repeat': max(args.repeat, 1),
+        'functions': _get_medians(runs)
+    }
+
+    if args.save_baseline is not None:
+        baseline = dict(results, thresholds={name: args.threshold for name in results['functions']})
+        with open(args.save_baseline, 'w', encoding='utf-8') as f: json.dump(baseline, f, indent=2)
+
+    if args.output is not None:
+        with open(args.output, 'w', encoding='utf-8') as f: json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.baseline is not None:
+        with open(args.baseline, 'r', encoding='utf-8') as f: baseline = json.load(f)
+
+        if baseline.get('version') != baseline_version: raise SystemExit('unsupported baseline version')
+
+        regressions = _compare(results, baseline)
+        if len(regressions) > 0:
+            print('regressions: {}'.format(', '.join(regressions)))
+            sys.exit(1)
+
+main()
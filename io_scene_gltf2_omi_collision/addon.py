@@ -0,0 +1,1925 @@
+import os
+import time
+import fnmatch
+import types
+import json
+import array
+
+from contextlib import contextmanager
+
+import bpy
+from bpy.types import PropertyGroup, Scene, Panel, Operator, Object, PropertyGroup
+from bpy.props import BoolProperty, PointerProperty, FloatProperty, EnumProperty, StringProperty, IntProperty
+from bpy.props import FloatVectorProperty
+from bpy.utils import register_class, unregister_class
+from bpy.app.handlers import persistent
+
+from mathutils import Vector, Quaternion, Matrix
+
+from io_scene_gltf2.io.com.gltf2_io import Node, Mesh, MeshPrimitive, Accessor
+from io_scene_gltf2.io.com import gltf2_io_constants
+from io_scene_gltf2.io.exp import gltf2_io_binary_data
+
+from . import bl_info
+from .profiling import ExportProfiler
+from .baking import ColliderBakeStore
+from .prefetch import MeshSnapshot, prefetch_collider_results
+from .overlay import ColliderOverlay, get_shape_lines
+from .core import conversion, bounds, hull, primitives, quickhull, decomposition, fitting, meshopt, transforms, lod, spatial
+from .core.shapes import glTF_extension_name, primitive_collider_types, mesh_collider_types
+from .core.nodes import NodeGraph
+
+extension_is_required = False
+
+collider_types = [
+    ('box', 'Box', ''),
+    ('sphere', 'Sphere', ''),
+    ('capsule', 'Capsule', ''),
+    ('hull', 'Hull', ''),
+    ('mesh', 'Mesh', ''),
+    ('compound', 'Compound', '')
+]
+
+class OMIColliderProperties(PropertyGroup):
+    is_collider: BoolProperty(name='Is Collider')
+    is_display_mesh: BoolProperty(name='Is Display Mesh')
+    use_mesh_center: BoolProperty(name='Use Mesh Center', default=True)
+    use_offsets: BoolProperty(name='Use Offsets')
+    collider_type: EnumProperty(items=collider_types, name='Collider Type')
+    collider_is_trigger: BoolProperty(name='Is Trigger')
+    offset_location: FloatVectorProperty(name='Location', subtype='TRANSLATION')
+    offset_rotation: FloatVectorProperty(name='Rotation', subtype='EULER')
+    offset_scale: FloatVectorProperty(name='Scale', default=(1, 1, 1), subtype='XYZ')
+
+def _on_collider_baking_update(self, context):
+    _collider_bake_store.clear()
+    if self.use_collider_baking: _mark_all_colliders_dirty()
+
+class OMIColliderExportExtensionProperties(PropertyGroup):
+    enabled: BoolProperty(
+        name=bl_info['name'],
+        description='Include this extension in the exported glTF file.',
+        default=True
+    )
+    write_profile_report: BoolProperty(
+        name='Write Profile Report',
+        description='Write per-stage timings and counters as JSON next to the exported file.',
+        default=False
+    )
+    capture_cprofile: BoolProperty(
+        name='Capture cProfile',
+        description='Also capture a cProfile of the export and save it next to the exported file.',
+        default=False
+    )
+    use_collider_baking: BoolProperty(
+        name='Bake Colliders In Background',
+        description='Recompute shapes and hull checks of edited collider objects while working, so exports can reuse them.',
+        default=False,
+        update=_on_collider_baking_update
+    )
+    use_tight_fit: BoolProperty(
+        name='Tight Fit',
+        description='Fit oriented boxes, minimal spheres and capsules instead of axis aligned bounds, placed with their own center and rotation.',
+        default=False
+    )
+    generate_convex_hulls: BoolProperty(
+        name='Generate Convex Hulls',
+        description='Export the convex hull of the vertices for hull colliders that are not convex instead of failing.',
+        default=False
+    )
+    hull_max_vertices: IntProperty(
+        name='Max Hull Vertices',
+        description='Simplify generated and compound hulls, and valid hulls with more vertices, to at most this many vertices.',
+        default=64,
+        min=4,
+        max=1024
+    )
+    optimize_collision_meshes: BoolProperty(
+        name='Optimize Collision Meshes',
+        description='Write hull and mesh colliders as welded meshes with only positions and indices instead of the render mesh.',
+        default=False
+    )
+    weld_distance: FloatProperty(
+        name='Weld Distance',
+        description='Merge collision mesh vertices closer than this distance.',
+        default=0.0001,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+    max_collision_triangles: IntProperty(
+        name='Max Collision Triangles',
+        description='Decimate mesh colliders with more triangles than this, 0 keeps every triangle.',
+        default=0,
+        min=0
+    )
+    max_compound_hulls: IntProperty(
+        name='Max Compound Hulls',
+        description='Largest number of convex hulls a compound collider is split into.',
+        default=8,
+        min=1,
+        max=64
+    )
+    compound_concavity: FloatProperty(
+        name='Compound Concavity',
+        description='Stop splitting compound colliders once no part is more concave than this fraction of the mesh size.',
+        default=0.05,
+        min=0.0,
+        max=1.0
+    )
+    use_collider_lod: BoolProperty(
+        name='Substitute Primitives',
+        description='Export hull and mesh colliders as the cheapest box, sphere or capsule that covers them within the tolerance, and list the substitutions as JSON next to the exported file.',
+        default=False
+    )
+    lod_tolerance: FloatProperty(
+        name='Substitution Tolerance',
+        description='Largest fraction of a substituted primitive\'s volume that the mesh may leave empty.',
+        default=0.1,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR'
+    )
+    use_evaluated_geometry: BoolProperty(
+        name='Evaluated Geometry',
+        description='Measure colliders on the mesh with modifiers and shape keys applied, one object at a time.',
+        default=False
+    )
+    use_parallel_prefetch: BoolProperty(
+        name='Parallel Prefetch',
+        description='Compute bounds, hull checks and tight fit shapes of all colliders on a worker pool before the export.',
+        default=False
+    )
+    prefetch_workers: IntProperty(
+        name='Prefetch Workers',
+        description='Number of workers computing collider results, 0 uses every core.',
+        default=0,
+        min=0
+    )
+    use_prefetch_processes: BoolProperty(
+        name='Use Processes',
+        description='Run the prefetch workers as separate processes, which also parallelizes the work NumPy does not cover.',
+        default=False
+    )
+    check_collider_overlaps: BoolProperty(
+        name='Check Collider Overlaps',
+        description='Warn about colliders inside other colliders, heavily overlapping colliders and triggers that touch nothing.',
+        default=False
+    )
+
+class OMIColliderImportExtensionProperties(PropertyGroup):
+    enabled: BoolProperty(
+        name=bl_info['name'],
+        description='Run this extension while importing glTF file.',
+        default=True
+    )
+
+class GLTF_PT_OMIColliderExportExtensionPanel(Panel):
+
+    bl_space_type = 'FILE_BROWSER'
+    bl_region_type = 'TOOL_PROPS'
+    bl_label = "Enabled"
+    bl_parent_id = "GLTF_PT_export_user_extensions"
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    @classmethod
+    def poll(cls, context):
+        sfile = context.space_data
+        operator = sfile.active_operator
+        return operator.bl_idname == 'EXPORT_SCENE_OT_gltf'
+
+    def draw_header(self, context):
+        props = bpy.context.scene.OMIColliderExportExtensionProperties
+        self.layout.prop(props, 'enabled')
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+
+        props = bpy.context.scene.OMIColliderExportExtensionProperties
+        layout.active = props.enabled
+
+        box = layout.box()
+        box.label(text=glTF_extension_name)
+
+        box.prop(props, 'use_collider_baking')
+        box.prop(props, 'use_tight_fit')
+        box.prop(props, 'generate_convex_hulls')
+        box.prop(props, 'hull_max_vertices')
+        box.prop(props, 'max_compound_hulls')
+        box.prop(props, 'optimize_collision_meshes')
+        col = box.column()
+        col.prop(props, 'weld_distance')
+        col.prop(props, 'max_collision_triangles')
+        col.enabled = props.optimize_collision_meshes
+        box.prop(props, 'compound_concavity')
+        box.prop(props, 'use_collider_lod')
+        row = box.row()
+        row.prop(props, 'lod_tolerance')
+        row.enabled = props.use_collider_lod
+        box.prop(props, 'check_collider_overlaps')
+        box.prop(props, 'use_evaluated_geometry')
+        row = box.row()
+        row.prop(props, 'use_parallel_prefetch')
+        row.enabled = not props.use_evaluated_geometry
+        col = box.column()
+        col.prop(props, 'prefetch_workers')
+        col.prop(props, 'use_prefetch_processes')
+        col.enabled = props.use_parallel_prefetch and not props.use_evaluated_geometry
+
+        box.prop(props, 'write_profile_report')
+        row = box.row()
+        row.prop(props, 'capture_cprofile')
+        row.enabled = props.write_profile_report
+
+class GLTF_PT_OMIColliderImportExtensionPanel(Panel):
+
+    bl_space_type = 'FILE_BROWSER'
+    bl_region_type = 'TOOL_PROPS'
+    bl_label = "Enabled"
+    bl_parent_id = "GLTF_PT_import_user_extensions"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        sfile = context.space_data
+        operator = sfile.active_operator
+        return operator.bl_idname == "IMPORT_SCENE_OT_gltf"
+
+    def draw_header(self, context):
+        props = bpy.context.scene.OMIColliderImportExtensionProperties
+        self.layout.prop(props, 'enabled')
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+
+        props = bpy.context.scene.OMIColliderImportExtensionProperties
+        layout.active = props.enabled
+
+        box = layout.box()
+        box.label(text=glTF_extension_name)
+
+def _is_mesh_object_active(context):
+    objs = context.selected_objects
+    return True if len(objs) > 0 and context.active_object.type == 'MESH' else False
+
+def _read_hull_topology(mesh):
+    edge_count = len(mesh.edges)
+    loop_count = len(mesh.loops)
+    polygon_count = len(mesh.polygons)
+
+    topology = hull.HullTopology(
+        array.array('i', [0]) * (edge_count * 2),
+        array.array('i', [0]) * loop_count,
+        array.array('i', [0]) * loop_count,
+        array.array('i', [0]) * polygon_count,
+        array.array('i', [0]) * polygon_count,
+        array.array('f', [0.0]) * (polygon_count * 3),
+        array.array('f', [0.0]) * (polygon_count * 3)
+    )
+
+    mesh.edges.foreach_get('vertices', topology.edge_vertices)
+    mesh.loops.foreach_get('vertex_index', topology.loop_vertices)
+    mesh.loops.foreach_get('edge_index', topology.loop_edges)
+    mesh.polygons.foreach_get('loop_start', topology.polygon_loop_starts)
+    mesh.polygons.foreach_get('loop_total', topology.polygon_loop_totals)
+    mesh.polygons.foreach_get('normal', topology.polygon_normals)
+    mesh.polygons.foreach_get('center', topology.polygon_centers)
+
+    return topology
+
+_hull_validation_cache = hull.HullValidationCache()
+
+# tight fits placed by the overlay, keyed by geometry so moving an object does not fit it again
+_fitted_shape_cache = hull.HullValidationCache()
+
+_export_profiler = ExportProfiler()
+
+def _read_fingerprint_buffers(mesh):
+    edge_vertices = array.array('i', [0]) * (len(mesh.edges) * 2)
+    loop_vertices = array.array('i', [0]) * len(mesh.loops)
+    polygon_loop_starts = array.array('i', [0]) * len(mesh.polygons)
+
+    mesh.edges.foreach_get('vertices', edge_vertices)
+    mesh.loops.foreach_get('vertex_index', loop_vertices)
+    mesh.polygons.foreach_get('loop_start', polygon_loop_starts)
+
+    return edge_vertices, loop_vertices, polygon_loop_starts
+
+def _get_hull_fingerprint(mesh):
+    return hull.get_hull_fingerprint(_read_mesh_coordinates(mesh), *_read_fingerprint_buffers(mesh))
+
+def _get_precomputed_result(key, name):
+    # prefetched for the current export, or baked while editing
+    result = _collider_prefetch_store.get(key, name)
+    if result is not None:
+        _export_profiler.count('prefetched_results_used')
+        return result
+
+    result = _collider_bake_store.get(key, name)
+    if result is not None: _export_profiler.count('baked_results_used')
+
+    return result
+
+def _get_collider_mesh_key(mesh, mesh_keys):
+    # evaluated meshes are looked up by their object, see _use_evaluated_collider_mesh()
+    key = mesh.as_pointer()
+    return mesh_keys.get(key, key)
+
+@contextmanager
+def _use_evaluated_collider_mesh(blender_object, use_evaluated_geometry, mesh_keys):
+    mesh = blender_object.data
+
+    # without modifiers or shape keys the evaluated mesh is the mesh, which objects can share
+    is_modified = len(blender_object.modifiers) > 0 or mesh.shape_keys is not None
+    if not use_evaluated_geometry or not is_modified:
+        yield mesh
+        return
+
+    # one evaluated mesh at a time, freed before the next object is measured
+    evaluated_object = blender_object.evaluated_get(bpy.context.evaluated_depsgraph_get())
+
+    with _export_profiler.stage('evaluated_meshes'):
+        evaluated_mesh = evaluated_object.to_mesh()
+    _export_profiler.count('evaluated_meshes')
+
+    # the pointer of a freed mesh can be reused by the next one, results are cached per object
+    key = evaluated_mesh.as_pointer()
+    mesh_keys[key] = ('evaluated', blender_object.as_pointer())
+
+    try: yield evaluated_mesh
+    finally:
+        del mesh_keys[key]
+        evaluated_object.to_mesh_clear()
+
+def _validate_hull_mesh(mesh, key=None):
+    # key is the mesh's cache key, the pointer of an evaluated mesh may match a freed one with stored results
+    result = _get_precomputed_result(mesh.as_pointer() if key is None else key, 'hull_validation')
+    if result is not None: return result
+
+    fingerprint = _get_hull_fingerprint(mesh)
+
+    result = _hull_validation_cache.get(fingerprint)
+    if result is None:
+        with _export_profiler.stage('hull_validation'):
+            result = hull.validate_hull_topology(_read_hull_topology(mesh))
+        _hull_validation_cache.put(fingerprint, result)
+        _export_profiler.count('hulls_validated')
+    else:
+        _export_profiler.count('hull_cache_hits')
+
+    return result
+
+def _is_valid_hull_mesh(mesh, key=None):
+    return _validate_hull_mesh(mesh, key).is_valid
+
+def _read_mesh_coordinates(mesh):
+    # flat [x0, y0, z0, x1, ...] buffer filled by a single foreach_get() call
+    coords = array.array('f', [0.0]) * (len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', coords)
+    return coords
+
+def _convert_coordinates_to_y_up(coords):
+    return conversion.convert_coordinates_to_y_up(coords)
+
+def _has_uniform_scale(scale):
+    if scale is None: return True
+    return max(scale) - min(scale) <= 1e-6 * max(abs(v) for v in scale)
+
+def _fit_mesh_shape(mesh, collider_type, is_y_up=False, allow_rotation=True):
+    # fitted in the exported frame so the rotation can be composed with the node rotation
+    coords = _read_mesh_coordinates(mesh)
+    if is_y_up: coords = _convert_coordinates_to_y_up(coords)
+
+    return fitting.fit_shape(coords, collider_type, allow_rotation)
+
+def _get_cached_fitted_shape(mesh, collider_type, is_y_up=False, allow_rotation=True):
+    key = (_get_hull_fingerprint(mesh), collider_type, is_y_up, allow_rotation)
+
+    fitted_shape = _fitted_shape_cache.get(key)
+    if fitted_shape is None:
+        fitted_shape = _fit_mesh_shape(mesh, collider_type, is_y_up, allow_rotation)
+        _fitted_shape_cache.put(key, fitted_shape)
+
+    return fitted_shape
+
+def _choose_mesh_collider_lod(mesh, collider_type, tolerance, is_y_up=False, allow_rotation=True):
+    coords = _read_mesh_coordinates(mesh)
+    if is_y_up: coords = _convert_coordinates_to_y_up(coords)
+
+    # hulls are scored by their hull, meshes may be open or concave
+    triangles = _read_mesh_triangles(mesh) if collider_type == 'mesh' else None
+
+    # scaling a sphere or capsule unevenly makes it something else, boxes stay boxes
+    collider_types = lod.primitive_cost_order if allow_rotation else ['box']
+
+    return lod.choose_collider_lod(coords, triangles, tolerance, collider_types, allow_rotation)
+
+def _read_mesh_triangles(mesh):
+    mesh.calc_loop_triangles()
+    triangles = array.array('i', [0]) * (len(mesh.loop_triangles) * 3)
+    mesh.loop_triangles.foreach_get('vertices', triangles)
+    return triangles
+
+def _create_gltf_accessor(data, component_type, data_type, count, target, minimum=None, maximum=None):
+    # older exporters do not take a buffer view target
+    try: buffer_view = gltf2_io_binary_data.BinaryData(data, bufferViewTarget=target)
+    except TypeError: buffer_view = gltf2_io_binary_data.BinaryData(data)
+
+    return Accessor(
+        buffer_view=buffer_view,
+        byte_offset=None,
+        component_type=component_type,
+        count=count,
+        extensions=None,
+        extras=None,
+        max=maximum,
+        min=minimum,
+        name=None,
+        normalized=None,
+        sparse=None,
+        type=data_type
+    )
+
+def _create_gltf_mesh(name, coords, indices):
+    # accessors need bounds, there is nothing to write for a mesh without triangles
+    if len(coords) == 0 or len(indices) == 0: return None
+
+    vertex_count = len(coords) // 3
+    axes = [coords[axis::3] for axis in range(3)]
+
+    position = _create_gltf_accessor(
+        array.array('f', coords).tobytes(),
+        gltf2_io_constants.ComponentType.Float,
+        gltf2_io_constants.DataType.Vec3,
+        vertex_count,
+        gltf2_io_constants.BufferViewTarget.ARRAY_BUFFER,
+        [min(a) for a in axes],
+        [max(a) for a in axes]
+    )
+
+    indices = _create_gltf_accessor(
+        array.array('I', indices).tobytes(),
+        gltf2_io_constants.ComponentType.UnsignedInt,
+        gltf2_io_constants.DataType.Scalar,
+        len(indices),
+        gltf2_io_constants.BufferViewTarget.ELEMENT_ARRAY_BUFFER
+    )
+
+    primitive = MeshPrimitive(
+        attributes={'POSITION': position},
+        extensions=None,
+        extras=None,
+        indices=indices,
+        material=None,
+        mode=None,
+        targets=None
+    )
+
+    return Mesh(extensions=None, extras=None, name=name, primitives=[primitive], weights=None)
+
+def _convert_to_y_up_vector(blender_vector, is_scale=False):
+    vector = conversion.convert_to_y_up_vector(blender_vector, is_scale)
+
+    if type(blender_vector) is Vector: return Vector(vector)
+    else: return vector
+
+def _convert_to_y_up_location(blender_vector):
+    return _convert_to_y_up_vector(blender_vector)
+
+def _convert_to_y_up_scale(blender_vector):
+    return _convert_to_y_up_vector(blender_vector, is_scale=True)
+
+def _convert_to_y_up_rotation(blender_quaternion):
+    quat = conversion.convert_to_y_up_rotation(blender_quaternion)
+
+    if type(blender_quaternion) is Quaternion: return Quaternion(quat)
+    else: return quat
+    
+class GLTF_PT_OMIColliderObjectPropertiesPanel(Panel):
+
+    bl_label = 'glTF OMI_collider Properties'
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = 'object'
+    bl_options = {'DEFAULT_CLOSED'}
+    bl_order = 1001 # order the addon properties to last
+
+    @classmethod
+    def poll(cls, context):
+        return True if _is_mesh_object_active(context) else None
+
+    def draw(self, context):
+        active_obj = context.active_object
+        collider_props = active_obj.OMIColliderProperties
+        
+        layout = self.layout
+        layout.use_property_split = True
+
+        def _new_row(layout):
+            row = layout.row()
+            col = row.column()
+            return row, col
+
+        layout.prop(collider_props, 'is_collider')
+        is_collider_enabled = True if collider_props is not None and collider_props.is_collider else False
+
+        container_row, container_col = _new_row(layout)
+        container_row.enabled = is_collider_enabled
+        
+        row, col = _new_row(container_col)
+
+        col.label(text='Properties')
+        col.prop(collider_props, 'collider_type')
+        col.prop(collider_props, 'collider_is_trigger')
+            
+        row, col = _new_row(container_col)
+            
+        col.label(text='Export Settings')
+        col.prop(collider_props, 'is_display_mesh')
+        col.prop(collider_props, 'use_offsets')
+            
+        row, col = _new_row(container_col)
+            
+        col.prop(collider_props, 'use_mesh_center')
+        row.enabled = True if collider_props.collider_type in ['box', 'sphere', 'capsule'] else False
+
+        row, col = _new_row(container_col)
+                
+        col.label(text='Collider Offsets')
+        col.prop(collider_props, 'offset_location')
+        col.prop(collider_props, 'offset_rotation')
+        col.prop(collider_props, 'offset_scale')
+        row.enabled = collider_props.use_offsets
+
+        row, col = _new_row(layout)
+
+        col.label(text='Operators')
+        col.operator('gltf2_omi_collider_extension.copy_properties_from_active')
+        col.operator('gltf2_omi_collider_extension.apply_collider_preset')
+        col.operator(
+            'gltf2_omi_collider_extension.toggle_collider_overlay',
+            depress=_collider_overlay.is_enabled)
+        col.operator('gltf2_omi_collider_extension.analyze_collider_overlaps')
+        col.operator('gltf2_omi_collider_extension.check_if_hull_is_valid')
+        col.operator('gltf2_omi_collider_extension.select_invalid_hull_edges')
+
+        if collider_props.collider_type == 'hull':
+            validation = _collider_bake_store.get(active_obj.data.as_pointer(), 'hull_validation')
+
+            if validation is not None and validation.is_valid: col.label(text='Hull is valid.', icon='CHECKMARK')
+            elif validation is not None: col.label(text='Hull is invalid.', icon='ERROR')
+
+class GLTF_OT_OMIColliderSelectInvalidHullEdgesOperator(Operator):
+
+    bl_idname = 'gltf2_omi_collider_extension.select_invalid_hull_edges'
+    bl_label = 'Select Invalid Hull Edges'
+    bl_description = 'Select edges that do not pass convextiy, manifold and contiguous tests.'
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        if not _is_mesh_object_active(context): return False
+        
+        collider_props = context.active_object.OMIColliderProperties
+        
+        if collider_props is None: return False
+        if not collider_props.is_collider: return False
+        if collider_props.collider_type != 'hull': return False
+        
+        return True
+
+    def execute(self, context):
+        mesh = context.active_object.data
+
+        invalid_edges = _validate_hull_mesh(mesh).invalid_edges
+
+        def _deslect_all():
+            mesh.vertices.foreach_set('select', [False] * len(mesh.vertices))
+            mesh.edges.foreach_set('select', [False] * len(mesh.edges))
+            mesh.polygons.foreach_set('select', [False] * len(mesh.polygons))
+
+        def _select_invalid_edges():
+            edge_selection = [False] * len(mesh.edges)
+            for idx in invalid_edges: edge_selection[idx] = True
+            mesh.edges.foreach_set('select', edge_selection)
+
+        _deslect_all()
+        _select_invalid_edges()
+        
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        return self.execute(context)
+
+class GLTF_OT_OMIColliderCheckIfHullIsValidOperator(Operator):
+
+    bl_idname = 'gltf2_omi_collider_extension.check_if_hull_is_valid'
+    bl_label = 'Check If Hull Is Valid'
+    bl_description = 'Test if hull passes convextiy, manifold and contiguous tests.'
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        if not _is_mesh_object_active(context): return False
+
+        collider_props = context.active_object.OMIColliderProperties
+        
+        if collider_props is None: return False
+        if not collider_props.is_collider: return False
+        if collider_props.collider_type != 'hull': return False
+        
+        return True
+
+    def execute(self, context):
+        mesh = context.active_object.data
+
+        if not _is_valid_hull_mesh(mesh):
+            self.report({'WARNING'}, 'Hull is invalid and will not export as collider.')
+        else:
+            self.report({'INFO'}, 'Hull is valid.')
+
+        return {'CANCELLED'}
+    
+    def invoke(self, context, event):
+        return self.execute(context)
+
+collider_preset_properties = [
+    'is_collider',
+    'is_display_mesh',
+    'use_mesh_center',
+    'use_offsets',
+    'collider_type',
+    'collider_is_trigger',
+    'offset_location',
+    'offset_rotation',
+    'offset_scale'
+]
+
+collider_vector_properties = ['offset_location', 'offset_rotation', 'offset_scale']
+
+def get_collider_preset(collider_props):
+    preset = {}
+
+    for name in collider_preset_properties:
+        value = getattr(collider_props, name)
+        preset[name] = tuple(value) if name in collider_vector_properties else value
+
+    return preset
+
+def filter_collider_objects(objects, name_pattern=None, collection=None, min_vertices=0, max_vertices=0):
+    if collection is not None: collection_objects = set(o.as_pointer() for o in collection.all_objects)
+
+    for obj in objects:
+        if obj.type != 'MESH': continue
+        if name_pattern and not fnmatch.fnmatchcase(obj.name, name_pattern): continue
+        if collection is not None and obj.as_pointer() not in collection_objects: continue
+
+        if min_vertices > 0 or max_vertices > 0:
+            vertex_count = len(obj.data.vertices)
+            if vertex_count < min_vertices: continue
+            if max_vertices > 0 and vertex_count > max_vertices: continue
+
+        yield obj
+
+def apply_collider_preset(objects, preset):
+    # the preset is resolved once, then unchanged values are skipped so that
+    # only objects that actually change are tagged for depsgraph updates
+    items = [
+        (name, tuple(value) if name in collider_vector_properties else value)
+        for name, value in preset.items() if name in collider_preset_properties]
+
+    vector_items = [(name, value) for name, value in items if name in collider_vector_properties]
+    value_items = [(name, value) for name, value in items if name not in collider_vector_properties]
+
+    changed_count = 0
+    for obj in objects:
+        props = obj.OMIColliderProperties
+        is_changed = False
+
+        for name, value in value_items:
+            if getattr(props, name) != value:
+                setattr(props, name, value)
+                is_changed = True
+
+        for name, value in vector_items:
+            if tuple(getattr(props, name)) != value:
+                setattr(props, name, value)
+                is_changed = True
+
+        if is_changed: changed_count += 1
+
+    return changed_count
+
+class GLTF_OT_OMIColliderCopyPropertiesFromActiveOperator(Operator):
+
+    bl_idname = 'gltf2_omi_collider_extension.copy_properties_from_active'
+    bl_label = 'Copy Properties from Active'
+    bl_description = 'Copy the collider properties from the active object to selected objects.'
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        if not _is_mesh_object_active(context): return False
+        return True
+
+    def execute(self, context):
+        active_obj = context.active_object
+        preset = get_collider_preset(active_obj.OMIColliderProperties)
+
+        apply_collider_preset((o for o in context.selected_objects if o != active_obj), preset)
+    
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        return self.execute(context)
+
+class GLTF_OT_OMIColliderApplyPresetOperator(Operator):
+
+    bl_idname = 'gltf2_omi_collider_extension.apply_collider_preset'
+    bl_label = 'Apply Collider Preset'
+    bl_description = 'Set the collider properties of many objects at once, filtered by name, collection or mesh size.'
+    bl_options = {'REGISTER', 'UNDO'}
+
+    scope: EnumProperty(
+        name='Objects',
+        items=[
+            ('SELECTED', 'Selected', 'Selected objects'),
+            ('SCENE', 'Scene', 'All objects in the scene')
+        ],
+        default='SELECTED'
+    )
+    name_pattern: StringProperty(name='Name Pattern', description='Only objects whose name matches this pattern, like Wall_*.')
+    collection_name: StringProperty(name='Collection', description='Only objects in this collection or its children.')
+    min_vertices: IntProperty(name='Min Vertices', default=0, min=0)
+    max_vertices: IntProperty(name='Max Vertices', description='0 for no limit.', default=0, min=0)
+
+    is_collider: BoolProperty(name='Is Collider', default=True)
+    collider_type: EnumProperty(items=collider_types, name='Collider Type')
+    collider_is_trigger: BoolProperty(name='Is Trigger')
+    is_display_mesh: BoolProperty(name='Is Display Mesh')
+    use_mesh_center: BoolProperty(name='Use Mesh Center', default=True)
+    use_offsets: BoolProperty(name='Use Offsets')
+    offset_location: FloatVectorProperty(name='Location', subtype='TRANSLATION')
+    offset_rotation: FloatVectorProperty(name='Rotation', subtype='EULER')
+    offset_scale: FloatVectorProperty(name='Scale', default=(1, 1, 1), subtype='XYZ')
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+
+        col = layout.column()
+        col.label(text='Filter')
+        col.prop(self, 'scope')
+        col.prop(self, 'name_pattern')
+        col.prop_search(self, 'collection_name', bpy.data, 'collections')
+        col.prop(self, 'min_vertices')
+        col.prop(self, 'max_vertices')
+
+        col = layout.column()
+        col.label(text='Preset')
+        for name in collider_preset_properties:
+            col.prop(self, name)
+
+    def execute(self, context):
+        collection = None
+        if self.collection_name:
+            collection = bpy.data.collections.get(self.collection_name, None)
+            if collection is None:
+                self.report({'WARNING'}, 'No collection named {}.'.format(self.collection_name))
+                return {'CANCELLED'}
+
+        objects = context.selected_objects if self.scope == 'SELECTED' else context.scene.objects
+
+        matched_objects = list(filter_collider_objects(
+            objects, self.name_pattern, collection, self.min_vertices, self.max_vertices))
+
+        preset = {name: getattr(self, name) for name in collider_preset_properties}
+        changed_count = apply_collider_preset(matched_objects, preset)
+
+        self.report({'INFO'}, 'Updated {} of {} matching objects.'.format(changed_count, len(matched_objects)))
+
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+class glTF2ExportUserExtension:
+
+    def __init__(self):
+        from io_scene_gltf2.io.com.gltf2_io_extensions import Extension
+        self.extension = Extension
+        self.properties = bpy.context.scene.OMIColliderExportExtensionProperties
+
+        # per-export caches, the exporter creates a new instance for every export
+        self._mesh_bounds_cache = {}
+        self._mesh_geometry_cache = {}
+        self._generated_hull_meshes = {}
+        self._compound_hull_meshes = {}
+        self._fitted_shapes = {}
+        self._collision_meshes = {}
+        self._mesh_fingerprints = {}
+        self._shared_collider_meshes = {}
+        self._collider_lods = {}
+
+        # evaluated meshes measured right now, keyed by pointer, and the object keys caching them
+        self._mesh_keys = {}
+
+        self.geometry_cache_hits = 0
+        self.geometry_cache_misses = 0
+
+    def _get_mesh_key(self, mesh): return _get_collider_mesh_key(mesh, self._mesh_keys)
+
+    def _use_collider_mesh(self, blender_object):
+        return _use_evaluated_collider_mesh(blender_object, self.properties.use_evaluated_geometry, self._mesh_keys)
+
+    def _get_mesh_bounds(self, mesh):
+        key = self._get_mesh_key(mesh)
+
+        mesh_bounds = self._mesh_bounds_cache.get(key, None)
+        if mesh_bounds is not None: return mesh_bounds
+
+        mesh_bounds = _get_precomputed_result(key, 'bounds')
+        if mesh_bounds is None:
+            with _export_profiler.stage('vertex_bounds'):
+                mesh_bounds = bounds.get_coordinate_bounds(_read_mesh_coordinates(mesh))
+            _export_profiler.count('vertices_scanned', len(mesh.vertices))
+
+        self._mesh_bounds_cache[key] = mesh_bounds
+
+        return mesh_bounds
+
+    def _get_axis_min_and_max(self, mesh, is_y_up=False):
+        mesh_bounds = self._get_mesh_bounds(mesh)
+        return bounds.convert_bounds_to_y_up(mesh_bounds) if is_y_up else mesh_bounds
+
+    def _get_mesh_geometry(self, mesh, is_y_up=False):
+        key = (self._get_mesh_key(mesh), is_y_up)
+
+        geometry = self._mesh_geometry_cache.get(key, None)
+        if geometry is not None:
+            self.geometry_cache_hits += 1
+            _export_profiler.count('geometry_cache_hits')
+            return geometry
+
+        self.geometry_cache_misses += 1
+        _export_profiler.count('geometry_cache_misses')
+
+        geometry = bounds.get_geometry_from_axes(self._get_axis_min_and_max(mesh, is_y_up))
+        self._mesh_geometry_cache[key] = geometry
+
+        return geometry
+        
+    def _get_half_extents_for_mesh(self, mesh, is_y_up=False):
+        return self._get_mesh_geometry(mesh, is_y_up).extents
+
+    def _get_radius_for_mesh(self, mesh, is_y_up=False):
+        return self._get_mesh_geometry(mesh, is_y_up).radius
+
+    def _get_height_for_mesh(self, mesh, is_y_up=False):
+        return self._get_mesh_geometry(mesh, is_y_up).height
+
+    def _get_fitted_shape(self, mesh, collider_type, is_y_up=False, allow_rotation=True):
+        key = (self._get_mesh_key(mesh), collider_type, is_y_up, allow_rotation)
+
+        fitted_shape = self._fitted_shapes.get(key, None)
+        if fitted_shape is not None: return fitted_shape
+
+        fitted_shape = _get_precomputed_result(key[0], ('fitted_shape',) + key[1:])
+        if fitted_shape is None: fitted_shape = _fit_mesh_shape(mesh, collider_type, is_y_up, allow_rotation)
+
+        self._fitted_shapes[key] = fitted_shape
+
+        return fitted_shape
+
+    def _get_collider_lod(self, mesh, collider_type, is_y_up=False, allow_rotation=True):
+        tolerance = self.properties.lod_tolerance
+        key = (self._get_mesh_key(mesh), collider_type, is_y_up, allow_rotation, tolerance)
+
+        if key in self._collider_lods: return self._collider_lods[key]
+
+        with _export_profiler.stage('collider_lod'):
+            collider_lod = _choose_mesh_collider_lod(mesh, collider_type, tolerance, is_y_up, allow_rotation)
+
+        self._collider_lods[key] = collider_lod
+
+        return collider_lod
+
+    def _is_valid_hull(self, mesh): return _is_valid_hull_mesh(mesh, self._get_mesh_key(mesh))
+
+    def _get_generated_hull_mesh(self, mesh, is_y_up=False):
+        max_vertices = self.properties.hull_max_vertices
+        key = (self._get_mesh_fingerprint(mesh), is_y_up, max_vertices)
+
+        # the exporter writes a glTF mesh object once no matter how many nodes use it
+        gltf_mesh = self._generated_hull_meshes.get(key, None)
+        if gltf_mesh is not None: return gltf_mesh
+
+        with _export_profiler.stage('hull_generation'):
+            coords, indices = quickhull.compute_convex_hull(_read_mesh_coordinates(mesh), max_vertices)
+            gltf_mesh = self._create_hull_mesh('{}_Hull'.format(mesh.name), coords, indices, is_y_up)
+
+        self._generated_hull_meshes[key] = gltf_mesh
+        _export_profiler.count('hulls_generated')
+
+        return gltf_mesh
+
+    def _create_hull_mesh(self, name, coords, indices, is_y_up=False):
+        if is_y_up: coords = _convert_coordinates_to_y_up(coords)
+        return _create_gltf_mesh(name, coords, indices)
+
+    def _get_mesh_fingerprint(self, mesh):
+        # content hash of the geometry, identical meshes in different datablocks share it
+        key = self._get_mesh_key(mesh)
+
+        fingerprint = self._mesh_fingerprints.get(key, None)
+        if fingerprint is not None: return fingerprint
+
+        fingerprint = _get_precomputed_result(key, 'fingerprint')
+        if fingerprint is None:
+            with _export_profiler.stage('mesh_fingerprints'):
+                fingerprint = _get_hull_fingerprint(mesh)
+
+        self._mesh_fingerprints[key] = fingerprint
+
+        return fingerprint
+
+    def _get_shared_collider_mesh(self, blender_object, mesh, gltf_mesh, export_settings):
+        if gltf_mesh is None: return None
+
+        # the fingerprint only stands for the written mesh when both come from the same geometry, objects
+        # sharing data can have different modifiers and the exporter applies them when asked to
+        is_applied = export_settings.get('gltf_apply', False) and len(blender_object.modifiers) > 0
+        is_evaluated = mesh is not blender_object.data
+        if is_applied != is_evaluated: return gltf_mesh
+
+        # the first glTF mesh seen with this geometry is written for every collider using it
+        key = self._get_mesh_fingerprint(mesh)
+
+        shared_mesh = self._shared_collider_meshes.setdefault(key, gltf_mesh)
+        if shared_mesh is not gltf_mesh: _export_profiler.count('collider_meshes_deduplicated')
+
+        return shared_mesh
+
+    def _get_collision_mesh(self, mesh, is_y_up=False, use_decimation=True):
+        props = self.properties
+        max_triangles = props.max_collision_triangles if use_decimation else 0
+        key = (self._get_mesh_fingerprint(mesh), is_y_up, props.weld_distance, max_triangles)
+
+        # shared by every collider node with the same geometry
+        gltf_mesh = self._collision_meshes.get(key, None)
+        if gltf_mesh is not None: return gltf_mesh
+
+        with _export_profiler.stage('collision_mesh_optimization'):
+            coords, indices = meshopt.optimize_collision_mesh(
+                _read_mesh_coordinates(mesh), _read_mesh_triangles(mesh), props.weld_distance, max_triangles)
+
+            if is_y_up: coords = _convert_coordinates_to_y_up(coords)
+            gltf_mesh = _create_gltf_mesh('{}_Collision'.format(mesh.name), coords, indices)
+
+        self._collision_meshes[key] = gltf_mesh
+        _export_profiler.count('collision_meshes_optimized')
+
+        return gltf_mesh
+
+    def _get_compound_hull_meshes(self, mesh, is_y_up=False):
+        props = self.properties
+        key = (self._get_mesh_fingerprint(mesh), is_y_up, props.max_compound_hulls, props.compound_concavity, props.hull_max_vertices)
+
+        gltf_meshes = self._compound_hull_meshes.get(key, None)
+        if gltf_meshes is not None: return gltf_meshes
+
+        with _export_profiler.stage('convex_decomposition'):
+            hulls = decomposition.decompose_convex(
+                _read_mesh_coordinates(mesh),
+                _read_mesh_triangles(mesh),
+                props.max_compound_hulls,
+                props.compound_concavity,
+                props.hull_max_vertices
+            )
+
+            gltf_meshes = [
+                self._create_hull_mesh('{}_Hull{}'.format(mesh.name, i), coords, indices, is_y_up)
+                for i, (coords, indices) in enumerate(hulls)]
+
+        self._compound_hull_meshes[key] = gltf_meshes
+        _export_profiler.count('compound_hulls_generated', len(gltf_meshes))
+
+        return gltf_meshes
+
+    def _add_compound_hull_nodes(self, gltf2_object, blender_object, mesh, is_y_up=False):
+        try: gltf_meshes = self._get_compound_hull_meshes(mesh, is_y_up)
+        except quickhull.HullError as e:
+            raise Exception('Could not decompose mesh into convex hulls : {} ({})'.format(blender_object.name, e))
+
+        if gltf2_object.children is None: gltf2_object.children = []
+
+        for i, gltf_mesh in enumerate(gltf_meshes):
+            hull_node = Node(
+                None, [], {}, None, None, None, '{}_Hull{}'.format(gltf2_object.name, i), None, None,
+                None, None, None)
+
+            hull_node.extensions[glTF_extension_name] = self.extension(
+                name=glTF_extension_name,
+                extension={'type': 'hull'},
+                required=extension_is_required
+            )
+
+            # picked up by _move_collider_meshes_to_extensions() like any other hull
+            setattr(hull_node, '_collider_mesh', gltf_mesh)
+            setattr(hull_node, '_display_mesh', None)
+            setattr(hull_node, '_collider_type', 'hull')
+
+            gltf2_object.children.append(hull_node)
+
+    def _collect_extension_data(self, gltf2_object, blender_object, export_settings):
+        with self._use_collider_mesh(blender_object) as mesh:
+            return self._collect_mesh_extension_data(gltf2_object, blender_object, mesh, export_settings)
+
+    def _collect_mesh_extension_data(self, gltf2_object, blender_object, mesh, export_settings):
+        extension_data = {}
+
+        is_y_up = export_settings.get('gltf_yup', False)
+        
+        collider_props = blender_object.OMIColliderProperties
+        collider_type = collider_props.collider_type
+
+        collider_lod = None
+        if self.properties.use_collider_lod and collider_type in mesh_collider_types and len(mesh.vertices) > 0:
+            allow_rotation = _has_uniform_scale(gltf2_object.scale)
+            collider_lod = self._get_collider_lod(mesh, collider_type, is_y_up, allow_rotation)
+
+            if collider_lod is not None:
+                _collider_substitutions.append({
+                    'object': blender_object.name,
+                    'mesh': mesh.name,
+                    'from': collider_type,
+                    'to': collider_lod.collider_type,
+                    'error': collider_lod.error
+                })
+                _export_profiler.count('colliders_substituted')
+
+                collider_type = collider_lod.collider_type
+
+        extension_data['type'] = collider_type
+        if collider_props.collider_is_trigger: extension_data['isTrigger'] = True
+
+        # saved for use later in gather_gltf_extensions_hook(), the exporter writes every mesh it
+        # finds on a node, so only mesh colliders keep a reference to the render mesh
+        collider_mesh = gltf2_object.mesh if collider_type in mesh_collider_types else None
+        setattr(gltf2_object, '_collider_mesh', collider_mesh)
+        setattr(gltf2_object, '_display_mesh', gltf2_object.mesh if collider_props.is_display_mesh else None)
+        setattr(gltf2_object, '_collider_type', collider_type)
+            
+        if collider_type in primitive_collider_types:
+            gltf2_object.mesh = None
+
+            with _export_profiler.stage('shape_fitting'):
+                fitted_shape = None
+
+                # substituted primitives are always placed by their fit, the mesh bounds would not cover it
+                if collider_lod is not None:
+                    fitted_shape = collider_lod.fitted_shape
+                elif self.properties.use_tight_fit and len(mesh.vertices) > 0:
+                    # non-uniform scale would shear a rotated shape, those keep to the mesh axes
+                    allow_rotation = _has_uniform_scale(gltf2_object.scale)
+                    fitted_shape = self._get_fitted_shape(mesh, collider_type, is_y_up, allow_rotation)
+
+                if fitted_shape is not None:
+                    geometry = fitted_shape.geometry
+                    if collider_type == 'box':
+                        extension_data['extents'] = list(geometry.extents)
+                    elif collider_type == 'sphere':
+                        extension_data['radius'] = geometry.radius
+                    elif collider_type == 'capsule':
+                        extension_data['radius'] = geometry.radius
+                        extension_data['height'] = geometry.height
+
+                    setattr(gltf2_object, '_fit_center', list(fitted_shape.center))
+                    setattr(gltf2_object, '_fit_rotation', list(fitted_shape.rotation))
+                else:
+                    if collider_type == 'box':
+                        extension_data['extents'] = self._get_half_extents_for_mesh(mesh, is_y_up)
+                    elif collider_type == 'sphere':
+                        extension_data['radius'] = self._get_radius_for_mesh(mesh, is_y_up)
+                    elif collider_type == 'capsule':
+                        extension_data['radius'] = self._get_radius_for_mesh(mesh, is_y_up)
+                        extension_data['height'] = self._get_height_for_mesh(mesh, is_y_up)
+
+                    # the mesh may be an evaluated one that is freed before the node transforms are corrected
+                    if collider_props.use_mesh_center: setattr(gltf2_object, '_mesh_center', self._get_mesh_geometry(mesh).center)
+        elif collider_type == 'hull':
+            is_valid_hull = self._is_valid_hull(mesh)
+
+            if self.properties.generate_convex_hulls:
+                if not is_valid_hull or len(mesh.vertices) > self.properties.hull_max_vertices:
+                    try: gltf2_object._collider_mesh = self._get_generated_hull_mesh(mesh, is_y_up)
+                    except quickhull.HullError as e:
+                        raise Exception('Could not generate a convex hull : {} ({})'.format(blender_object.name, e))
+            elif is_valid_hull is not True:
+                raise Exception('Mesh is not a convex hull : {}'.format(blender_object.name))
+
+            # generated hulls are already positions only, decimating a hull could make it concave
+            if gltf2_object._collider_mesh is gltf2_object.mesh:
+                if self.properties.optimize_collision_meshes:
+                    gltf2_object._collider_mesh = self._get_collision_mesh(mesh, is_y_up, use_decimation=False)
+                else:
+                    gltf2_object._collider_mesh = self._get_shared_collider_mesh(blender_object, mesh, gltf2_object.mesh, export_settings)
+        elif collider_type == 'mesh':
+            if self.properties.optimize_collision_meshes:
+                gltf2_object._collider_mesh = self._get_collision_mesh(mesh, is_y_up)
+            else:
+                gltf2_object._collider_mesh = self._get_shared_collider_mesh(blender_object, mesh, gltf2_object.mesh, export_settings)
+        elif collider_type == 'compound':
+            gltf2_object.mesh = None
+            self._add_compound_hull_nodes(gltf2_object, blender_object, mesh, is_y_up)
+
+        # the render mesh is only written for display meshes, colliders use _collider_mesh
+        if collider_type in mesh_collider_types: gltf2_object.mesh = None
+        
+        return extension_data
+        
+    def gather_node_hook(self, gltf2_object, blender_object, export_settings):
+        if self.properties.enabled:
+            with _export_profiler.stage('gather_node_hook'):
+                self._gather_collider_node(gltf2_object, blender_object, export_settings)
+
+    def _gather_collider_node(self, gltf2_object, blender_object, export_settings):
+        collider_props = blender_object.OMIColliderProperties
+        
+        if not collider_props.is_collider: return
+
+        _export_profiler.count('collider_nodes')
+
+        if gltf2_object.extensions is None: gltf2_object.extensions = {}
+        
+        extension_data = self._collect_extension_data(gltf2_object, blender_object, export_settings)
+        
+        gltf2_object.extensions[glTF_extension_name] = self.extension(
+            name=glTF_extension_name,
+            extension=extension_data,
+            required=extension_is_required
+        )
+
+        # saved for use later in gather_gltf_extensions_hook()
+        setattr(gltf2_object, '_blender_object', blender_object)
+        if collider_props.is_display_mesh: setattr(gltf2_object, 'is_display_mesh', True)
+        if collider_props.use_offsets: setattr(gltf2_object, 'use_offsets', True)
+
+    def _add_display_mesh_node(self, glTF, node, node_graph):
+        camera = None
+        children = []
+        extensions = {}
+        extras = None
+        matrix = []
+        mesh = node._display_mesh
+        name = '{}_DisplayMesh'.format(node.name)
+        rotation = node.rotation
+        scale = node.scale
+        skin = None
+        translation = node.translation
+        weights = None
+
+        node.rotation = None
+        node.scale = None
+        node.translation = None
+        
+        display_mesh_node = Node(
+            camera, children, extensions, extras, matrix, mesh, name, rotation, scale,
+            skin, translation, weights)
+
+        node_graph.insert_parent(node, display_mesh_node)
+
+        _export_profiler.count('display_nodes_added')
+
+    def _move_collider_meshes_to_extensions(self, glTF):
+        # by now the exporter has replaced mesh objects with indices, so every
+        # collider node is rewritten in a single pass before serialization
+        for node in glTF.nodes:
+            collider_type = getattr(node, '_collider_type', None)
+            if collider_type is None: continue
+
+            if collider_type in mesh_collider_types:
+                extension = node.extensions[glTF_extension_name]
+                extension_data = extension.extension if isinstance(extension, self.extension) else extension
+
+                extension_data['mesh'] = node._collider_mesh if node._collider_mesh is not None else node.mesh
+
+            node.mesh = None
+
+    def _apply_collider_transforms(self, nodes, is_y_up=False):
+        # mesh centers, fitted shapes and offsets of every collider node in one batched pass
+        corrected_nodes = []
+        mesh_centers = []
+        fit_centers = []
+        fit_rotations = []
+        offset_nodes = []
+
+        for node in nodes:
+            # only primitives without a fit are centered, hull vertices are written as they are
+            # and compound hulls are placed by their own nodes
+            is_fitted = hasattr(node, '_fit_center')
+            is_centered = hasattr(node, '_mesh_center')
+            has_offsets = getattr(node, 'use_offsets', False)
+
+            if not (is_fitted or is_centered or has_offsets): continue
+
+            corrected_nodes.append(node)
+            offset_nodes.append(node if has_offsets else None)
+
+            mesh_centers.append(node._mesh_center if is_centered else (0.0, 0.0, 0.0))
+            fit_centers.append(node._fit_center if is_fitted else (0.0, 0.0, 0.0))
+            fit_rotations.append(node._fit_rotation if is_fitted else (1.0, 0.0, 0.0, 0.0))
+
+        if len(corrected_nodes) == 0: return
+
+        offset_translations = []
+        offset_rotations = []
+        offset_scales = []
+
+        for node in offset_nodes:
+            if node is None:
+                offset_translations.append((0.0, 0.0, 0.0))
+                offset_rotations.append((1.0, 0.0, 0.0, 0.0))
+                offset_scales.append((1.0, 1.0, 1.0))
+            else:
+                collider_props = node._blender_object.OMIColliderProperties
+                offset_translations.append(tuple(collider_props.offset_location))
+                offset_rotations.append(transforms.euler_to_quaternion(collider_props.offset_rotation))
+                offset_scales.append(tuple(collider_props.offset_scale))
+
+        # fitted shapes are already in the exported frame
+        if is_y_up:
+            mesh_centers = conversion.convert_to_y_up_locations(mesh_centers)
+            offset_translations = conversion.convert_to_y_up_locations(offset_translations)
+            offset_rotations = conversion.convert_to_y_up_rotations(offset_rotations)
+            offset_scales = conversion.convert_to_y_up_scales(offset_scales)
+
+        translations, rotations, scales = transforms.apply_collider_corrections(
+            [n.translation if n.translation is not None else (0.0, 0.0, 0.0) for n in corrected_nodes],
+            [transforms.from_gltf_rotation(n.rotation) for n in corrected_nodes],
+            [n.scale if n.scale is not None else (1.0, 1.0, 1.0) for n in corrected_nodes],
+            mesh_centers, fit_centers, fit_rotations, offset_translations, offset_rotations, offset_scales)
+
+        for i, node in enumerate(corrected_nodes):
+            node.translation = [float(v) for v in translations[i]]
+
+            # mesh centers only move the node, the other corrections also write rotation and scale
+            if hasattr(node, '_fit_center') or offset_nodes[i] is not None:
+                node.rotation = [float(v) for v in transforms.to_gltf_rotation(rotations[i])]
+            if offset_nodes[i] is not None: node.scale = [float(v) for v in scales[i]]
+
+    def gather_gltf_extensions_hook(self, glTF, export_settings):
+        with _export_profiler.stage('gather_gltf_extensions_hook'):
+            self._process_collider_nodes(glTF, export_settings)
+
+    def _process_collider_nodes(self, glTF, export_settings):
+        is_y_up = export_settings.get('gltf_yup', False)
+
+        self._move_collider_meshes_to_extensions(glTF)
+
+        node_graph = NodeGraph(glTF)
+        
+        collider_nodes = [node for node in glTF.nodes if hasattr(node, '_collider_type')]
+
+        for node in collider_nodes:
+            if getattr(node, 'is_display_mesh', False): self._add_display_mesh_node(glTF, node, node_graph)
+
+        with _export_profiler.stage('collider_transforms'):
+            self._apply_collider_transforms(collider_nodes, is_y_up)
+
+def _create_mesh_from_geometry(name, coords, faces):
+    loop_starts = []
+    loop_totals = []
+    loop_vertices = []
+
+    for face in faces:
+        loop_starts.append(len(loop_vertices))
+        loop_totals.append(len(face))
+        loop_vertices.extend(face)
+
+    mesh = bpy.data.meshes.new(name)
+
+    mesh.vertices.add(len(coords) // 3)
+    mesh.vertices.foreach_set('co', coords)
+
+    mesh.loops.add(len(loop_vertices))
+    mesh.loops.foreach_set('vertex_index', loop_vertices)
+
+    mesh.polygons.add(len(faces))
+    mesh.polygons.foreach_set('loop_start', loop_starts)
+    if bpy.app.version < (4, 0, 0): mesh.polygons.foreach_set('loop_total', loop_totals)
+
+    mesh.update(calc_edges=True)
+
+    return mesh
+
+class glTF2ImportUserExtension:
+
+    def __init__(self):
+        self.properties = bpy.context.scene.OMIColliderImportExtensionProperties
+        self.extensions = [
+            # Extension(name="TEST_extension1", extension={}, required=True),
+            # Extension(name="TEST_extension2", extension={}, required=False)
+        ]
+
+        # shared meshes for the duration of an import, keyed by shape parameters or glTF mesh index
+        self._primitive_meshes = {}
+        self._collider_meshes = {}
+
+    def _get_extension_data(self, gltf_node):
+        if gltf_node is None or gltf_node.extensions is None: return None
+
+        extension_data = gltf_node.extensions.get(glTF_extension_name, None)
+        if type(extension_data) is not dict: return None
+
+        return extension_data
+
+    def _get_primitive_mesh(self, collider_type, extension_data):
+        if collider_type == 'box':
+            extents = [abs(v) for v in extension_data.get('extents', [0.5, 0.5, 0.5])]
+            parameters = tuple(round(v, 6) for v in extents)
+        elif collider_type == 'sphere':
+            parameters = (round(extension_data.get('radius', 0.5), 6),)
+        elif collider_type == 'capsule':
+            parameters = (round(extension_data.get('radius', 0.5), 6), round(extension_data.get('height', 2.0), 6))
+        else:
+            return None
+
+        key = (collider_type, parameters)
+
+        mesh = self._primitive_meshes.get(key, None)
+        if mesh is not None: return mesh
+
+        if collider_type == 'box': coords, faces = primitives.get_box_geometry(parameters)
+        elif collider_type == 'sphere': coords, faces = primitives.get_sphere_geometry(*parameters)
+        else: coords, faces = primitives.get_capsule_geometry(*parameters)
+
+        # shapes are built in glTF space, which is y-up with the capsule along z as written by the exporter
+        coords = [c for i in range(0, len(coords), 3) for c in conversion.convert_from_y_up_location(coords[i:i + 3])]
+
+        mesh = _create_mesh_from_geometry('{}_{}'.format(glTF_extension_name, collider_type.capitalize()), coords, faces)
+        self._primitive_meshes[key] = mesh
+
+        return mesh
+
+    def _get_collider_mesh(self, mesh_index, import_settings):
+        if mesh_index in self._collider_meshes: return self._collider_meshes[mesh_index]
+
+        # newer versions of the importer pass the glTF importer object instead of the settings
+        gltf = import_settings if hasattr(import_settings, 'data') else None
+
+        mesh = None
+        if gltf is not None:
+            try:
+                from io_scene_gltf2.blender.imp.gltf2_blender_mesh import BlenderMesh
+
+                pymesh = gltf.data.meshes[mesh_index]
+                if None not in pymesh.blender_name: BlenderMesh.create(gltf, mesh_index, None)
+                mesh = bpy.data.meshes[pymesh.blender_name[None]]
+            except (ImportError, AttributeError, IndexError, KeyError, TypeError):
+                mesh = None
+
+        self._collider_meshes[mesh_index] = mesh
+
+        return mesh
+
+    def _replace_with_mesh_object(self, vnode, blender_object, mesh):
+        name = blender_object.name
+
+        mesh_object = bpy.data.objects.new(name, mesh)
+        mesh_object.parent = blender_object.parent
+        mesh_object.matrix_parent_inverse = blender_object.matrix_parent_inverse.copy()
+        mesh_object.rotation_mode = blender_object.rotation_mode
+        mesh_object.matrix_basis = blender_object.matrix_basis.copy()
+
+        for key in blender_object.keys(): mesh_object[key] = blender_object[key]
+        for collection in blender_object.users_collection: collection.objects.link(mesh_object)
+        for child in blender_object.children: child.parent = mesh_object
+
+        bpy.data.objects.remove(blender_object)
+        mesh_object.name = name
+
+        # children are created after this hook and look their parent up through the vnode
+        vnode.blender_object = mesh_object
+
+        return mesh_object
+
+    def _import_collider(self, vnode, blender_object, extension_data, import_settings):
+        collider_type = extension_data.get('type', None)
+        if collider_type not in [t[0] for t in collider_types]: return
+
+        if collider_type in ['hull', 'mesh']:
+            mesh_index = extension_data.get('mesh', None)
+            mesh = self._get_collider_mesh(mesh_index, import_settings) if mesh_index is not None else None
+        else:
+            mesh = self._get_primitive_mesh(collider_type, extension_data)
+
+        if mesh is not None and blender_object.type == 'EMPTY':
+            blender_object = self._replace_with_mesh_object(vnode, blender_object, mesh)
+
+        collider_props = blender_object.OMIColliderProperties
+
+        collider_props.is_collider = True
+        collider_props.collider_type = collider_type
+        collider_props.collider_is_trigger = bool(extension_data.get('isTrigger', False))
+
+        # offsets and mesh centers are already baked into the node transform
+        collider_props.use_mesh_center = True
+        collider_props.use_offsets = False
+        collider_props.offset_location = (0, 0, 0)
+        collider_props.offset_rotation = (0, 0, 0)
+        collider_props.offset_scale = (1, 1, 1)
+
+    def gather_import_node_before_hook(self, vnode, gltf_node, import_settings):
+        if self.properties.enabled:
+            pass
+
+    def gather_import_node_after_hook(self, vnode, gltf_node, blender_object, import_settings):
+        if self.properties.enabled:
+            extension_data = self._get_extension_data(gltf_node)
+            if extension_data is not None and blender_object is not None:
+                self._import_collider(vnode, blender_object, extension_data, import_settings)
+
+_collider_bake_store = ColliderBakeStore()
+
+# seconds of baking per timer call, and the wait before the first call after an edit
+bake_time_budget = 0.02
+bake_delay = 0.25
+
+def _is_collider_mesh_object(obj):
+    return obj.type == 'MESH' and obj.OMIColliderProperties.is_collider
+
+def _is_collider_baking_enabled(scene):
+    return scene is not None and scene.OMIColliderExportExtensionProperties.use_collider_baking
+
+def _schedule_collider_baking():
+    if not bpy.app.timers.is_registered(_bake_dirty_colliders):
+        bpy.app.timers.register(_bake_dirty_colliders, first_interval=bake_delay)
+
+def _mark_all_colliders_dirty():
+    for obj in bpy.data.objects:
+        if _is_collider_mesh_object(obj): _collider_bake_store.mark_dirty(obj.name)
+
+    _schedule_collider_baking()
+
+def _bake_collider_object(obj, props):
+    mesh = obj.data
+    key = mesh.as_pointer()
+    collider_type = obj.OMIColliderProperties.collider_type
+
+    if not _collider_bake_store.has(key, 'bounds'):
+        _collider_bake_store.put(key, 'bounds', bounds.get_coordinate_bounds(_read_mesh_coordinates(mesh)))
+
+    if collider_type in mesh_collider_types + ['compound'] and not _collider_bake_store.has(key, 'fingerprint'):
+        _collider_bake_store.put(key, 'fingerprint', _get_hull_fingerprint(mesh))
+
+    if collider_type == 'hull' and not _collider_bake_store.has(key, 'hull_validation'):
+        _collider_bake_store.put(key, 'hull_validation', hull.validate_hull_topology(_read_hull_topology(mesh)))
+
+    # baked for the default y-up export, the node scale decides if the shape may rotate
+    if props.use_tight_fit and collider_type in primitive_collider_types and len(mesh.vertices) > 0:
+        allow_rotation = _has_uniform_scale(obj.scale)
+        name = ('fitted_shape', collider_type, True, allow_rotation)
+
+        if not _collider_bake_store.has(key, name):
+            _collider_bake_store.put(key, name, _fit_mesh_shape(mesh, collider_type, True, allow_rotation))
+
+def _bake_dirty_colliders():
+    scene = bpy.context.scene
+    if not _is_collider_baking_enabled(scene): return None
+
+    start = time.perf_counter()
+    while time.perf_counter() - start < bake_time_budget:
+        object_name = _collider_bake_store.pop_dirty()
+        if object_name is None: return None
+
+        # edit mode changes reach the mesh when leaving edit mode, which marks the object again
+        obj = bpy.data.objects.get(object_name, None)
+        if obj is None or obj.mode == 'EDIT' or not _is_collider_mesh_object(obj): continue
+
+        _bake_collider_object(obj, scene.OMIColliderExportExtensionProperties)
+
+    return 0.01
+
+@persistent
+def _on_depsgraph_update_post(scene, depsgraph):
+    if not _is_collider_baking_enabled(scene): return
+
+    for update in depsgraph.updates:
+        data = update.id.original
+
+        if isinstance(data, bpy.types.Mesh):
+            if update.is_updated_geometry: _collider_bake_store.invalidate(data.as_pointer())
+        elif isinstance(data, Object) and _is_collider_mesh_object(data):
+            # property edits arrive as object updates without geometry changes
+            if update.is_updated_geometry: _collider_bake_store.invalidate(data.data.as_pointer())
+            _collider_bake_store.mark_dirty(data.name)
+
+    if len(_collider_bake_store.dirty_objects) > 0: _schedule_collider_baking()
+
+@persistent
+def _on_collider_data_reloaded(*args):
+    # loading and undo replace the mesh datablocks the results are keyed by
+    _collider_bake_store.clear()
+    if _is_collider_baking_enabled(bpy.context.scene): _mark_all_colliders_dirty()
+
+collider_bake_handlers = [
+    (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update_post),
+    (bpy.app.handlers.load_post, _on_collider_data_reloaded),
+    (bpy.app.handlers.undo_post, _on_collider_data_reloaded),
+    (bpy.app.handlers.redo_post, _on_collider_data_reloaded)
+]
+
+# hull and mesh colliders exported as primitives by the current export
+_collider_substitutions = []
+
+def _get_profile_report_paths(export_settings):
+    base_path = os.path.splitext(export_settings.get('gltf_filepath', 'export'))[0]
+    return base_path + '.omi_collider_profile.json', base_path + '.omi_collider_profile.prof'
+
+def _get_substitution_report_path(export_settings):
+    return os.path.splitext(export_settings.get('gltf_filepath', 'export'))[0] + '.omi_collider_lod.json'
+
+def _write_substitution_report(export_settings, tolerance):
+    report = {
+        'filepath': export_settings.get('gltf_filepath', None),
+        'tolerance': tolerance,
+        'substitutions': sorted(_collider_substitutions, key=lambda s: s['object'])
+    }
+
+    report_path = _get_substitution_report_path(export_settings)
+
+    try:
+        with open(report_path, 'w', encoding='utf-8') as f: json.dump(report, f, indent=2)
+    except OSError as e: print('{}: could not write substitution report: {}'.format(glTF_extension_name, e))
+
+# results computed by the prefetch of the current export, keyed like baked results
+_collider_prefetch_store = ColliderBakeStore()
+
+def _get_prefetch_snapshots(objects, props, is_y_up):
+    # one snapshot per mesh with everything its collider objects will ask for
+    requests = {}
+
+    for obj in objects:
+        if not _is_collider_mesh_object(obj) or len(obj.data.vertices) == 0: continue
+
+        collider_type = obj.OMIColliderProperties.collider_type
+        request = requests.setdefault(obj.data.as_pointer(), {'mesh': obj.data, 'names': set(['bounds']), 'fitted_shapes': set()})
+
+        if collider_type == 'hull': request['names'].add('hull_validation')
+        if collider_type in mesh_collider_types + ['compound']: request['names'].add('fingerprint')
+
+        if props.use_tight_fit and collider_type in primitive_collider_types:
+            fitted_shape = (collider_type, is_y_up, _has_uniform_scale(obj.scale))
+            request['fitted_shapes'].add(fitted_shape)
+            request['names'].add(('fitted_shape',) + fitted_shape)
+
+    snapshots = []
+    for key, request in requests.items():
+        if all(_collider_bake_store.has(key, name) for name in request['names']): continue
+
+        mesh = request['mesh']
+        topology = _read_hull_topology(mesh) if 'hull_validation' in request['names'] else None
+
+        fingerprint_buffers = None
+        if 'fingerprint' in request['names']:
+            if topology is not None: fingerprint_buffers = (topology.edge_vertices, topology.loop_vertices, topology.polygon_loop_starts)
+            else: fingerprint_buffers = _read_fingerprint_buffers(mesh)
+
+        snapshots.append(MeshSnapshot(
+            key, _read_mesh_coordinates(mesh), topology, fingerprint_buffers, sorted(request['fitted_shapes'])))
+
+    return snapshots
+
+def _prefetch_collider_results(scene, props, is_y_up):
+    with _export_profiler.stage('prefetch_snapshots'):
+        snapshots = _get_prefetch_snapshots(scene.objects, props, is_y_up)
+
+    with _export_profiler.stage('prefetch_workers'):
+        workers = props.prefetch_workers if props.prefetch_workers > 0 else None
+        count = prefetch_collider_results(snapshots, _collider_prefetch_store, workers, props.use_prefetch_processes)
+
+    _export_profiler.count('meshes_prefetched', count)
+
+def glTF2_pre_export_callback(export_settings):
+    props = bpy.context.scene.OMIColliderExportExtensionProperties
+
+    _collider_substitutions.clear()
+    _collider_prefetch_store.clear()
+
+    if props.enabled and props.write_profile_report:
+        _export_profiler.start(use_cprofile=props.capture_cprofile)
+
+    # prefetched results are measured on the meshes without modifiers
+    if props.enabled and props.use_parallel_prefetch and not props.use_evaluated_geometry:
+        _prefetch_collider_results(bpy.context.scene, props, export_settings.get('gltf_yup', False))
+
+    if props.enabled and props.check_collider_overlaps:
+        with _export_profiler.stage('collider_overlaps'):
+            colliders, report = analyze_collider_overlaps(bpy.context.scene.objects)
+
+        for message in _get_overlap_messages(colliders, report): print('{}: warning: {}'.format(glTF_extension_name, message))
+
+def glTF2_post_export_callback(export_settings):
+    props = bpy.context.scene.OMIColliderExportExtensionProperties
+
+    if props.enabled and props.use_collider_lod:
+        _write_substitution_report(export_settings, props.lod_tolerance)
+    _collider_substitutions.clear()
+    _collider_prefetch_store.clear()
+
+    if not _export_profiler.is_active: return
+
+    _export_profiler.stop()
+
+    report_path, profile_path = _get_profile_report_paths(export_settings)
+    extra = {'filepath': export_settings.get('gltf_filepath', None)}
+
+    try: _export_profiler.write_report(report_path, profile_path, extra)
+    except OSError as e: print('{}: could not write profile report: {}'.format(glTF_extension_name, e))
+        
+# glTF space to Blender space, the inverse of the exporter's y-up conversion
+_from_y_up_matrix = Matrix(((1, 0, 0, 0), (0, 0, -1, 0), (0, 1, 0, 0), (0, 0, 0, 1)))
+
+def _get_collider_placement(obj):
+    # the collider type, its geometry in glTF space and the matrix placing that space in the scene
+    if obj.type != 'MESH' or not obj.OMIColliderProperties.is_collider: return None
+
+    export_props = bpy.context.scene.OMIColliderExportExtensionProperties
+
+    # measured on the mesh the export measures, keyed like the export hooks key it
+    mesh_keys = {}
+    with _use_evaluated_collider_mesh(obj, export_props.use_evaluated_geometry, mesh_keys) as mesh:
+        if len(mesh.vertices) == 0: return None
+        return _get_mesh_collider_placement(obj, mesh, _get_collider_mesh_key(mesh, mesh_keys), export_props)
+
+def _get_mesh_collider_placement(obj, mesh, key, export_props):
+    collider_props = obj.OMIColliderProperties
+    collider_type = collider_props.collider_type
+
+    # placed like the default y-up export: the node transform in glTF space, then
+    # the mesh center or fitted transform, then the offsets
+    translation, rotation, scale = obj.matrix_basis.decompose()
+    translation = _convert_to_y_up_location(translation)
+    rotation = _convert_to_y_up_rotation(rotation)
+    scale = _convert_to_y_up_scale(scale)
+
+    allow_rotation = _has_uniform_scale(scale)
+
+    # display meshes get a parent node with the object transform, the collider node is corrected from identity
+    display_matrix = Matrix.Identity(4)
+    if collider_props.is_display_mesh:
+        display_matrix = Matrix.Translation(translation) @ rotation.to_matrix().to_4x4() @ Matrix.Diagonal(scale).to_4x4()
+        translation, rotation, scale = Vector((0.0, 0.0, 0.0)), Quaternion(), Vector((1.0, 1.0, 1.0))
+
+    # hulls and meshes that a primitive covers closely are exported as that primitive, placed by its fit
+    fitted_shape = None
+    if export_props.use_collider_lod and collider_type in mesh_collider_types:
+        collider_lod = _choose_mesh_collider_lod(mesh, collider_type, export_props.lod_tolerance, True, allow_rotation)
+        if collider_lod is not None: collider_type, fitted_shape = collider_lod.collider_type, collider_lod.fitted_shape
+
+    is_primitive = collider_type in primitive_collider_types
+
+    if fitted_shape is None and is_primitive and export_props.use_tight_fit:
+        fitted_shape = _collider_bake_store.get(key, ('fitted_shape', collider_type, True, allow_rotation))
+        if fitted_shape is None: fitted_shape = _get_cached_fitted_shape(mesh, collider_type, True, allow_rotation)
+
+    if fitted_shape is not None:
+        geometry = fitted_shape.geometry
+        translation += rotation @ (Vector(fitted_shape.center) * scale)
+        rotation @= Quaternion(fitted_shape.rotation)
+    else:
+        mesh_bounds = _collider_bake_store.get(key, 'bounds')
+        if mesh_bounds is None: mesh_bounds = bounds.get_coordinate_bounds(_read_mesh_coordinates(mesh))
+
+        geometry = bounds.get_geometry_from_axes(bounds.convert_bounds_to_y_up(mesh_bounds))
+
+        if is_primitive and collider_props.use_mesh_center:
+            center = bounds.get_geometry_from_axes(mesh_bounds).center
+            translation += Vector(conversion.convert_to_y_up_location(center))
+
+    if collider_props.use_offsets:
+        translation += Vector(_convert_to_y_up_location(collider_props.offset_location))
+        rotation @= _convert_to_y_up_rotation(collider_props.offset_rotation.to_quaternion())
+        scale *= Vector(_convert_to_y_up_scale(collider_props.offset_scale))
+
+    local_matrix = Matrix.Translation(translation) @ rotation.to_matrix().to_4x4() @ Matrix.Diagonal(scale).to_4x4()
+    parent_matrix = obj.matrix_world @ obj.matrix_basis.inverted_safe()
+
+    return collider_type, geometry, parent_matrix @ _from_y_up_matrix @ display_matrix @ local_matrix
+
+def _get_overlay_shape(obj):
+    if obj.type != 'MESH' or obj.OMIColliderProperties.collider_type not in primitive_collider_types: return None
+
+    placement = _get_collider_placement(obj)
+    if placement is None: return None
+
+    collider_type, geometry, matrix = placement
+
+    return collider_type, [tuple(matrix @ Vector(point)) for point in get_shape_lines(collider_type, geometry)]
+
+_collider_overlay = ColliderOverlay(_get_overlay_shape)
+
+@persistent
+def _on_overlay_depsgraph_update_post(scene, depsgraph):
+    if not _collider_overlay.is_enabled: return
+
+    for update in depsgraph.updates:
+        data = update.id.original
+
+        # children move with their parents, those updates arrive as object updates too
+        if isinstance(data, Object): _collider_overlay.mark_dirty(data.name)
+        elif isinstance(data, (bpy.types.Collection, bpy.types.Scene)): _collider_overlay.mark_stale()
+
+    # placed here, once per change, so redraws never evaluate meshes
+    _collider_overlay.refresh(scene.objects)
+
+@persistent
+def _on_overlay_data_reloaded(*args):
+    _collider_overlay.clear()
+    if _collider_overlay.is_enabled and bpy.context.scene is not None: _collider_overlay.refresh(bpy.context.scene.objects)
+
+def _get_collider_world_bounds(obj):
+    placement = _get_collider_placement(obj)
+    if placement is None: return None
+
+    return _get_placement_world_bounds(*placement)
+
+def _get_placement_world_bounds(collider_type, geometry, matrix):
+    # primitives are centered on their placement, the other colliders keep the mesh bounds
+    if collider_type == 'box': half_size, center = geometry.extents, (0.0, 0.0, 0.0)
+    elif collider_type == 'sphere': half_size, center = (geometry.radius,) * 3, (0.0, 0.0, 0.0)
+    elif collider_type == 'capsule':
+        half_size, center = (geometry.radius, geometry.radius, max(geometry.height * 0.5, geometry.radius)), (0.0, 0.0, 0.0)
+    else: half_size, center = geometry.extents, geometry.center
+
+    corners = [
+        matrix @ Vector((center[0] + sx * half_size[0], center[1] + sy * half_size[1], center[2] + sz * half_size[2]))
+        for sx in (-1, 1) for sy in (-1, 1) for sz in (-1, 1)]
+
+    return (
+        tuple(min(c[axis] for c in corners) for axis in range(3)),
+        tuple(max(c[axis] for c in corners) for axis in range(3)))
+
+def analyze_collider_overlaps(objects, overlap_ratio=0.9):
+    # returns the analyzed collider objects and a core.spatial.OverlapReport indexing them
+    colliders = []
+    boxes = []
+    shapes = []
+
+    for obj in objects:
+        placement = _get_collider_placement(obj)
+        if placement is None: continue
+
+        collider_type, geometry, matrix = placement
+
+        colliders.append(obj)
+        boxes.append(_get_placement_world_bounds(collider_type, geometry, matrix))
+
+        # only primitives can hold other colliders, meshes are often hollow like rooms or open like terrain
+        shape = None
+        if collider_type in primitive_collider_types: shape = spatial.ColliderShape(collider_type, geometry, matrix.inverted_safe())
+        shapes.append(shape)
+
+    is_trigger = [obj.OMIColliderProperties.collider_is_trigger for obj in colliders]
+
+    return colliders, spatial.analyze_overlaps(boxes, is_trigger, overlap_ratio, shapes=shapes)
+
+def _get_overlap_messages(colliders, report):
+    messages = []
+
+    for i, container in report.contained:
+        messages.append('{} is inside {}'.format(colliders[i].name, colliders[container].name))
+    for i, j, ratio in report.overlapping:
+        messages.append('{} and {} overlap by {:.0%}'.format(colliders[i].name, colliders[j].name, ratio))
+    for i in report.isolated_triggers:
+        messages.append('{} is a trigger that touches no collider'.format(colliders[i].name))
+
+    return messages
+
+class GLTF_OT_OMIColliderAnalyzeOverlapsOperator(Operator):
+
+    bl_idname = 'gltf2_omi_collider_extension.analyze_collider_overlaps'
+    bl_label = 'Analyze Collider Overlaps'
+    bl_description = 'Find colliders inside other colliders, heavily overlapping colliders and triggers that touch nothing.'
+    bl_options = {'REGISTER', 'UNDO'}
+
+    action: EnumProperty(
+        name='Action',
+        items=[
+            ('REPORT', 'Report', 'List the findings in the system console'),
+            ('SELECT', 'Select', 'Select the contained, overlapping and isolated colliders'),
+            ('STRIP', 'Strip', 'Turn off the collider of contained colliders and isolated triggers')
+        ],
+        default='REPORT'
+    )
+    overlap_ratio: FloatProperty(
+        name='Overlap Ratio',
+        description='Report colliders overlapping by at least this fraction of the smaller collider\'s bounds.',
+        default=0.9,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR'
+    )
+
+    def execute(self, context):
+        colliders, report = analyze_collider_overlaps(context.scene.objects, self.overlap_ratio)
+
+        for message in _get_overlap_messages(colliders, report): print('{}: {}'.format(glTF_extension_name, message))
+
+        if self.action == 'SELECT':
+            found = set(i for i, _ in report.contained) | set(report.isolated_triggers)
+            found.update(i for pair in report.overlapping for i in pair[:2])
+
+            for obj in context.selected_objects: obj.select_set(False)
+            for i in found: colliders[i].select_set(True)
+        elif self.action == 'STRIP':
+            for i in set(i for i, _ in report.contained) | set(report.isolated_triggers):
+                colliders[i].OMIColliderProperties.is_collider = False
+
+        self.report({'INFO'}, '{} contained, {} overlapping and {} isolated triggers in {} colliders.'.format(
+            len(report.contained), len(report.overlapping), len(report.isolated_triggers), len(colliders)))
+
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+class GLTF_OT_OMIColliderToggleOverlayOperator(Operator):
+
+    bl_idname = 'gltf2_omi_collider_extension.toggle_collider_overlay'
+    bl_label = 'Show Collider Shapes'
+    bl_description = 'Draw the exported box, sphere and capsule collider shapes in the viewport.'
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        if _collider_overlay.is_enabled: _collider_overlay.disable()
+        else: _collider_overlay.enable(context.scene.objects)
+
+        if context.screen is not None:
+            for area in context.screen.areas:
+                if area.type == 'VIEW_3D': area.tag_redraw()
+
+        return {'FINISHED'}
+
+addon_classes = [
+    OMIColliderExportExtensionProperties,
+    OMIColliderImportExtensionProperties,
+    OMIColliderProperties,
+    GLTF_PT_OMIColliderObjectPropertiesPanel,
+    GLTF_OT_OMIColliderSelectInvalidHullEdgesOperator,
+    GLTF_OT_OMIColliderCheckIfHullIsValidOperator,
+    GLTF_OT_OMIColliderCopyPropertiesFromActiveOperator,
+    GLTF_OT_OMIColliderApplyPresetOperator,
+    GLTF_OT_OMIColliderToggleOverlayOperator,
+    GLTF_OT_OMIColliderAnalyzeOverlapsOperator
+]
+
+extension_panel_classes = [
+    GLTF_PT_OMIColliderExportExtensionPanel,
+    GLTF_PT_OMIColliderImportExtensionPanel    
+]
+
+overlay_handlers = [
+    (bpy.app.handlers.depsgraph_update_post, _on_overlay_depsgraph_update_post),
+    (bpy.app.handlers.load_post, _on_overlay_data_reloaded),
+    (bpy.app.handlers.undo_post, _on_overlay_data_reloaded),
+    (bpy.app.handlers.redo_post, _on_overlay_data_reloaded)
+]
+
+def unregister_panel():
+    for cls in extension_panel_classes: unregister_class(cls)
+
+def register_panel():
+    for cls in extension_panel_classes: register_class(cls)
+    return unregister_panel
+    
+def register():
+    for cls in addon_classes: register_class(cls)
+    
+    Scene.OMIColliderExportExtensionProperties = PointerProperty(type=OMIColliderExportExtensionProperties)
+    Scene.OMIColliderImportExtensionProperties = PointerProperty(type=OMIColliderImportExtensionProperties)
+
+    Object.OMIColliderProperties = PointerProperty(type=OMIColliderProperties)
+
+    for handlers, handler in collider_bake_handlers + overlay_handlers:
+        if handler not in handlers: handlers.append(handler)
+
+def unregister():
+    for handlers, handler in collider_bake_handlers + overlay_handlers:
+        if handler in handlers: handlers.remove(handler)
+
+    _collider_overlay.disable()
+
+    if bpy.app.timers.is_registered(_bake_dirty_colliders): bpy.app.timers.unregister(_bake_dirty_colliders)
+    _collider_bake_store.clear()
+
+    for cls in reversed(addon_classes): unregister_class(cls)
+
+    del Scene.OMIColliderExportExtensionProperties
+    del Scene.OMIColliderImportExtensionProperties
+
+    del Object.OMIColliderProperties
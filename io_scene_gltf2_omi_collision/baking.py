@@ -0,0 +1,28 @@
+# Results baked ahead of export for collider objects, kept up to date by the add-on.
+#
+# The add-on marks objects dirty from a depsgraph_update_post handler, drops the
+# results of meshes whose geometry changed and recomputes them from a timer, a
+# few objects at a time. Exports look results up here before computing them.
+# Results are keyed by mesh and by the name of the value, like 'bounds'.
+
+class ColliderBakeStore:
+
+    def __init__(self):
+        self.meshes = {}
+        self.dirty_objects = set()
+
+    def clear(self):
+        self.meshes.clear()
+        self.dirty_objects.clear()
+
+    def invalidate(self, mesh_key): self.meshes.pop(mesh_key, None)
+
+    def get(self, mesh_key, name): return self.meshes.get(mesh_key, {}).get(name, None)
+
+    def has(self, mesh_key, name): return name in self.meshes.get(mesh_key, {})
+
+    def put(self, mesh_key, name, value): self.meshes.setdefault(mesh_key, {})[name] = value
+
+    def mark_dirty(self, object_name): self.dirty_objects.add(object_name)
+
+    def pop_dirty(self): return self.dirty_objects.pop() if len(self.dirty_objects) > 0 else None
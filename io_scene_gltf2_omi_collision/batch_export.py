@@ -0,0 +1,234 @@
+# Headless batch export of .blend files with the OMI_collider extension enabled.
+#
+# usage:
+#   blender --background --python io_scene_gltf2_omi_collision/batch_export.py -- \
+#       SOURCE [SOURCE ...] --output-dir DIR [--format glb|gltf] [--jobs N] [--report FILE]
+#
+# A SOURCE is either a directory that is searched recursively for .blend files
+# or a manifest, a .txt file with one path per line or a .json list of paths.
+# Each file is exported by its own background Blender process, at most --jobs
+# of them run at once. The controller itself does not need bpy and can also be
+# started with a plain python interpreter by passing --blender.
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+from concurrent.futures import ThreadPoolExecutor
+
+addon_module_name = 'io_scene_gltf2_omi_collision'
+
+result_prefix = 'OMI_COLLIDER_BATCH_RESULT '
+
+export_formats = {
+    'glb': ('GLB', '.glb'),
+    'gltf': ('GLTF_SEPARATE', '.gltf')
+}
+
+def _script_args():
+    return sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else sys.argv[1:]
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog='batch_export.py')
+    parser.add_argument('sources', nargs='*', help='directories of .blend files or manifest files')
+    parser.add_argument('--output-dir', default=None)
+    parser.add_argument('--format', choices=sorted(export_formats.keys()), default='glb')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--timeout', type=float, default=None, help='seconds allowed per file')
+    parser.add_argument('--report', default=None, help='write the JSON report here instead of stdout')
+    parser.add_argument('--blender', default=None, help='blender binary used for the workers')
+
+    # internal, used by the worker processes
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--output', default=None, help=argparse.SUPPRESS)
+
+    return parser.parse_args(argv)
+
+def _read_manifest(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.lower().endswith('.json'): entries = json.load(f)
+        else: entries = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    return [os.path.normpath(os.path.join(base_dir, entry)) for entry in entries]
+
+def _get_file_stems(paths):
+    # files named directly or in manifests keep their directories below the deepest one they share
+    try: base_dir = os.path.commonpath([os.path.dirname(path) for path in paths])
+    except ValueError: base_dir = None
+
+    return [
+        os.path.splitext(os.path.relpath(path, base_dir) if base_dir is not None else os.path.basename(path))[0]
+        for path in paths]
+
+def _check_output_stems(jobs):
+    # a file listed twice is exported once, two files writing the same output are an error
+    outputs = {}
+    unique_jobs = []
+
+    for blend_path, output_stem in jobs:
+        # case insensitive file systems would still overwrite
+        key = os.path.normpath(output_stem).lower()
+
+        other_path = outputs.get(key, None)
+        if other_path is None:
+            outputs[key] = blend_path
+            unique_jobs.append((blend_path, output_stem))
+        elif other_path != blend_path:
+            raise SystemExit('{} and {} would both be exported to {}'.format(other_path, blend_path, output_stem))
+
+    return unique_jobs
+
+def _collect_jobs(sources):
+    jobs = []
+    file_jobs = []
+
+    for source in sources:
+        if os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    if not name.lower().endswith('.blend'): continue
+                    path = os.path.join(root, name)
+                    jobs.append((os.path.abspath(path), os.path.splitext(os.path.relpath(path, source))[0]))
+        elif source.lower().endswith('.blend'):
+            file_jobs.append(len(jobs))
+            jobs.append((os.path.abspath(source), None))
+        else:
+            for path in _read_manifest(source):
+                file_jobs.append(len(jobs))
+                jobs.append((path, None))
+
+    if len(file_jobs) > 0:
+        stems = _get_file_stems([jobs[i][0] for i in file_jobs])
+        for i, output_stem in zip(file_jobs, stems): jobs[i] = (jobs[i][0], output_stem)
+
+    return _check_output_stems(jobs)
+
+def _find_blender(args):
+    if args.blender is not None: return args.blender
+
+    try:
+        import bpy
+        return bpy.app.binary_path
+    except ImportError:
+        return 'blender'
+
+def _run_worker_process(blender, blend_path, output_path, args):
+    command = [
+        blender, '--background', '--factory-startup', blend_path,
+        '--python', os.path.abspath(__file__), '--',
+        '--worker', '--output', output_path, '--format', args.format
+    ]
+
+    result = {
+        'source': blend_path,
+        'output': output_path,
+        'status': 'failed',
+        'seconds': None,
+        'export_seconds': None,
+        'error': None
+    }
+
+    start = time.perf_counter()
+
+    try:
+        process = subprocess.run(command, capture_output=True, text=True, timeout=args.timeout)
+    except subprocess.TimeoutExpired:
+        result['seconds'] = time.perf_counter() - start
+        result['error'] = 'timed out after {} seconds'.format(args.timeout)
+        return result
+    except OSError as e:
+        result['seconds'] = time.perf_counter() - start
+        result['error'] = str(e)
+        return result
+
+    result['seconds'] = time.perf_counter() - start
+
+    worker_result = None
+    for line in process.stdout.splitlines():
+        if line.startswith(result_prefix): worker_result = json.loads(line[len(result_prefix):])
+
+    if worker_result is None:
+        result['error'] = (process.stderr or process.stdout).strip()[-2000:] or 'worker exited with code {}'.format(process.returncode)
+    else:
+        result.update(worker_result)
+
+    return result
+
+def _run_controller(args):
+    if len(args.sources) == 0: raise SystemExit('no sources given')
+    if args.output_dir is None: raise SystemExit('--output-dir is required')
+
+    blender = _find_blender(args)
+    extension = export_formats[args.format][1]
+
+    jobs = _collect_jobs(args.sources)
+    start = time.perf_counter()
+
+    def _export(job):
+        blend_path, output_stem = job
+        output_path = os.path.abspath(os.path.join(args.output_dir, output_stem + extension))
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        return _run_worker_process(blender, blend_path, output_path, args)
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        results = list(executor.map(_export, jobs))
+
+    report = {
+        'blender': blender,
+        'jobs': max(1, args.jobs),
+        'format': args.format,
+        'seconds': time.perf_counter() - start,
+        'exported': sum(1 for r in results if r['status'] == 'ok'),
+        'failed': sum(1 for r in results if r['status'] != 'ok'),
+        'files': results
+    }
+
+    if args.report is not None:
+        with open(args.report, 'w', encoding='utf-8') as f: json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    return 0 if report['failed'] == 0 else 1
+
+def _enable_addon():
+    import addon_utils
+
+    addon_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if addon_dir not in sys.path: sys.path.insert(0, addon_dir)
+
+    addon_utils.enable(addon_module_name, default_set=True)
+
+def _run_worker(args):
+    import bpy
+
+    result = {'status': 'failed', 'export_seconds': None, 'error': None}
+
+    try:
+        _enable_addon()
+
+        bpy.context.scene.OMIColliderExportExtensionProperties.enabled = True
+
+        start = time.perf_counter()
+        bpy.ops.export_scene.gltf(filepath=args.output, export_format=export_formats[args.format][0])
+        result['export_seconds'] = time.perf_counter() - start
+
+        result['status'] = 'ok'
+    except Exception as e:
+        result['error'] = '{}: {}'.format(type(e).__name__, e)
+
+    print(result_prefix + json.dumps(result), flush=True)
+
+    return 0 if result['status'] == 'ok' else 1
+
+def main():
+    args = _parse_args(_script_args())
+    return _run_worker(args) if args.worker else _run_controller(args)
+
+if __name__ == '__main__':
+    exit_code = main()
+    if exit_code: sys.exit(exit_code)
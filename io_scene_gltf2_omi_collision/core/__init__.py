@@ -0,0 +1,93 @@
+# Blender independent OMI_collider processing.
+#
+# Everything in this package works on plain coordinate buffers and glTF JSON
+# dicts and imports without bpy, bmesh or io_scene_gltf2, so it can be used by
+# asset pipeline tools that never start Blender. NumPy is used when available.
+
+from .conversion import (
+    convert_to_y_up_vector,
+    convert_to_y_up_location,
+    convert_to_y_up_scale,
+    convert_to_y_up_rotation,
+    convert_from_y_up_location,
+    convert_coordinates_to_y_up,
+    convert_to_y_up_vectors,
+    convert_to_y_up_locations,
+    convert_to_y_up_scales,
+    convert_to_y_up_rotations
+)
+
+from .bounds import (
+    MeshGeometry,
+    get_coordinate_bounds,
+    convert_bounds_to_y_up,
+    get_geometry_from_axes,
+    get_geometry_from_coordinates
+)
+
+from .hull import (
+    HullTopology,
+    HullValidation,
+    HullValidationCache,
+    find_invalid_hull_edges,
+    validate_hull_topology,
+    get_hull_fingerprint
+)
+
+from .quickhull import HullError, compute_convex_hull, get_convex_hull_volume
+
+from .decomposition import decompose_convex
+
+from .meshopt import weld_vertices, decimate_triangles, optimize_collision_mesh
+
+from .fitting import (
+    FittedShape,
+    get_principal_axes,
+    fit_oriented_box,
+    fit_sphere,
+    fit_capsule,
+    fit_shape
+)
+
+from .lod import (
+    ColliderLod,
+    primitive_cost_order,
+    get_primitive_volume,
+    score_primitives,
+    choose_collider_lod
+)
+
+from .primitives import get_box_geometry, get_sphere_geometry, get_capsule_geometry
+
+from .shapes import (
+    glTF_extension_name,
+    collider_type_names,
+    primitive_collider_types,
+    mesh_collider_types,
+    get_collider_extension_data
+)
+
+from .transforms import (
+    quaternion_multiply,
+    quaternion_rotate_vector,
+    euler_to_quaternion,
+    from_gltf_rotation,
+    to_gltf_rotation,
+    quaternion_multiply_many,
+    quaternion_rotate_vectors,
+    apply_collider_corrections
+)
+
+from .nodes import (
+    NodeGraph,
+    modify_node_json,
+    get_node_parents,
+    get_collider_source_mesh,
+    translate_node_json_origin,
+    apply_offsets_to_node_json,
+    update_extensions_used
+)
+
+from .spatial import BoundsTree, OverlapReport, ColliderShape, analyze_overlaps
+
+from .glb import GlbError, GlbFile
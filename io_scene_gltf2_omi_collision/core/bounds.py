@@ -0,0 +1,66 @@
+# Axis aligned bounds and the box/sphere/capsule parameters derived from them.
+#
+# Coordinates are flat [x0, y0, z0, x1, ...] sequences, typically an array('f')
+# filled by foreach_get('co', ...) or a float accessor read from a .glb file.
+
+from collections import namedtuple
+
+try: import numpy as np
+except ImportError: np = None
+
+from .conversion import convert_to_y_up_location
+
+MeshGeometry = namedtuple('MeshGeometry', ['extents', 'radius', 'height', 'center'])
+
+empty_bounds = ((0.0, 0.0), (0.0, 0.0), (0.0, 0.0))
+
+def get_coordinate_bounds_numpy(coords):
+    points = np.asarray(coords).reshape(-1, 3)
+
+    mins = points.min(axis=0)
+    maxs = points.max(axis=0)
+
+    return tuple((float(mins[i]), float(maxs[i])) for i in range(3))
+
+def get_coordinate_bounds_python(coords):
+    return tuple((min(coords[i::3]), max(coords[i::3])) for i in range(3))
+
+def get_coordinate_bounds(coords):
+    if len(coords) == 0: return empty_bounds
+    if np is not None: return get_coordinate_bounds_numpy(coords)
+    return get_coordinate_bounds_python(coords)
+
+def convert_bounds_to_y_up(bounds):
+    (x_min, x_max), (y_min, y_max), (z_min, z_max) = bounds
+
+    x_min, y_min, z_min = convert_to_y_up_location([x_min, y_min, z_min])
+    x_max, y_max, z_max = convert_to_y_up_location([x_max, y_max, z_max])
+
+    return (
+        (x_min, x_max),
+        (y_min, y_max),
+        (z_min, z_max)
+    )
+
+def get_geometry_from_axes(axes):
+    x_axis, y_axis, z_axis = axes
+
+    x_min, x_max = x_axis
+    y_min, y_max = y_axis
+    z_min, z_max = z_axis
+
+    x_extent = abs(x_min - x_max) * 0.5
+    y_extent = abs(y_min - y_max) * 0.5
+    z_extent = abs(z_min - z_max) * 0.5
+
+    radius = x_extent if x_extent > y_extent else y_extent
+    height = abs(z_min - z_max)
+
+    center = [(x_min + x_max) * 0.5, (y_min + y_max) * 0.5, (z_min + z_max) * 0.5]
+
+    return MeshGeometry((x_extent, y_extent, z_extent), radius, height, center)
+
+def get_geometry_from_coordinates(coords, is_y_up=False):
+    bounds = get_coordinate_bounds(coords)
+    if is_y_up: bounds = convert_bounds_to_y_up(bounds)
+    return get_geometry_from_axes(bounds)
@@ -0,0 +1,61 @@
+# Conversions from Blender's z-up space to glTF's y-up space, on plain sequences.
+#
+# The batched versions take (N, 3) vectors or (N, 4) [w, x, y, z] quaternions and
+# return NumPy arrays when NumPy is available, lists of lists otherwise.
+
+try: import numpy as np
+except ImportError: np = None
+
+def convert_to_y_up_vector(vector, is_scale=False):
+    x, old_y, old_z = vector
+
+    y = old_z
+    z = old_y * -1
+
+    if is_scale: z *= -1
+
+    return [x, y, z]
+
+def convert_to_y_up_location(vector):
+    return convert_to_y_up_vector(vector)
+
+def convert_to_y_up_scale(vector):
+    return convert_to_y_up_vector(vector, is_scale=True)
+
+def convert_to_y_up_rotation(quaternion):
+    w, x, old_y, old_z = quaternion
+
+    y = old_z
+    z = old_y * -1
+
+    return [w, x, y, z]
+
+def convert_from_y_up_location(vector):
+    x, y, z = vector
+    return [x, z * -1, y]
+
+def convert_coordinates_to_y_up(coords):
+    # flat [x0, y0, z0, x1, ...] coordinates
+    return [c for i in range(0, len(coords), 3) for c in convert_to_y_up_location(coords[i:i + 3])]
+
+def convert_to_y_up_vectors(vectors, is_scale=False):
+    if np is None: return [convert_to_y_up_vector(v, is_scale) for v in vectors]
+
+    converted = np.asarray(vectors, dtype=float).reshape(-1, 3)[:, [0, 2, 1]]
+    if not is_scale: converted[:, 2] *= -1
+
+    return converted
+
+def convert_to_y_up_locations(vectors):
+    return convert_to_y_up_vectors(vectors)
+
+def convert_to_y_up_scales(vectors):
+    return convert_to_y_up_vectors(vectors, is_scale=True)
+
+def convert_to_y_up_rotations(quaternions):
+    if np is None: return [convert_to_y_up_rotation(q) for q in quaternions]
+
+    converted = np.asarray(quaternions, dtype=float).reshape(-1, 4)[:, [0, 1, 3, 2]]
+    converted[:, 3] *= -1
+
+    return converted
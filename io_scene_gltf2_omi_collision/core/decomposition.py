@@ -0,0 +1,201 @@
+# Approximate convex decomposition of triangle meshes for compound colliders.
+#
+# The mesh is split recursively: the part whose surface lies deepest inside its
+# own convex hull is cut in two by the axis aligned plane that removes the most
+# volume from its hull, until every part is within the concavity tolerance or
+# the hull budget is used up. Planes are tried through the part's vertices, so a
+# cut can follow a concave corner, and triangles crossing the plane are clipped.
+# Concavity is measured relative to the size of the mesh.
+
+import math
+
+from .quickhull import HullError, compute_convex_hull, get_convex_hull_planes, get_convex_hull_volume
+
+try: import numpy as np
+except ImportError: np = None
+
+# planes tried per axis when a part is split
+split_candidates = 8
+
+class _Part:
+
+    __slots__ = ['triangles', 'hull', 'concavity']
+
+    def __init__(self, triangles, hull, concavity):
+        self.triangles = triangles
+        self.hull = hull
+        self.concavity = concavity
+
+def _get_vertex(coords, cut_coords, vertex):
+    # vertices of a candidate cut are numbered after the mesh vertices
+    i = vertex * 3
+    if i < len(coords): return coords[i:i + 3]
+
+    i -= len(coords)
+    return cut_coords[i:i + 3]
+
+def _get_part_coords(coords, triangles, cut_coords=()):
+    part_coords = []
+    for vertex in sorted(set(triangles)): part_coords.extend(_get_vertex(coords, cut_coords, vertex))
+    return part_coords
+
+def _get_triangle_centers(coords, triangles, cut_coords=()):
+    centers = []
+    for i in range(0, len(triangles), 3):
+        a, b, c = (_get_vertex(coords, cut_coords, triangles[i + j]) for j in range(3))
+        centers.append(tuple((a[axis] + b[axis] + c[axis]) / 3.0 for axis in range(3)))
+    return centers
+
+def _get_concavity(part_coords, hull):
+    # the depth of the deepest surface point below the hull boundary
+    normals, offsets = get_convex_hull_planes(*hull)
+
+    if np is not None:
+        depths = np.array(offsets) - np.asarray(part_coords, dtype=float).reshape(-1, 3).dot(np.array(normals).T)
+        return max(float(depths.min(axis=1).max()), 0.0)
+
+    concavity = 0.0
+    for i in range(0, len(part_coords), 3):
+        point = part_coords[i:i + 3]
+        depth = min(o - (n[0] * point[0] + n[1] * point[1] + n[2] * point[2]) for n, o in zip(normals, offsets))
+        if depth > concavity: concavity = depth
+
+    return concavity
+
+def _create_part(coords, triangles, scale, cut_coords=()):
+    part_coords = _get_part_coords(coords, triangles, cut_coords)
+    hull = compute_convex_hull(part_coords)
+
+    # triangle centers catch concave regions without a vertex of their own
+    samples = part_coords + [v for center in _get_triangle_centers(coords, triangles, cut_coords) for v in center]
+
+    return _Part(triangles, hull, _get_concavity(samples, hull) / scale)
+
+def _get_cut_vertex(coords, cut_coords, a, b, axis, split, cut_vertices):
+    # edges shared by two triangles are cut once, so both sides of the cut stay connected
+    if a > b: a, b = b, a
+
+    vertex = cut_vertices.get((a, b), None)
+    if vertex is not None: return vertex
+
+    a_coords, b_coords = coords[a * 3:a * 3 + 3], coords[b * 3:b * 3 + 3]
+    t = (split - a_coords[axis]) / (b_coords[axis] - a_coords[axis])
+
+    vertex = (len(coords) + len(cut_coords)) // 3
+    cut_coords.extend(a_coords[i] + (b_coords[i] - a_coords[i]) * t for i in range(3))
+    cut_vertices[(a, b)] = vertex
+
+    return vertex
+
+def _get_normal_component(coords, triangle, axis):
+    a, b, c = (coords[v * 3:v * 3 + 3] for v in triangle)
+    u = [b[i] - a[i] for i in range(3)]
+    v = [c[i] - a[i] for i in range(3)]
+
+    i, j = (axis + 1) % 3, (axis + 2) % 3
+    return u[i] * v[j] - u[j] * v[i]
+
+def _cut_triangles(coords, triangles, axis, split, eps):
+    # new vertices go to cut_coords, numbered after the mesh vertices, vertices on the plane belong to both sides
+    sides = ([], [])
+    cut_coords = []
+    cut_vertices = {}
+
+    for i in range(0, len(triangles), 3):
+        triangle = triangles[i:i + 3]
+        distances = [coords[v * 3 + axis] - split for v in triangle]
+
+        # a triangle in the plane bounds the side behind it
+        if all(abs(d) <= eps for d in distances):
+            sides[0 if _get_normal_component(coords, triangle, axis) > 0.0 else 1].extend(triangle)
+            continue
+
+        if all(d <= eps for d in distances):
+            sides[0].extend(triangle)
+            continue
+        if all(d >= -eps for d in distances):
+            sides[1].extend(triangle)
+            continue
+
+        polygons = ([], [])
+        for j in range(3):
+            a, b = triangle[j], triangle[(j + 1) % 3]
+            da, db = distances[j], distances[(j + 1) % 3]
+
+            if da <= eps: polygons[0].append(a)
+            if da >= -eps: polygons[1].append(a)
+
+            if (da < -eps and db > eps) or (da > eps and db < -eps):
+                vertex = _get_cut_vertex(coords, cut_coords, a, b, axis, split, cut_vertices)
+                polygons[0].append(vertex)
+                polygons[1].append(vertex)
+
+        for side, polygon in zip(sides, polygons):
+            for j in range(1, len(polygon) - 1): side.extend((polygon[0], polygon[j], polygon[j + 1]))
+
+    return sides, cut_coords
+
+def _get_split_values(coords, triangles, axis, eps):
+    values = sorted(set(coords[v * 3 + axis] for v in triangles))
+    values = [v for v in values if values[0] + eps < v < values[-1] - eps]
+
+    # evenly spread over the vertices, which includes the median
+    if len(values) > split_candidates:
+        values = [values[(2 * i + 1) * len(values) // (2 * split_candidates)] for i in range(split_candidates)]
+
+    return values
+
+def _split_part(coords, part, scale):
+    if len(part.triangles) < 6: return None
+
+    eps = scale * 1e-6
+
+    best = None
+    for axis in range(3):
+        for split in _get_split_values(coords, part.triangles, axis, eps):
+            sides, cut_coords = _cut_triangles(coords, part.triangles, axis, split, eps)
+            if len(sides[0]) == 0 or len(sides[1]) == 0: continue
+
+            try: children = [_create_part(coords, side, scale, cut_coords) for side in sides]
+            except HullError: continue
+
+            volume = sum(get_convex_hull_volume(*child.hull) for child in children)
+            if best is None or volume < best[0]: best = (volume, children, cut_coords)
+
+    if best is None: return None
+
+    # only the chosen cut adds its vertices, the numbering of every candidate starts at the end of coords
+    coords.extend(best[2])
+
+    return best[1]
+
+def decompose_convex(coords, triangles, max_hulls=8, concavity=0.05, max_vertices=None):
+    axes = [coords[axis::3] for axis in range(3)]
+    scale = math.sqrt(sum((max(a) - min(a)) ** 2 for a in axes)) if len(coords) > 0 else 0.0
+    if scale == 0.0: raise HullError('mesh has no extent')
+
+    # accepted cuts append their vertices to the coordinates
+    coords = list(coords)
+
+    parts = [_create_part(coords, list(triangles), scale)]
+    final_parts = []
+
+    while len(parts) > 0 and len(parts) + len(final_parts) < max_hulls:
+        part = max(parts, key=lambda p: p.concavity)
+        if part.concavity <= concavity: break
+
+        parts.remove(part)
+
+        children = _split_part(coords, part, scale)
+        if children is None: final_parts.append(part)
+        else: parts.extend(children)
+
+    hulls = []
+    for part in parts + final_parts:
+        part_coords = part.hull[0]
+        if max_vertices is not None and len(part_coords) // 3 > max_vertices:
+            hulls.append(compute_convex_hull(part_coords, max_vertices))
+        else:
+            hulls.append(part.hull)
+
+    return hulls
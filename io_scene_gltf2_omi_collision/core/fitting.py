@@ -0,0 +1,324 @@
+# Tight fitting oriented boxes, minimal spheres and capsules to vertex buffers.
+#
+# Shapes are fitted to the convex hull of the vertices, since only hull vertices
+# can touch a convex bounding shape. Every fit returns the shape parameters with
+# the center and rotation of the shape in the mesh's coordinate frame, capsules
+# lie along the local z axis of their rotation like the axis aligned capsules.
+
+import math
+import random
+
+from collections import namedtuple
+
+from .bounds import MeshGeometry
+from .quickhull import HullError, compute_convex_hull
+
+try: import numpy as np
+except ImportError: np = None
+
+FittedShape = namedtuple('FittedShape', ['geometry', 'center', 'rotation'])
+
+identity_axes = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+
+refine_iterations = 4
+
+def _dot(a, b): return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+def _cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+def _normalize(v):
+    length = math.sqrt(_dot(v, v))
+    return (v[0] / length, v[1] / length, v[2] / length)
+
+def _get_points(coords): return [tuple(coords[i:i + 3]) for i in range(0, len(coords) - 2, 3)]
+
+def _get_hull_points(coords):
+    # flat or tiny meshes have no hull, every vertex is used for them instead
+    try: hull_coords, _ = compute_convex_hull(coords)
+    except HullError: hull_coords = coords
+    return _get_points(hull_coords)
+
+def _get_covariance(coords):
+    if np is not None:
+        points = np.asarray(coords, dtype=float).reshape(-1, 3)
+        return np.cov(points, rowvar=False, bias=True).tolist()
+
+    points = _get_points(coords)
+    mean = [sum(p[axis] for p in points) / len(points) for axis in range(3)]
+
+    return [[
+        sum((p[i] - mean[i]) * (p[j] - mean[j]) for p in points) / len(points)
+        for j in range(3)] for i in range(3)]
+
+def _get_eigenvectors(matrix, iterations=32):
+    # cyclic Jacobi rotations for a symmetric 3x3 matrix, returns the
+    # eigenvectors sorted by decreasing eigenvalue
+    a = [list(row) for row in matrix]
+    v = [[1.0 if i == j else 0.0 for j in range(3)] for i in range(3)]
+
+    for _ in range(iterations):
+        off_diagonal = abs(a[0][1]) + abs(a[0][2]) + abs(a[1][2])
+        if off_diagonal < 1e-15: break
+
+        for p, q in [(0, 1), (0, 2), (1, 2)]:
+            if abs(a[p][q]) < 1e-30: continue
+
+            theta = (a[q][q] - a[p][p]) / (2.0 * a[p][q])
+            t = (1.0 if theta >= 0.0 else -1.0) / (abs(theta) + math.sqrt(theta * theta + 1.0))
+            c = 1.0 / math.sqrt(t * t + 1.0)
+            s = t * c
+
+            for k in range(3):
+                akp, akq = a[k][p], a[k][q]
+                a[k][p], a[k][q] = c * akp - s * akq, s * akp + c * akq
+            for k in range(3):
+                apk, aqk = a[p][k], a[q][k]
+                a[p][k], a[q][k] = c * apk - s * aqk, s * apk + c * aqk
+            for k in range(3):
+                vkp, vkq = v[k][p], v[k][q]
+                v[k][p], v[k][q] = c * vkp - s * vkq, s * vkp + c * vkq
+
+    order = sorted(range(3), key=lambda i: a[i][i], reverse=True)
+    return [tuple(v[k][i] for k in range(3)) for i in order]
+
+def get_principal_axes(coords):
+    # right handed axes sorted by decreasing variance
+    if np is not None:
+        values, vectors = np.linalg.eigh(np.asarray(_get_covariance(coords)))
+        axes = [tuple(float(c) for c in vectors[:, i]) for i in (2, 1, 0)]
+    else:
+        axes = _get_eigenvectors(_get_covariance(coords))
+
+    u = _normalize(axes[0])
+    v = _normalize(_cross(_cross(u, axes[1]), u)) if abs(_dot(u, _normalize(axes[1]))) < 0.999 else None
+    if v is None: return identity_axes
+
+    return (u, v, _cross(u, v))
+
+def _get_axes_rotation(axes):
+    # quaternion [w, x, y, z] of the matrix with the axes as columns
+    (m00, m10, m20), (m01, m11, m21), (m02, m12, m22) = axes
+
+    trace = m00 + m11 + m22
+    if trace > 0.0:
+        s = math.sqrt(trace + 1.0) * 2.0
+        q = [0.25 * s, (m21 - m12) / s, (m02 - m20) / s, (m10 - m01) / s]
+    elif m00 > m11 and m00 > m22:
+        s = math.sqrt(1.0 + m00 - m11 - m22) * 2.0
+        q = [(m21 - m12) / s, 0.25 * s, (m01 + m10) / s, (m02 + m20) / s]
+    elif m11 > m22:
+        s = math.sqrt(1.0 + m11 - m00 - m22) * 2.0
+        q = [(m02 - m20) / s, (m01 + m10) / s, 0.25 * s, (m12 + m21) / s]
+    else:
+        s = math.sqrt(1.0 + m22 - m00 - m11) * 2.0
+        q = [(m10 - m01) / s, (m02 + m20) / s, (m12 + m21) / s, 0.25 * s]
+
+    if q[0] < 0.0: q = [-c for c in q]
+    return q
+
+def _project(points, axes):
+    if np is not None:
+        projected = np.asarray(points, dtype=float).dot(np.asarray(axes, dtype=float).T)
+        return projected.min(axis=0).tolist(), projected.max(axis=0).tolist()
+
+    projected = [[_dot(p, axis) for p in points] for axis in axes]
+    return [min(values) for values in projected], [max(values) for values in projected]
+
+def _from_axes(axes, local):
+    return tuple(sum(axes[i][axis] * local[i] for i in range(3)) for axis in range(3))
+
+def _get_box(points, axes):
+    mins, maxs = _project(points, axes)
+
+    extents = tuple((maxs[i] - mins[i]) * 0.5 for i in range(3))
+    center = _from_axes(axes, [(maxs[i] + mins[i]) * 0.5 for i in range(3)])
+
+    return extents, center
+
+def _get_hull_2d(points):
+    # monotone chain, counter-clockwise without collinear points
+    points = sorted(set(points))
+    if len(points) < 3: return points
+
+    def _half(sequence):
+        chain = []
+        for p in sequence:
+            while len(chain) >= 2:
+                (ax, ay), (bx, by) = chain[-2], chain[-1]
+                if (bx - ax) * (p[1] - ay) - (by - ay) * (p[0] - ax) > 0.0: break
+                chain.pop()
+            chain.append(p)
+        return chain
+
+    lower = _half(points)
+    upper = _half(reversed(points))
+
+    return lower[:-1] + upper[:-1]
+
+def _get_min_area_angle(points_2d):
+    # rotating calipers, the minimal rectangle has a side on a hull edge
+    hull = _get_hull_2d(points_2d)
+    if len(hull) < 3: return 0.0
+
+    best = None
+    for i in range(len(hull)):
+        (ax, ay), (bx, by) = hull[i], hull[(i + 1) % len(hull)]
+        angle = math.atan2(by - ay, bx - ax)
+        c, s = math.cos(angle), math.sin(angle)
+
+        us = [x * c + y * s for x, y in hull]
+        vs = [y * c - x * s for x, y in hull]
+        area = (max(us) - min(us)) * (max(vs) - min(vs))
+
+        if best is None or area < best[0]: best = (area, angle)
+
+    return best[1]
+
+def _rotate_axes(axes, fixed, angle):
+    # turns the two axes other than the fixed one by angle around it
+    i, j = [k for k in range(3) if k != fixed]
+    c, s = math.cos(angle), math.sin(angle)
+
+    rotated = list(axes)
+    rotated[i] = tuple(c * axes[i][k] + s * axes[j][k] for k in range(3))
+    rotated[j] = tuple(c * axes[j][k] - s * axes[i][k] for k in range(3))
+
+    return tuple(rotated)
+
+def fit_oriented_box(coords, allow_rotation=True):
+    points = _get_hull_points(coords)
+
+    best = None
+
+    def _try_axes(axes):
+        nonlocal best
+        extents, center = _get_box(points, axes)
+        volume = extents[0] * extents[1] * extents[2]
+        if best is None or volume < best[0] - 1e-12: best = (volume, axes, extents, center)
+
+    _try_axes(identity_axes)
+
+    if allow_rotation:
+        _try_axes(get_principal_axes(coords))
+
+        # refine with the minimal rectangle across each axis of the best box so far
+        for _ in range(refine_iterations):
+            start_axes = best[1]
+            for fixed in range(3):
+                i, j = [k for k in range(3) if k != fixed]
+                points_2d = [(_dot(p, start_axes[i]), _dot(p, start_axes[j])) for p in points]
+                _try_axes(_rotate_axes(start_axes, fixed, _get_min_area_angle(points_2d)))
+            if best[1] is start_axes: break
+
+    _, axes, extents, center = best
+
+    geometry = MeshGeometry(extents, max(extents[0], extents[1]), extents[2] * 2.0, center)
+    return FittedShape(geometry, center, _get_axes_rotation(axes))
+
+def _get_circumsphere(boundary):
+    if len(boundary) == 0: return (0.0, 0.0, 0.0), -1.0
+
+    a = boundary[0]
+    if len(boundary) == 1: return a, 0.0
+
+    if len(boundary) == 2:
+        center = tuple((a[i] + boundary[1][i]) * 0.5 for i in range(3))
+        return center, math.dist(center, a)
+
+    ab = tuple(boundary[1][i] - a[i] for i in range(3))
+    ac = tuple(boundary[2][i] - a[i] for i in range(3))
+
+    if len(boundary) == 3:
+        normal = _cross(ab, ac)
+        denominator = 2.0 * _dot(normal, normal)
+        if denominator < 1e-30: return None
+
+        # a + ((|ac|^2 (ab x ac) x ab) + |ab|^2 (ac x (ab x ac))) / 2|ab x ac|^2
+        first = _cross(normal, ab)
+        second = _cross(ac, normal)
+        ab2, ac2 = _dot(ab, ab), _dot(ac, ac)
+        offset = tuple((ac2 * first[i] + ab2 * second[i]) / denominator for i in range(3))
+    else:
+        ad = tuple(boundary[3][i] - a[i] for i in range(3))
+        determinant = 2.0 * _dot(ab, _cross(ac, ad))
+        if abs(determinant) < 1e-30: return None
+
+        ab2, ac2, ad2 = _dot(ab, ab), _dot(ac, ac), _dot(ad, ad)
+        cross_cd, cross_db, cross_bc = _cross(ac, ad), _cross(ad, ab), _cross(ab, ac)
+        offset = tuple((ab2 * cross_cd[i] + ac2 * cross_db[i] + ad2 * cross_bc[i]) / determinant for i in range(3))
+
+    center = tuple(a[i] + offset[i] for i in range(3))
+    return center, math.sqrt(_dot(offset, offset))
+
+def _get_min_sphere(points, eps):
+    # iterative move-to-front Welzl, expected linear time on shuffled points
+    points = list(points)
+    random.Random(0).shuffle(points)
+
+    def _outside(sphere, p): return math.dist(sphere[0], p) > sphere[1] + eps
+
+    def _sphere(boundary, fallback):
+        sphere = _get_circumsphere(boundary)
+        return fallback if sphere is None else sphere
+
+    sphere = _get_circumsphere(points[:1])
+    for i in range(1, len(points)):
+        if not _outside(sphere, points[i]): continue
+
+        sphere = _get_circumsphere([points[i]])
+        for j in range(i):
+            if not _outside(sphere, points[j]): continue
+
+            sphere = _get_circumsphere([points[i], points[j]])
+            for k in range(j):
+                if not _outside(sphere, points[k]): continue
+
+                sphere = _sphere([points[i], points[j], points[k]], sphere)
+                for l in range(k):
+                    if not _outside(sphere, points[l]): continue
+                    sphere = _sphere([points[i], points[j], points[k], points[l]], sphere)
+
+    return sphere
+
+def _get_tolerance(points): return 1e-9 * max(max(abs(v) for v in p) for p in points)
+
+def fit_sphere(coords):
+    points = _get_hull_points(coords)
+    center, radius = _get_min_sphere(points, _get_tolerance(points))
+
+    geometry = MeshGeometry((radius, radius, radius), radius, radius * 2.0, center)
+    return FittedShape(geometry, center, [1.0, 0.0, 0.0, 0.0])
+
+def fit_capsule(coords, allow_rotation=True):
+    points = _get_hull_points(coords)
+
+    if allow_rotation:
+        u, v, w = get_principal_axes(coords)
+        axes = (v, w, u)
+    else:
+        axes = identity_axes
+
+    # the smallest circle around the points seen down the capsule axis
+    local = [tuple(_dot(p, axis) for axis in axes) for p in points]
+    (cx, cy, _), radius = _get_min_sphere([(x, y, 0.0) for x, y, _ in local], _get_tolerance(points))
+
+    # the segment just long enough for both caps to contain every point
+    top, bottom = None, None
+    for x, y, z in local:
+        reach = math.sqrt(max(radius * radius - (x - cx) ** 2 - (y - cy) ** 2, 0.0))
+        if top is None or z - reach > top: top = z - reach
+        if bottom is None or z + reach < bottom: bottom = z + reach
+
+    if bottom > top: top = bottom = (top + bottom) * 0.5
+
+    center = _from_axes(axes, (cx, cy, (top + bottom) * 0.5))
+    height = (top - bottom) + radius * 2.0
+
+    geometry = MeshGeometry((radius, radius, height * 0.5), radius, height, center)
+    return FittedShape(geometry, center, _get_axes_rotation(axes))
+
+def fit_shape(coords, collider_type, allow_rotation=True):
+    if collider_type == 'box': return fit_oriented_box(coords, allow_rotation)
+    elif collider_type == 'sphere': return fit_sphere(coords)
+    else: return fit_capsule(coords, allow_rotation)
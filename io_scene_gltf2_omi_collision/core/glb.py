@@ -0,0 +1,196 @@
+# Reading and rewriting binary glTF (.glb) files without loading the BIN chunk.
+#
+# The JSON chunk is parsed into a dict, the BIN chunk and any external buffers
+# are memory-mapped and only the accessor ranges that are actually needed are
+# touched. Writing streams the BIN chunk through unchanged.
+
+import os
+import sys
+import json
+import mmap
+import array
+import base64
+import struct
+
+from .bounds import empty_bounds, get_coordinate_bounds
+
+glb_magic = b'glTF'
+glb_version = 2
+
+chunk_type_json = b'JSON'
+chunk_type_bin = b'BIN\x00'
+
+component_type_float = 5126
+
+copy_block_size = 1 << 20
+
+class GlbError(Exception): pass
+
+def _padded_length(length): return (length + 3) & ~3
+
+class GlbFile:
+
+    def __init__(self, path):
+        self.path = path
+        self.json = None
+
+        self.bin_offset = None
+        self.bin_length = 0
+
+        self._file = open(path, 'rb')
+        self._mmap = None
+        self._external_buffers = {}
+
+        try: self._read_chunks()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_chunks(self):
+        header = self._file.read(12)
+        if len(header) != 12: raise GlbError('{} is too short to be a GLB file'.format(self.path))
+
+        magic, version, length = struct.unpack('<4sII', header)
+
+        if magic != glb_magic: raise GlbError('{} is not a GLB file'.format(self.path))
+        if version != glb_version: raise GlbError('unsupported GLB version {}'.format(version))
+
+        offset = 12
+        while offset + 8 <= length:
+            self._file.seek(offset)
+            chunk_length, chunk_type = struct.unpack('<I4s', self._file.read(8))
+
+            if chunk_type == chunk_type_json and self.json is None:
+                self.json = json.loads(self._file.read(chunk_length).decode('utf-8'))
+            elif chunk_type == chunk_type_bin and self.bin_offset is None:
+                self.bin_offset = offset + 8
+                self.bin_length = chunk_length
+
+            offset += 8 + _padded_length(chunk_length)
+
+        if self.json is None: raise GlbError('{} has no JSON chunk'.format(self.path))
+
+    def close(self):
+        for buffer in self._external_buffers.values():
+            if isinstance(buffer, mmap.mmap): buffer.close()
+        self._external_buffers.clear()
+
+        if self._mmap is not None: self._mmap.close()
+        self._mmap = None
+
+        self._file.close()
+
+    def __enter__(self): return self
+
+    def __exit__(self, *args): self.close()
+
+    def _get_mmap(self):
+        if self._mmap is None: self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def get_bin_chunk(self):
+        # callers release the view, an mmap with views into it cannot be closed
+        if self.bin_offset is None: return memoryview(b'')
+        with memoryview(self._get_mmap()) as view: return view[self.bin_offset:self.bin_offset + self.bin_length]
+
+    def get_buffer(self, buffer_index):
+        buffer = self.json['buffers'][buffer_index]
+        uri = buffer.get('uri', None)
+
+        if uri is None: return self.get_bin_chunk()
+
+        if buffer_index not in self._external_buffers:
+            if uri.startswith('data:'):
+                self._external_buffers[buffer_index] = base64.b64decode(uri.split(',', 1)[1])
+            else:
+                path = os.path.join(os.path.dirname(os.path.abspath(self.path)), uri)
+                with open(path, 'rb') as f:
+                    self._external_buffers[buffer_index] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return memoryview(self._external_buffers[buffer_index])
+
+    def read_accessor_floats(self, accessor_index, component_count=3):
+        accessor = self.json['accessors'][accessor_index]
+
+        if accessor.get('componentType', None) != component_type_float:
+            raise GlbError('accessor {} is not a float accessor'.format(accessor_index))
+        if 'sparse' in accessor:
+            raise GlbError('sparse accessor {} is not supported'.format(accessor_index))
+
+        count = accessor['count']
+        values = array.array('f')
+
+        if 'bufferView' not in accessor:
+            values.frombytes(bytes(count * component_count * 4))
+            return values
+
+        buffer_view = self.json['bufferViews'][accessor['bufferView']]
+
+        element_size = component_count * 4
+        stride = buffer_view.get('byteStride', element_size)
+        start = buffer_view.get('byteOffset', 0) + accessor.get('byteOffset', 0)
+
+        with self.get_buffer(buffer_view['buffer']) as buffer:
+            if stride == element_size:
+                values.frombytes(buffer[start:start + count * element_size])
+            else:
+                for i in range(count):
+                    offset = start + i * stride
+                    values.frombytes(buffer[offset:offset + element_size])
+
+        # glTF is little endian
+        if sys.byteorder != 'little': values.byteswap()
+
+        return values
+
+    def get_accessor_bounds(self, accessor_index):
+        accessor = self.json['accessors'][accessor_index]
+
+        # POSITION accessors are required to carry min and max
+        if 'min' in accessor and 'max' in accessor and 'sparse' not in accessor:
+            mins, maxs = accessor['min'], accessor['max']
+            return tuple((float(mins[i]), float(maxs[i])) for i in range(3))
+
+        return get_coordinate_bounds(self.read_accessor_floats(accessor_index))
+
+    def get_mesh_bounds(self, mesh_index):
+        mesh_bounds = None
+
+        for primitive in self.json['meshes'][mesh_index].get('primitives', []):
+            accessor_index = primitive.get('attributes', {}).get('POSITION', None)
+            if accessor_index is None: continue
+
+            primitive_bounds = self.get_accessor_bounds(accessor_index)
+
+            if mesh_bounds is None: mesh_bounds = primitive_bounds
+            else:
+                mesh_bounds = tuple(
+                    (min(a[0], b[0]), max(a[1], b[1])) for a, b in zip(mesh_bounds, primitive_bounds))
+
+        return mesh_bounds if mesh_bounds is not None else empty_bounds
+
+    def write(self, path, gltf_json=None):
+        gltf_json = self.json if gltf_json is None else gltf_json
+
+        json_bytes = json.dumps(gltf_json, separators=(',', ':')).encode('utf-8')
+        json_bytes += b' ' * (_padded_length(len(json_bytes)) - len(json_bytes))
+
+        bin_padding = _padded_length(self.bin_length) - self.bin_length
+
+        length = 12 + 8 + len(json_bytes)
+        if self.bin_offset is not None: length += 8 + self.bin_length + bin_padding
+
+        with open(path, 'wb') as f:
+            f.write(struct.pack('<4sII', glb_magic, glb_version, length))
+            f.write(struct.pack('<I4s', len(json_bytes), chunk_type_json))
+            f.write(json_bytes)
+
+            if self.bin_offset is not None:
+                f.write(struct.pack('<I4s', self.bin_length, chunk_type_bin))
+
+                # released even when a write fails, so close() can still unmap the file
+                with self.get_bin_chunk() as bin_chunk:
+                    for offset in range(0, len(bin_chunk), copy_block_size):
+                        with bin_chunk[offset:offset + copy_block_size] as block: f.write(block)
+
+                f.write(b'\x00' * bin_padding)
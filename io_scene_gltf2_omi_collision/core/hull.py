@@ -0,0 +1,115 @@
+# Convex hull validation over flat mesh topology buffers.
+#
+# A hull is valid when every edge is manifold (used by exactly two faces),
+# contiguous (both faces wind consistently) and convex.
+
+import array
+import hashlib
+
+from collections import namedtuple, OrderedDict
+
+HullTopology = namedtuple('HullTopology', [
+    'edge_vertices',
+    'loop_vertices',
+    'loop_edges',
+    'polygon_loop_starts',
+    'polygon_loop_totals',
+    'polygon_normals',
+    'polygon_centers'
+])
+
+HullValidation = namedtuple('HullValidation', ['is_valid', 'invalid_edges'])
+
+def is_convex_face_pair(topology, face_a, face_b, tolerance=1e-5):
+    normals = topology.polygon_normals
+    centers = topology.polygon_centers
+
+    a, b = face_a * 3, face_b * 3
+
+    dx = centers[b] - centers[a]
+    dy = centers[b + 1] - centers[a + 1]
+    dz = centers[b + 2] - centers[a + 2]
+
+    # the neighbouring face center must not lie in front of the face plane, this approximates
+    # BMEdge.is_convex, which tests the edge itself, and can differ for nearly flat or non-planar faces
+    distance = normals[a] * dx + normals[a + 1] * dy + normals[a + 2] * dz
+    length = (dx * dx + dy * dy + dz * dz) ** 0.5
+
+    return distance <= tolerance * length
+
+def find_invalid_hull_edges(topology):
+    edge_count = len(topology.edge_vertices) // 2
+
+    loop_vertices = topology.loop_vertices
+    loop_edges = topology.loop_edges
+
+    # the first two faces using each edge and the vertex each face walks the edge from
+    edge_uses = array.array('i', [0]) * edge_count
+    edge_faces = array.array('i', [-1]) * (edge_count * 2)
+    edge_start_vertices = array.array('i', [-1]) * (edge_count * 2)
+
+    for face, loop_start in enumerate(topology.polygon_loop_starts):
+        for loop in range(loop_start, loop_start + topology.polygon_loop_totals[face]):
+            edge = loop_edges[loop]
+            uses = edge_uses[edge]
+
+            if uses < 2:
+                edge_faces[edge * 2 + uses] = face
+                edge_start_vertices[edge * 2 + uses] = loop_vertices[loop]
+
+            edge_uses[edge] = uses + 1
+
+    invalid_edges = []
+
+    for edge in range(edge_count):
+        is_manifold = edge_uses[edge] == 2
+        is_contiguous = is_manifold and edge_start_vertices[edge * 2] != edge_start_vertices[edge * 2 + 1]
+        is_convex = is_contiguous and is_convex_face_pair(topology, edge_faces[edge * 2], edge_faces[edge * 2 + 1])
+
+        if not is_convex: invalid_edges.append(edge)
+
+    return invalid_edges
+
+def validate_hull_topology(topology):
+    invalid_edges = tuple(find_invalid_hull_edges(topology))
+    return HullValidation(len(invalid_edges) == 0, invalid_edges)
+
+def get_hull_fingerprint(coords, edge_vertices, loop_vertices, polygon_loop_starts):
+    digest = hashlib.blake2b(digest_size=16)
+
+    for buffer in [coords, edge_vertices, loop_vertices, polygon_loop_starts]:
+        digest.update(len(buffer).to_bytes(8, 'little'))
+        digest.update(buffer)
+
+    return digest.digest()
+
+class HullValidationCache:
+
+    # least recently used validation results, kept across exports and operator runs
+
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        result = self.entries.get(key, None)
+
+        if result is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+
+        return result
+
+    def put(self, key, result):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.max_size: self.entries.popitem(last=False)
+
+    def clear(self): self.entries.clear()
@@ -0,0 +1,81 @@
+# Substitution of hull and mesh colliders by primitives that cover them closely.
+#
+# Every primitive is fitted around the vertices, so it encloses the mesh, and
+# scored by the fraction of its volume the mesh does not fill. Since the shape
+# contains the mesh this is also the volume of their difference, relative to the
+# shape. The cheapest primitive with an error within the tolerance is used.
+# Meshes only have a volume when they are closed and wound outwards, open or
+# inside out meshes such as room shells are never substituted.
+
+import math
+
+from collections import namedtuple
+
+from .quickhull import HullError, compute_convex_hull, get_convex_hull_volume
+from .fitting import fit_shape
+
+ColliderLod = namedtuple('ColliderLod', ['collider_type', 'fitted_shape', 'error'])
+
+# cheapest to simulate first
+primitive_cost_order = ['sphere', 'capsule', 'box']
+
+def get_primitive_volume(collider_type, geometry):
+    if collider_type == 'box':
+        x, y, z = geometry.extents
+        return 8.0 * x * y * z
+
+    radius = geometry.radius
+    sphere_volume = 4.0 / 3.0 * math.pi * radius ** 3
+    if collider_type == 'sphere': return sphere_volume
+
+    # height spans both caps
+    return sphere_volume + math.pi * radius ** 2 * max(geometry.height - 2.0 * radius, 0.0)
+
+def is_closed_mesh(triangles):
+    # every edge walked exactly once in each direction, by two consistently wound triangles
+    edges = set()
+    for i in range(0, len(triangles), 3):
+        a, b, c = triangles[i], triangles[i + 1], triangles[i + 2]
+        for edge in ((a, b), (b, c), (c, a)):
+            if edge in edges: return False
+            edges.add(edge)
+
+    return len(edges) > 0 and all((b, a) in edges for a, b in edges)
+
+def get_reference_volume(coords, triangles=None):
+    # hulls fill their hull, meshes their own volume, 0 when there is nothing solid to cover
+    try: hull_volume = get_convex_hull_volume(*compute_convex_hull(coords))
+    except HullError: return 0.0
+
+    if triangles is None: return hull_volume
+
+    # the signed volume of an open or inward wound mesh depends on where the origin is
+    if not is_closed_mesh(triangles): return 0.0
+
+    mesh_volume = get_convex_hull_volume(coords, triangles)
+    if mesh_volume <= 0.0: return 0.0
+
+    return min(hull_volume, mesh_volume)
+
+def _score_primitive(coords, collider_type, reference_volume, allow_rotation):
+    fitted_shape = fit_shape(coords, collider_type, allow_rotation)
+
+    volume = get_primitive_volume(collider_type, fitted_shape.geometry)
+    error = 1.0 - reference_volume / volume if volume > 0.0 else 1.0
+
+    return ColliderLod(collider_type, fitted_shape, max(error, 0.0))
+
+def score_primitives(coords, triangles=None, collider_types=primitive_cost_order, allow_rotation=True):
+    reference_volume = get_reference_volume(coords, triangles)
+    return [_score_primitive(coords, t, reference_volume, allow_rotation) for t in collider_types]
+
+def choose_collider_lod(coords, triangles=None, tolerance=0.1, collider_types=primitive_cost_order, allow_rotation=True):
+    reference_volume = get_reference_volume(coords, triangles)
+    if reference_volume <= 0.0: return None
+
+    # the cheaper shapes are tried first, the more expensive fits are skipped once one is close enough
+    for collider_type in collider_types:
+        lod = _score_primitive(coords, collider_type, reference_volume, allow_rotation)
+        if lod.error <= tolerance: return lod
+
+    return None
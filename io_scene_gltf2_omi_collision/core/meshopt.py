@@ -0,0 +1,116 @@
+# Welding and decimation of triangle meshes written as collision geometry.
+#
+# Collision meshes only need positions and triangle indices. Vertices closer
+# than the weld distance are merged on a grid, degenerate and repeated triangles
+# are dropped, and meshes above a triangle budget are decimated by vertex
+# clustering on the finest grid that still keeps within the budget. A mesh is
+# never reduced to nothing, budgets too small for any grid and meshes that weld
+# away completely are left as they are.
+
+def _cluster(coords, triangles, cell_size, origin=(0.0, 0.0, 0.0)):
+    # vertices in the same grid cell become the mean of the cell
+    cells = {}
+    sums = []
+    remap = []
+
+    inverse = 1.0 / cell_size
+    for i in range(0, len(coords), 3):
+        x, y, z = coords[i], coords[i + 1], coords[i + 2]
+        key = (
+            int((x - origin[0]) * inverse + 0.5),
+            int((y - origin[1]) * inverse + 0.5),
+            int((z - origin[2]) * inverse + 0.5)
+        )
+
+        cluster = cells.get(key, None)
+        if cluster is None:
+            cluster = cells[key] = len(sums)
+            sums.append([0.0, 0.0, 0.0, 0])
+
+        total = sums[cluster]
+        total[0] += x
+        total[1] += y
+        total[2] += z
+        total[3] += 1
+
+        remap.append(cluster)
+
+    return remap, sums
+
+def _remap_triangles(triangles, remap):
+    seen = set()
+    indices = []
+
+    for i in range(0, len(triangles), 3):
+        a, b, c = remap[triangles[i]], remap[triangles[i + 1]], remap[triangles[i + 2]]
+        if a == b or b == c or c == a: continue
+
+        # the same triangle in any rotation, opposite windings are kept apart
+        smallest = min(a, b, c)
+        if smallest == b: a, b, c = b, c, a
+        elif smallest == c: a, b, c = c, a, b
+
+        if (a, b, c) in seen: continue
+        seen.add((a, b, c))
+
+        indices.extend((a, b, c))
+
+    return indices
+
+def _compact(sums, indices):
+    used = {}
+    coords = []
+
+    for i in indices:
+        if i in used: continue
+        used[i] = len(used)
+        x, y, z, count = sums[i]
+        coords.extend((x / count, y / count, z / count))
+
+    return coords, [used[i] for i in indices]
+
+def _get_origin(coords):
+    return tuple(min(coords[axis::3]) for axis in range(3))
+
+def weld_vertices(coords, triangles, distance=1e-4):
+    if len(coords) == 0: return [], []
+
+    remap, sums = _cluster(coords, triangles, max(distance, 1e-12), _get_origin(coords))
+    return _compact(sums, _remap_triangles(triangles, remap))
+
+def decimate_triangles(coords, triangles, max_triangles):
+    if len(triangles) // 3 <= max_triangles or len(coords) == 0: return list(coords), list(triangles)
+
+    origin = _get_origin(coords)
+    size = max(max(coords[axis::3]) - origin[axis] for axis in range(3))
+    if size <= 0.0: return list(coords), list(triangles)
+
+    # the triangle count grows with the grid resolution, search for the finest grid within budget
+    best = None
+    low, high = 1, 1 << 12
+    while low <= high:
+        resolution = (low + high) // 2
+
+        remap, sums = _cluster(coords, triangles, size / resolution, origin)
+        indices = _remap_triangles(triangles, remap)
+
+        if len(indices) // 3 <= max_triangles:
+            best = (sums, indices)
+            low = resolution + 1
+        else:
+            high = resolution - 1
+
+    # the coarsest grids collapse every triangle
+    if best is None or len(best[1]) == 0: return list(coords), list(triangles)
+
+    return _compact(*best)
+
+def optimize_collision_mesh(coords, triangles, weld_distance=1e-4, max_triangles=None):
+    welded_coords, welded_indices = weld_vertices(coords, triangles, weld_distance)
+    if len(welded_indices) > 0: coords, indices = welded_coords, welded_indices
+    else: coords, indices = list(coords), list(triangles)
+
+    if max_triangles is not None and max_triangles > 0:
+        coords, indices = decimate_triangles(coords, indices, max_triangles)
+
+    return coords, indices
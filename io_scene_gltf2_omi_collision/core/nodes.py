@@ -0,0 +1,154 @@
+# Node graph bookkeeping and node JSON rewriting for OMI_collider nodes.
+
+from .shapes import glTF_extension_name, mesh_collider_types
+from .transforms import quaternion_multiply, quaternion_rotate_vector, from_gltf_rotation, to_gltf_rotation
+
+class NodeGraph:
+
+    # node -> index and child -> parent lookups over glTF.nodes, built once and
+    # kept up to date as nodes are added, works on any objects with the
+    # nodes/children/scenes attributes of the exporter's glTF classes
+
+    def __init__(self, glTF):
+        self.glTF = glTF
+
+        self.node_indices = {id(node): index for index, node in enumerate(glTF.nodes)}
+
+        self.parents = {}
+        for node in glTF.nodes:
+            for position, child_index in enumerate(node.children or []):
+                self.parents[child_index] = (node, position)
+
+        self.scene_slots = {}
+        for scene in glTF.scenes or []:
+            for position, node_index in enumerate(scene.nodes or []):
+                self.scene_slots.setdefault(node_index, []).append((scene, position))
+
+    def index(self, node): return self.node_indices[id(node)]
+
+    def append(self, node):
+        node_index = len(self.glTF.nodes)
+
+        self.glTF.nodes.append(node)
+        self.node_indices[id(node)] = node_index
+
+        return node_index
+
+    def insert_parent(self, node, parent_node):
+        node_index = self.index(node)
+        parent_node_index = self.append(parent_node)
+
+        parent = self.parents.pop(node_index, None)
+        if parent is not None:
+            grandparent_node, position = parent
+            grandparent_node.children[position] = parent_node_index
+            self.parents[parent_node_index] = parent
+
+        scene_slots = self.scene_slots.pop(node_index, None)
+        if scene_slots is not None:
+            for scene, position in scene_slots: scene.nodes[position] = parent_node_index
+            self.scene_slots[parent_node_index] = scene_slots
+
+        parent_node.children = [node_index]
+        self.parents[node_index] = (parent_node, 0)
+
+        return parent_node_index
+
+def modify_node_json(node_result):
+    mesh_id = node_result.get('mesh', None)
+    
+    if 'mesh' in node_result: del node_result['mesh']
+
+    extension_omi_collider = node_result.get('extensions', {}).get(glTF_extension_name, None)
+    
+    if extension_omi_collider is not None and type(extension_omi_collider) is dict:
+        collider_type = extension_omi_collider.get('type', None)
+        
+        if collider_type in mesh_collider_types:
+            extension_omi_collider['mesh'] = mesh_id
+
+    return node_result
+
+def get_node_parents(gltf_json):
+    parents = {}
+
+    for node_index, node in enumerate(gltf_json.get('nodes', [])):
+        for child_index in node.get('children', []): parents[child_index] = node_index
+
+    return parents
+
+def get_collider_source_mesh(gltf_json, node_index, parents):
+    nodes = gltf_json['nodes']
+    node = nodes[node_index]
+
+    if 'mesh' in node: return node['mesh']
+
+    extension_data = node.get('extensions', {}).get(glTF_extension_name, {})
+    if extension_data.get('mesh', None) is not None: return extension_data['mesh']
+
+    # display mesh nodes carry the mesh for their single collider child
+    parent_index = parents.get(node_index, None)
+    if parent_index is not None:
+        parent = nodes[parent_index]
+        if parent.get('children', []) == [node_index] and 'mesh' in parent: return parent['mesh']
+
+    return None
+
+def translate_node_json_origin(gltf_json, node_index, offset):
+    # moves the node origin by offset, given in the node's local space, and
+    # compensates the children so they stay where they are
+    nodes = gltf_json['nodes']
+    node = nodes[node_index]
+
+    if 'matrix' in node:
+        m = node['matrix']
+        for row in range(3): m[12 + row] += m[row] * offset[0] + m[4 + row] * offset[1] + m[8 + row] * offset[2]
+    else:
+        scale = node.get('scale', [1, 1, 1])
+        scaled_offset = [offset[i] * scale[i] for i in range(3)]
+        delta = quaternion_rotate_vector(from_gltf_rotation(node.get('rotation', None)), scaled_offset)
+
+        translation = node.get('translation', [0, 0, 0])
+        node['translation'] = [translation[i] + delta[i] for i in range(3)]
+
+    for child_index in node.get('children', []):
+        child = nodes[child_index]
+
+        if 'matrix' in child:
+            for row in range(3): child['matrix'][12 + row] -= offset[row]
+        else:
+            translation = child.get('translation', [0, 0, 0])
+            child['translation'] = [translation[i] - offset[i] for i in range(3)]
+
+def translate_node_json(node, offset):
+    # moves the node by offset, given in its parent's space, the children move along
+    if 'matrix' in node:
+        for row in range(3): node['matrix'][12 + row] += offset[row]
+    else:
+        translation = node.get('translation', [0, 0, 0])
+        node['translation'] = [translation[i] + offset[i] for i in range(3)]
+
+def apply_offsets_to_node_json(node, location=None, rotation=None, scale=None):
+    # rotation is a [w, x, y, z] quaternion, composed the same way the exporter applies collider offsets
+    if location is not None:
+        translation = node.get('translation', [0, 0, 0])
+        node['translation'] = [translation[i] + location[i] for i in range(3)]
+
+    if rotation is not None:
+        node['rotation'] = to_gltf_rotation(quaternion_multiply(from_gltf_rotation(node.get('rotation', None)), rotation))
+
+    if scale is not None:
+        node_scale = node.get('scale', [1, 1, 1])
+        node['scale'] = [node_scale[i] * scale[i] for i in range(3)]
+
+def update_extensions_used(gltf_json):
+    is_used = any(glTF_extension_name in node.get('extensions', {}) for node in gltf_json.get('nodes', []))
+
+    extensions_used = gltf_json.get('extensionsUsed', [])
+
+    if is_used and glTF_extension_name not in extensions_used:
+        gltf_json['extensionsUsed'] = extensions_used + [glTF_extension_name]
+    elif not is_used and glTF_extension_name in extensions_used:
+        extensions_used = [name for name in extensions_used if name != glTF_extension_name]
+        if len(extensions_used) > 0: gltf_json['extensionsUsed'] = extensions_used
+        else: del gltf_json['extensionsUsed']
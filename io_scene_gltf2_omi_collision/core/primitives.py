@@ -0,0 +1,71 @@
+# Vertex and face lists for the primitive collider shapes, centered on the origin.
+#
+# Coordinates are flat [x0, y0, z0, x1, ...] lists and faces are tuples of vertex
+# indices wound counter-clockwise when seen from outside. Capsules and spheres
+# are built around the z axis.
+
+import math
+
+def get_box_geometry(extents):
+    x, y, z = extents
+
+    coords = [
+        -x, -y, -z,   x, -y, -z,   x, y, -z,   -x, y, -z,
+        -x, -y, z,    x, -y, z,    x, y, z,    -x, y, z
+    ]
+
+    faces = [(0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
+
+    return coords, faces
+
+def get_lathe_geometry(profile, segments):
+    # profile is a list of (ring radius, z) pairs from the top pole to the bottom pole
+    ring_profile = profile[1:-1]
+
+    coords = [0.0, 0.0, profile[0][1]]
+    for ring_radius, z in ring_profile:
+        for segment in range(segments):
+            angle = 2 * math.pi * segment / segments
+            coords.extend([ring_radius * math.cos(angle), ring_radius * math.sin(angle), z])
+    coords.extend([0.0, 0.0, profile[-1][1]])
+
+    bottom_pole = 1 + len(ring_profile) * segments
+    last_ring = 1 + (len(ring_profile) - 1) * segments
+
+    faces = []
+    for segment in range(segments):
+        next_segment = (segment + 1) % segments
+
+        faces.append((0, 1 + segment, 1 + next_segment))
+
+        for ring in range(len(ring_profile) - 1):
+            upper = 1 + ring * segments
+            lower = upper + segments
+            faces.append((upper + segment, lower + segment, lower + next_segment, upper + next_segment))
+
+        faces.append((bottom_pole, last_ring + next_segment, last_ring + segment))
+
+    return coords, faces
+
+def get_sphere_geometry(radius, segments=24, rings=12):
+    profile = []
+    for ring in range(rings + 1):
+        angle = math.pi * ring / rings
+        profile.append((radius * math.sin(angle), radius * math.cos(angle)))
+
+    return get_lathe_geometry(profile, segments)
+
+def get_capsule_geometry(radius, height, segments=24, rings=12):
+    # height spans both caps, like the height written for capsule colliders
+    half_length = max(height * 0.5 - radius, 0.0)
+    half_rings = max(rings // 2, 1)
+
+    profile = []
+    for ring in range(half_rings + 1):
+        angle = 0.5 * math.pi * ring / half_rings
+        profile.append((radius * math.sin(angle), radius * math.cos(angle) + half_length))
+    for ring in range(half_rings + 1):
+        angle = 0.5 * math.pi + 0.5 * math.pi * ring / half_rings
+        profile.append((radius * math.sin(angle), radius * math.cos(angle) - half_length))
+
+    return get_lathe_geometry(profile, segments)
@@ -0,0 +1,247 @@
+# Convex hull construction with quickhull, O(n log n) on typical input.
+#
+# Input coordinates are flat [x0, y0, z0, x1, ...] sequences. The result is a flat
+# coordinate list of the hull vertices and a flat list of triangle indices into
+# it, wound counter-clockwise when seen from outside.
+
+import math
+
+try: import numpy as np
+except ImportError: np = None
+
+class HullError(Exception): pass
+
+def _sub(a, b): return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+def _dot(a, b): return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+def _cross(a, b):
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0]
+    )
+
+class _Face:
+
+    __slots__ = ['vertices', 'normal', 'offset', 'outside', 'is_alive']
+
+    def __init__(self, points, a, b, c):
+        self.vertices = (a, b, c)
+
+        normal = _cross(_sub(points[b], points[a]), _sub(points[c], points[a]))
+        length = math.sqrt(_dot(normal, normal))
+        if length > 0.0: normal = (normal[0] / length, normal[1] / length, normal[2] / length)
+
+        self.normal = normal
+        self.offset = _dot(normal, points[a])
+        self.outside = []
+        self.is_alive = True
+
+    def distance(self, point): return _dot(self.normal, point) - self.offset
+
+    def edges(self):
+        a, b, c = self.vertices
+        return ((a, b), (b, c), (c, a))
+
+def _get_points(coords):
+    # unique points, exact duplicates would only produce degenerate faces
+    return list(dict.fromkeys(
+        (float(coords[i]), float(coords[i + 1]), float(coords[i + 2])) for i in range(0, len(coords) - 2, 3)))
+
+def _get_tolerance(points, tolerance):
+    scale = max(max(abs(v) for v in p) for p in points)
+    return max(tolerance * scale, 1e-12)
+
+def _get_initial_simplex(points, eps):
+    spreads = []
+    for axis in range(3):
+        low = min(range(len(points)), key=lambda i: points[i][axis])
+        high = max(range(len(points)), key=lambda i: points[i][axis])
+        spreads.append((points[high][axis] - points[low][axis], low, high))
+
+    spread, i0, i1 = max(spreads)
+    if spread <= eps: raise HullError('points are coincident')
+
+    direction = _sub(points[i1], points[i0])
+
+    def _line_distance(i): return _dot(*[_cross(direction, _sub(points[i], points[i0]))] * 2)
+
+    i2 = max(range(len(points)), key=_line_distance)
+    if math.sqrt(_line_distance(i2)) <= eps * math.sqrt(_dot(direction, direction)): raise HullError('points are collinear')
+
+    plane = _Face(points, i0, i1, i2)
+
+    i3 = max(range(len(points)), key=lambda i: abs(plane.distance(points[i])))
+    if abs(plane.distance(points[i3])) <= eps: raise HullError('points are coplanar')
+
+    return i0, i1, i2, i3
+
+def _build_hull(points, eps):
+    simplex = _get_initial_simplex(points, eps)
+    i0, i1, i2, i3 = simplex
+
+    centroid = tuple(sum(points[i][axis] for i in simplex) * 0.25 for axis in range(3))
+
+    faces = []
+    edge_faces = {}
+
+    def _add_face(a, b, c):
+        face = _Face(points, a, b, c)
+        faces.append(face)
+        for edge in face.edges(): edge_faces[edge] = face
+        return face
+
+    for a, b, c in [(i0, i1, i2), (i0, i3, i1), (i1, i3, i2), (i2, i3, i0)]:
+        if _Face(points, a, b, c).distance(centroid) > 0.0: a, b = b, a
+        _add_face(a, b, c)
+
+    def _assign(candidates, point_indices):
+        for i in point_indices:
+            point = points[i]
+            for face in candidates:
+                if face.distance(point) > eps:
+                    face.outside.append(i)
+                    break
+
+    simplex_set = set(simplex)
+    _assign(faces, [i for i in range(len(points)) if i not in simplex_set])
+
+    stack = [face for face in faces if len(face.outside) > 0]
+
+    while len(stack) > 0:
+        face = stack.pop()
+        if not face.is_alive or len(face.outside) == 0: continue
+
+        apex = max(face.outside, key=lambda i: face.distance(points[i]))
+        apex_point = points[apex]
+
+        visible = [face]
+        visible_set = {id(face)}
+        horizon = []
+
+        position = 0
+        while position < len(visible):
+            current = visible[position]
+            position += 1
+
+            for a, b in current.edges():
+                neighbour = edge_faces[(b, a)]
+                if id(neighbour) in visible_set: continue
+
+                if neighbour.distance(apex_point) > eps:
+                    visible.append(neighbour)
+                    visible_set.add(id(neighbour))
+                else:
+                    horizon.append((a, b))
+
+        orphans = []
+        for current in visible:
+            current.is_alive = False
+            orphans.extend(i for i in current.outside if i != apex)
+            for edge in current.edges():
+                if edge_faces.get(edge, None) is current: del edge_faces[edge]
+
+        new_faces = [_add_face(a, b, apex) for a, b in horizon]
+
+        _assign(new_faces, orphans)
+        stack.extend(f for f in new_faces if len(f.outside) > 0)
+
+    return [face.vertices for face in faces if face.is_alive]
+
+def _compact(points, triangles):
+    remap = {}
+    coords = []
+    indices = []
+
+    for triangle in triangles:
+        for i in triangle:
+            if i not in remap:
+                remap[i] = len(remap)
+                coords.extend(points[i])
+            indices.append(remap[i])
+
+    return coords, indices
+
+def _get_directions(count):
+    # roughly uniform directions on the unit sphere
+    golden_angle = math.pi * (3.0 - math.sqrt(5.0))
+
+    directions = []
+    for i in range(count):
+        z = 1.0 - 2.0 * (i + 0.5) / count
+        r = math.sqrt(max(0.0, 1.0 - z * z))
+        directions.append((r * math.cos(golden_angle * i), r * math.sin(golden_angle * i), z))
+
+    return directions
+
+def _get_support_points(points, directions):
+    if np is not None:
+        support = np.asarray(points).dot(np.asarray(directions).T).argmax(axis=0)
+        indices = sorted(set(int(i) for i in support))
+    else:
+        indices = sorted(set(max(range(len(points)), key=lambda i: _dot(points[i], d)) for d in directions))
+
+    return [points[i] for i in indices]
+
+def _discard_interior_points(points, eps):
+    # Akl-Toussaint heuristic, points inside the hull of a few extreme points can never be hull vertices
+    if np is None or len(points) < 1000: return points
+
+    extreme_points = _get_support_points(points, _get_directions(32))
+
+    try: triangles = _build_hull(extreme_points, eps)
+    except HullError: return points
+
+    faces = [_Face(extreme_points, *t) for t in triangles]
+    normals = np.array([f.normal for f in faces])
+    offsets = np.array([f.offset for f in faces])
+
+    distances = np.asarray(points).dot(normals.T) - offsets
+    keep = (distances > -eps).any(axis=1)
+
+    return [points[i] for i in np.nonzero(keep)[0]]
+
+def compute_convex_hull(coords, max_vertices=None, tolerance=1e-7):
+    points = _get_points(coords)
+    if len(points) < 4: raise HullError('a hull needs at least four distinct points')
+
+    eps = _get_tolerance(points, tolerance)
+
+    points = _discard_interior_points(points, eps)
+    triangles = _build_hull(points, eps)
+
+    if max_vertices is not None:
+        hull_coords, hull_triangles = _compact(points, triangles)
+
+        if len(hull_coords) // 3 > max_vertices:
+            # keep the hull vertices furthest out in evenly spread directions
+            hull_points = [tuple(hull_coords[i:i + 3]) for i in range(0, len(hull_coords), 3)]
+            points = _get_support_points(hull_points, _get_directions(max(max_vertices, 4)))
+
+            # flat regions repeat support points, so sample more directions while within budget
+            for factor in (2, 4, 8):
+                denser_points = _get_support_points(hull_points, _get_directions(max(max_vertices, 4) * factor))
+                if len(denser_points) > max_vertices: break
+                points = denser_points
+
+            triangles = _build_hull(points, eps)
+
+    return _compact(points, triangles)
+
+def get_convex_hull_planes(coords, triangles):
+    # outward unit normals and plane offsets of the hull triangles, a point p is inside when
+    # dot(normal, p) <= offset for every plane
+    points = [tuple(coords[i:i + 3]) for i in range(0, len(coords), 3)]
+    faces = [_Face(points, *triangles[i:i + 3]) for i in range(0, len(triangles), 3)]
+
+    return [f.normal for f in faces], [f.offset for f in faces]
+
+def get_convex_hull_volume(coords, triangles):
+    volume = 0.0
+
+    for i in range(0, len(triangles), 3):
+        a, b, c = (triangles[i + j] * 3 for j in range(3))
+        volume += _dot(coords[a:a + 3], _cross(coords[b:b + 3], coords[c:c + 3]))
+
+    return volume / 6.0
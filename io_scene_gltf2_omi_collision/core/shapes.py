@@ -0,0 +1,27 @@
+# OMI_collider extension names and the extension data written for each collider type.
+
+glTF_extension_name = 'OMI_collider'
+
+collider_type_names = ['box', 'sphere', 'capsule', 'hull', 'mesh', 'compound']
+
+primitive_collider_types = ['box', 'sphere', 'capsule']
+
+mesh_collider_types = ['hull', 'mesh']
+
+def get_collider_extension_data(collider_type, geometry=None, is_trigger=False, mesh_index=None):
+    extension_data = {}
+
+    extension_data['type'] = collider_type
+    if is_trigger: extension_data['isTrigger'] = True
+
+    if collider_type == 'box':
+        extension_data['extents'] = tuple(geometry.extents)
+    elif collider_type == 'sphere':
+        extension_data['radius'] = geometry.radius
+    elif collider_type == 'capsule':
+        extension_data['radius'] = geometry.radius
+        extension_data['height'] = geometry.height
+    elif collider_type in mesh_collider_types and mesh_index is not None:
+        extension_data['mesh'] = mesh_index
+
+    return extension_data
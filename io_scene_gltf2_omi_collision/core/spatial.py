@@ -0,0 +1,184 @@
+# Bounding volume hierarchy over axis aligned boxes and collider overlap analysis.
+#
+# Boxes are ((x_min, y_min, z_min), (x_max, y_max, z_max)) tuples. The tree is
+# built top down by splitting at the median center along the longest axis, so
+# it is balanced and every query visits O(log n) nodes plus the boxes it hits.
+# Boxes that only touch count as overlapping.
+#
+# A collider is only contained when its box lies inside the actual shape of a
+# box, sphere or capsule collider. Meshes, hulls and compounds are never
+# containers, a room shell or terrain is hollow or open where props rest on it.
+
+from collections import namedtuple
+
+OverlapReport = namedtuple('OverlapReport', ['contained', 'overlapping', 'isolated_triggers'])
+
+# a primitive's geometry in its local space, where capsules lie along z, and the matrix into that space
+ColliderShape = namedtuple('ColliderShape', ['collider_type', 'geometry', 'world_to_local'])
+
+leaf_size = 4
+
+def _overlaps(a_min, a_max, b_min, b_max):
+    return (
+        a_min[0] <= b_max[0] and b_min[0] <= a_max[0] and
+        a_min[1] <= b_max[1] and b_min[1] <= a_max[1] and
+        a_min[2] <= b_max[2] and b_min[2] <= a_max[2])
+
+def _contains(outer_min, outer_max, inner_min, inner_max, tolerance):
+    return all(
+        outer_min[axis] - tolerance <= inner_min[axis] and inner_max[axis] <= outer_max[axis] + tolerance
+        for axis in range(3))
+
+def _transform_point(matrix, point):
+    return tuple(sum(matrix[row][i] * point[i] for i in range(3)) + matrix[row][3] for row in range(3))
+
+def _is_point_in_shape(shape, point, tolerance):
+    x, y, z = _transform_point(shape.world_to_local, point)
+    geometry = shape.geometry
+
+    if shape.collider_type == 'box': return all(abs(v) <= e + tolerance for v, e in zip((x, y, z), geometry.extents))
+
+    radius = geometry.radius
+    if shape.collider_type == 'capsule':
+        half_segment = max(geometry.height * 0.5 - radius, 0.0)
+        z = max(abs(z) - half_segment, 0.0)
+
+    return x * x + y * y + z * z <= (radius + tolerance) ** 2
+
+def _shape_contains(shape, inner_min, inner_max, tolerance):
+    # primitives are convex, a box whose corners are inside is inside
+    if shape is None or shape.collider_type not in ('box', 'sphere', 'capsule'): return False
+
+    return all(
+        _is_point_in_shape(shape, (x, y, z), tolerance)
+        for x in (inner_min[0], inner_max[0]) for y in (inner_min[1], inner_max[1]) for z in (inner_min[2], inner_max[2]))
+
+def _get_volume(box_min, box_max):
+    return max(box_max[0] - box_min[0], 0.0) * max(box_max[1] - box_min[1], 0.0) * max(box_max[2] - box_min[2], 0.0)
+
+def _get_intersection_volume(a_min, a_max, b_min, b_max):
+    return _get_volume(
+        tuple(max(a_min[axis], b_min[axis]) for axis in range(3)),
+        tuple(min(a_max[axis], b_max[axis]) for axis in range(3)))
+
+class BoundsTree:
+
+    def __init__(self, boxes):
+        self.boxes = list(boxes)
+
+        # flat node arrays, leaves have no children and cover order[start:end]
+        self.node_min = []
+        self.node_max = []
+        self.node_children = []
+        self.node_ranges = []
+
+        self.order = list(range(len(self.boxes)))
+        if len(self.boxes) > 0: self._build()
+
+    def _add_node(self, start, end):
+        boxes = self.boxes
+        indices = self.order[start:end]
+
+        self.node_min.append(tuple(min(boxes[i][0][axis] for i in indices) for axis in range(3)))
+        self.node_max.append(tuple(max(boxes[i][1][axis] for i in indices) for axis in range(3)))
+        self.node_children.append(None)
+        self.node_ranges.append((start, end))
+
+        return len(self.node_ranges) - 1
+
+    def _build(self):
+        boxes = self.boxes
+        centers = [tuple((box_min[axis] + box_max[axis]) * 0.5 for axis in range(3)) for box_min, box_max in boxes]
+
+        stack = [self._add_node(0, len(boxes))]
+        while len(stack) > 0:
+            node = stack.pop()
+            start, end = self.node_ranges[node]
+            if end - start <= leaf_size: continue
+
+            indices = self.order[start:end]
+            spans = [max(centers[i][axis] for i in indices) - min(centers[i][axis] for i in indices) for axis in range(3)]
+            axis = spans.index(max(spans))
+
+            indices.sort(key=lambda i: centers[i][axis])
+            self.order[start:end] = indices
+
+            middle = (start + end) // 2
+            children = (self._add_node(start, middle), self._add_node(middle, end))
+            self.node_children[node] = children
+            stack.extend(children)
+
+    def query(self, box_min, box_max):
+        hits = []
+        if len(self.boxes) == 0: return hits
+
+        boxes = self.boxes
+        stack = [0]
+        while len(stack) > 0:
+            node = stack.pop()
+            if not _overlaps(self.node_min[node], self.node_max[node], box_min, box_max): continue
+
+            children = self.node_children[node]
+            if children is not None:
+                stack.extend(children)
+                continue
+
+            start, end = self.node_ranges[node]
+            for i in self.order[start:end]:
+                if _overlaps(boxes[i][0], boxes[i][1], box_min, box_max): hits.append(i)
+
+        return hits
+
+    def find_overlapping_pairs(self):
+        for i, (box_min, box_max) in enumerate(self.boxes):
+            for j in self.query(box_min, box_max):
+                if j > i: yield i, j
+
+def analyze_overlaps(boxes, is_trigger=None, overlap_ratio=0.9, tolerance=1e-6, shapes=None):
+    # contained lists (index, container index), overlapping lists (index, index, ratio)
+    # of boxes overlapping by at least overlap_ratio of the smaller one. Without shapes
+    # every box is an axis aligned box collider, a None shape is never a container
+    tree = boxes if isinstance(boxes, BoundsTree) else BoundsTree(boxes)
+    boxes = tree.boxes
+
+    if is_trigger is None: is_trigger = [False] * len(boxes)
+
+    contained = {}
+    overlapping = []
+    is_touching = [False] * len(boxes)
+
+    for i, j in tree.find_overlapping_pairs():
+        is_touching[i] = is_touching[j] = True
+
+        # a collider inside a trigger still collides, only the same kind can be redundant
+        if is_trigger[i] != is_trigger[j]: continue
+
+        (i_min, i_max), (j_min, j_max) = boxes[i], boxes[j]
+
+        # of two identical boxes only the later one is redundant
+        i_contains = _contains(i_min, i_max, j_min, j_max, tolerance)
+        j_contains = _contains(j_min, j_max, i_min, i_max, tolerance)
+
+        if shapes is not None:
+            i_contains = i_contains and _shape_contains(shapes[i], j_min, j_max, tolerance)
+            j_contains = j_contains and _shape_contains(shapes[j], i_min, i_max, tolerance)
+
+        if i_contains:
+            contained.setdefault(j, i)
+            continue
+        if j_contains:
+            contained.setdefault(i, j)
+            continue
+
+        # a box inside the bounds of a shape that does not hold it, a prop in a room, is no overlap either
+        if _contains(i_min, i_max, j_min, j_max, tolerance) or _contains(j_min, j_max, i_min, i_max, tolerance): continue
+
+        smallest_volume = min(_get_volume(i_min, i_max), _get_volume(j_min, j_max))
+        if smallest_volume <= 0.0: continue
+
+        ratio = _get_intersection_volume(i_min, i_max, j_min, j_max) / smallest_volume
+        if ratio >= overlap_ratio: overlapping.append((i, j, ratio))
+
+    isolated_triggers = [i for i in range(len(boxes)) if is_trigger[i] and not is_touching[i]]
+
+    return OverlapReport(sorted(contained.items()), overlapping, isolated_triggers)
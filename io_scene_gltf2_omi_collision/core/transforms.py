@@ -0,0 +1,121 @@
+# Quaternion and node transform helpers on plain sequences.
+#
+# Quaternions are [w, x, y, z] like mathutils, node rotations in glTF JSON are
+# [x, y, z, w] and are converted at the edges. The batched versions work on
+# (N, 3) and (N, 4) rows, vectorized with NumPy when it is available.
+
+import math
+
+try: import numpy as np
+except ImportError: np = None
+
+def quaternion_multiply(a, b):
+    aw, ax, ay, az = a
+    bw, bx, by, bz = b
+
+    return [
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw
+    ]
+
+def quaternion_rotate_vector(q, v):
+    w, x, y, z = q
+    vx, vy, vz = v
+
+    # v + 2w(q x v) + 2q x (q x v)
+    cx = y * vz - z * vy
+    cy = z * vx - x * vz
+    cz = x * vy - y * vx
+
+    ccx = y * cz - z * cy
+    ccy = z * cx - x * cz
+    ccz = x * cy - y * cx
+
+    return [
+        vx + 2 * (w * cx + ccx),
+        vy + 2 * (w * cy + ccy),
+        vz + 2 * (w * cz + ccz)
+    ]
+
+def euler_to_quaternion(euler):
+    # XYZ euler angles in radians, matching Blender's default rotation mode
+    x, y, z = euler
+
+    cx, sx = math.cos(x * 0.5), math.sin(x * 0.5)
+    cy, sy = math.cos(y * 0.5), math.sin(y * 0.5)
+    cz, sz = math.cos(z * 0.5), math.sin(z * 0.5)
+
+    return [
+        cx * cy * cz + sx * sy * sz,
+        sx * cy * cz - cx * sy * sz,
+        cx * sy * cz + sx * cy * sz,
+        cx * cy * sz - sx * sy * cz
+    ]
+
+def from_gltf_rotation(rotation):
+    if rotation is None: return [1.0, 0.0, 0.0, 0.0]
+    x, y, z, w = rotation
+    return [w, x, y, z]
+
+def to_gltf_rotation(quaternion):
+    w, x, y, z = quaternion
+    return [x, y, z, w]
+
+def quaternion_multiply_many(a, b):
+    if np is None: return [quaternion_multiply(qa, qb) for qa, qb in zip(a, b)]
+
+    aw, ax, ay, az = np.asarray(a, dtype=float).reshape(-1, 4).T
+    bw, bx, by, bz = np.asarray(b, dtype=float).reshape(-1, 4).T
+
+    return np.stack([
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw
+    ], axis=1)
+
+def quaternion_rotate_vectors(q, v):
+    if np is None: return [quaternion_rotate_vector(qi, vi) for qi, vi in zip(q, v)]
+
+    q = np.asarray(q, dtype=float).reshape(-1, 4)
+    v = np.asarray(v, dtype=float).reshape(-1, 3)
+
+    w = q[:, :1]
+    c = np.cross(q[:, 1:], v)
+
+    return v + 2 * (w * c + np.cross(q[:, 1:], c))
+
+def apply_collider_corrections(
+        translations, rotations, scales, mesh_centers, fit_centers, fit_rotations,
+        offset_translations, offset_rotations, offset_scales):
+    # per node, all in the exported frame with identity values where a node has no correction:
+    #   T' = T + mesh center + R (S * fit center) + offset translation
+    #   R' = R @ fit rotation @ offset rotation
+    #   S' = S * offset scale
+    if np is None:
+        results = []
+        for t, r, s, c, fc, fr, ot, orot, os in zip(
+                translations, rotations, scales, mesh_centers, fit_centers, fit_rotations,
+                offset_translations, offset_rotations, offset_scales):
+            fit_offset = quaternion_rotate_vector(r, [s[i] * fc[i] for i in range(3)])
+            results.append((
+                [t[i] + c[i] + fit_offset[i] + ot[i] for i in range(3)],
+                quaternion_multiply(quaternion_multiply(r, fr), orot),
+                [s[i] * os[i] for i in range(3)]))
+
+        return [r[0] for r in results], [r[1] for r in results], [r[2] for r in results]
+
+    translations = np.asarray(translations, dtype=float).reshape(-1, 3)
+    rotations = np.asarray(rotations, dtype=float).reshape(-1, 4)
+    scales = np.asarray(scales, dtype=float).reshape(-1, 3)
+
+    fit_offsets = quaternion_rotate_vectors(rotations, scales * np.asarray(fit_centers, dtype=float).reshape(-1, 3))
+
+    translations = translations + np.asarray(mesh_centers, dtype=float).reshape(-1, 3) + fit_offsets
+    translations = translations + np.asarray(offset_translations, dtype=float).reshape(-1, 3)
+    rotations = quaternion_multiply_many(quaternion_multiply_many(rotations, fit_rotations), offset_rotations)
+    scales = scales * np.asarray(offset_scales, dtype=float).reshape(-1, 3)
+
+    return translations, rotations, scales
@@ -0,0 +1,185 @@
+# Viewport overlay drawing the exported collider shapes as wireframes.
+#
+# Line coordinates are kept per object and concatenated into one vertex buffer
+# per collider type, so a redraw is one draw call per type. Only objects marked
+# dirty are recomputed and only the buffers of their types are rebuilt. Shapes
+# are computed by a callback from the add-on, which places them with the same
+# math as the exporter and may evaluate modifiers. That happens in refresh(),
+# called when the scene changes, the draw callback only uploads and draws the
+# cached lines. In background mode the overlay never draws.
+
+import math
+
+import bpy
+
+try:
+    import gpu
+    from gpu_extras.batch import batch_for_shader
+except ImportError:
+    gpu = None
+
+shape_colors = {
+    'box': (0.2, 0.8, 1.0, 1.0),
+    'sphere': (1.0, 0.6, 0.1, 1.0),
+    'capsule': (0.4, 1.0, 0.4, 1.0)
+}
+
+circle_segments = 32
+
+def _get_arc_lines(center, u, v, radius, start, end, segments):
+    lines = []
+    previous = None
+
+    for i in range(segments + 1):
+        angle = start + (end - start) * i / segments
+        c, s = math.cos(angle) * radius, math.sin(angle) * radius
+        point = tuple(center[k] + u[k] * c + v[k] * s for k in range(3))
+
+        if previous is not None: lines.extend((previous, point))
+        previous = point
+
+    return lines
+
+def get_box_lines(extents):
+    x, y, z = extents
+    corners = [(sx * x, sy * y, sz * z) for sx in (-1, 1) for sy in (-1, 1) for sz in (-1, 1)]
+
+    # corners differing in exactly one sign share an edge
+    return [
+        point for a in range(8) for b in range(a + 1, 8) if bin(a ^ b).count('1') == 1
+        for point in (corners[a], corners[b])]
+
+def get_sphere_lines(radius):
+    origin = (0.0, 0.0, 0.0)
+    x, y, z = (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)
+
+    lines = []
+    for u, v in [(x, y), (y, z), (z, x)]:
+        lines.extend(_get_arc_lines(origin, u, v, radius, 0.0, 2.0 * math.pi, circle_segments))
+
+    return lines
+
+def get_capsule_lines(radius, height):
+    # along z like the exported capsule, height spans both caps
+    half_length = max(height * 0.5 - radius, 0.0)
+    top, bottom = (0.0, 0.0, half_length), (0.0, 0.0, -half_length)
+    x, y, z = (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)
+
+    lines = []
+    for center in (top, bottom):
+        lines.extend(_get_arc_lines(center, x, y, radius, 0.0, 2.0 * math.pi, circle_segments))
+
+    for u in (x, y):
+        lines.extend(_get_arc_lines(top, u, z, radius, 0.0, math.pi, circle_segments // 2))
+        lines.extend(_get_arc_lines(bottom, u, z, radius, math.pi, 2.0 * math.pi, circle_segments // 2))
+
+    for sx, sy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+        lines.extend(((sx * radius, sy * radius, half_length), (sx * radius, sy * radius, -half_length)))
+
+    return lines
+
+def get_shape_lines(collider_type, geometry):
+    if collider_type == 'box': return get_box_lines(geometry.extents)
+    elif collider_type == 'sphere': return get_sphere_lines(geometry.radius)
+    elif collider_type == 'capsule': return get_capsule_lines(geometry.radius, geometry.height)
+    return []
+
+def _get_shader():
+    try: return gpu.shader.from_builtin('UNIFORM_COLOR')
+    except ValueError: return gpu.shader.from_builtin('3D_UNIFORM_COLOR')
+
+class ColliderOverlay:
+
+    def __init__(self, get_object_shape):
+        # get_object_shape(obj) returns (collider_type, world space line points) or None
+        self.get_object_shape = get_object_shape
+
+        self.objects = {}
+        self.dirty_objects = set()
+        self.is_stale = True
+
+        self.dirty_types = set()
+        self.pending_lines = {}
+        self.batches = {}
+
+        self._shader = None
+        self._handle = None
+
+    @property
+    def is_enabled(self): return self._handle is not None
+
+    def mark_dirty(self, object_name): self.dirty_objects.add(object_name)
+
+    def mark_stale(self): self.is_stale = True
+
+    def clear(self):
+        self.objects.clear()
+        self.dirty_objects.clear()
+        self.dirty_types.update(self.batches.keys())
+        self.pending_lines.clear()
+        self.batches.clear()
+        self.is_stale = True
+
+    def _update_object(self, object_name, obj):
+        previous = self.objects.pop(object_name, None)
+        if previous is not None: self.dirty_types.add(previous[0])
+
+        shape = self.get_object_shape(obj) if obj is not None else None
+        if shape is None: return
+
+        self.objects[object_name] = shape
+        self.dirty_types.add(shape[0])
+
+    def update(self, objects):
+        # objects maps names to the objects that can currently be drawn, like scene.objects
+        if self.is_stale:
+            for object_name in list(self.objects.keys()):
+                if object_name not in objects: self._update_object(object_name, None)
+
+            self.dirty_objects.update(name for name in objects.keys() if name not in self.objects)
+            self.is_stale = False
+
+        for object_name in self.dirty_objects: self._update_object(object_name, objects.get(object_name, None))
+        self.dirty_objects.clear()
+
+        dirty_types = self.dirty_types
+        self.dirty_types = set()
+
+        lines = {collider_type: [] for collider_type in dirty_types}
+        for collider_type, points in self.objects.values():
+            if collider_type in lines: lines[collider_type].extend(points)
+
+        return lines
+
+    def refresh(self, objects):
+        # recomputes the dirty shapes, the lines wait for the next redraw to be uploaded
+        if not self.is_stale and len(self.dirty_objects) == 0: return
+        self.pending_lines.update(self.update(objects))
+
+    def _draw(self):
+        if self._shader is None: self._shader = _get_shader()
+
+        for collider_type, points in self.pending_lines.items():
+            if len(points) > 0: self.batches[collider_type] = batch_for_shader(self._shader, 'LINES', {'pos': points})
+            else: self.batches.pop(collider_type, None)
+        self.pending_lines.clear()
+
+        self._shader.bind()
+        for collider_type, batch in self.batches.items():
+            self._shader.uniform_float('color', shape_colors.get(collider_type, (1.0, 1.0, 1.0, 1.0)))
+            batch.draw(self._shader)
+
+    def enable(self, objects):
+        if self.is_enabled or bpy.app.background or gpu is None: return
+
+        self.clear()
+        self.refresh(objects)
+        self._handle = bpy.types.SpaceView3D.draw_handler_add(self._draw, (), 'WINDOW', 'POST_VIEW')
+
+    def disable(self):
+        if not self.is_enabled: return
+
+        bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
+        self._handle = None
+
+        self.clear()
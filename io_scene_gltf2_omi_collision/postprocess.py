@@ -0,0 +1,147 @@
+# Adds or updates OMI_collider data on an already exported .glb file.
+#
+# usage:
+#   python -m io_scene_gltf2_omi_collision.postprocess INPUT.glb OUTPUT.glb \
+#       --node NAME_OR_INDEX [--node ...] [--type box|sphere|capsule|hull|mesh]
+#       [--trigger | --no-trigger] [--no-mesh-center] [--remove]
+#       [--offset-location X Y Z] [--offset-rotation X Y Z] [--offset-scale X Y Z]
+#
+# Box, sphere and capsule parameters are computed from the POSITION accessors of
+# the node's mesh, or of its display mesh parent. Offsets are given in glTF space,
+# rotations as XYZ euler angles in degrees. The BIN chunk is memory-mapped and
+# copied through untouched, only the JSON chunk is rewritten. Does not need Blender.
+
+import os
+import sys
+import math
+import argparse
+
+from .core import bounds, shapes, nodes, transforms
+from .core.glb import GlbFile, GlbError
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(prog='python -m io_scene_gltf2_omi_collision.postprocess')
+    parser.add_argument('input')
+    parser.add_argument('output')
+    parser.add_argument('--node', action='append', required=True, help='node name or index, can be repeated')
+    parser.add_argument('--type', choices=shapes.primitive_collider_types + shapes.mesh_collider_types, default=None)
+    parser.add_argument('--trigger', dest='is_trigger', action='store_true', default=None)
+    parser.add_argument('--no-trigger', dest='is_trigger', action='store_false')
+    parser.add_argument('--no-mesh-center', dest='use_mesh_center', action='store_false')
+    parser.add_argument('--remove', action='store_true', help='remove the collider from the nodes')
+    parser.add_argument('--offset-location', type=float, nargs=3, default=None)
+    parser.add_argument('--offset-rotation', type=float, nargs=3, default=None)
+    parser.add_argument('--offset-scale', type=float, nargs=3, default=None)
+
+    return parser.parse_args(argv)
+
+def _find_node_index(gltf_json, node_name):
+    node_list = gltf_json.get('nodes', [])
+
+    for node_index, node in enumerate(node_list):
+        if node.get('name', None) == node_name: return node_index
+
+    if node_name.isdigit() and int(node_name) < len(node_list): return int(node_name)
+
+    raise GlbError('no node named {}'.format(node_name))
+
+def _get_bounds_from_extension_data(extension_data):
+    # bounds of an existing primitive collider, used when there is no mesh to measure
+    collider_type = extension_data.get('type', None)
+
+    if collider_type == 'box':
+        half_extents = extension_data.get('extents', [0.5, 0.5, 0.5])
+    elif collider_type == 'sphere':
+        half_extents = [extension_data.get('radius', 0.5)] * 3
+    elif collider_type == 'capsule':
+        radius = extension_data.get('radius', 0.5)
+        half_extents = [radius, radius, extension_data.get('height', 2.0) * 0.5]
+    else:
+        return None
+
+    return tuple((-abs(e), abs(e)) for e in half_extents)
+
+def _remove_collider(node):
+    extensions = node.get('extensions', {})
+    extension_data = extensions.pop(shapes.glTF_extension_name, None)
+
+    if extension_data is not None and 'mesh' not in node and extension_data.get('mesh', None) is not None:
+        node['mesh'] = extension_data['mesh']
+
+    if 'extensions' in node and len(extensions) == 0: del node['extensions']
+
+def _update_collider(glb, node_index, parents, args):
+    gltf_json = glb.json
+    node = gltf_json['nodes'][node_index]
+
+    previous_data = node.get('extensions', {}).get(shapes.glTF_extension_name, {})
+
+    collider_type = args.type if args.type is not None else previous_data.get('type', None)
+    if collider_type is None: raise GlbError('node {} has no collider, pass --type'.format(node_index))
+
+    is_trigger = args.is_trigger if args.is_trigger is not None else previous_data.get('isTrigger', False)
+
+    # primitives written by the exporter or by an earlier run are already centered on the mesh
+    is_centered = previous_data.get('type', None) in shapes.primitive_collider_types
+    mesh_index = nodes.get_collider_source_mesh(gltf_json, node_index, parents)
+
+    geometry = None
+    if collider_type in shapes.primitive_collider_types:
+        if mesh_index is not None: mesh_bounds = glb.get_mesh_bounds(mesh_index)
+        else: mesh_bounds = _get_bounds_from_extension_data(previous_data)
+
+        if mesh_bounds is None: raise GlbError('node {} has no mesh to fit a {} to'.format(node_index, collider_type))
+
+        geometry = bounds.get_geometry_from_axes(mesh_bounds)
+
+        if mesh_index is not None and not is_centered and args.use_mesh_center:
+            nodes.translate_node_json_origin(gltf_json, node_index, geometry.center)
+    elif mesh_index is None:
+        raise GlbError('node {} has no mesh for a {} collider'.format(node_index, collider_type))
+    elif is_centered:
+        # mesh colliders use the mesh origin, the primitive was centered before any offsets were added
+        center = bounds.get_geometry_from_axes(glb.get_mesh_bounds(mesh_index)).center
+        nodes.translate_node_json(node, [-c for c in center])
+
+    extension_data = shapes.get_collider_extension_data(collider_type, geometry, is_trigger)
+
+    node.setdefault('extensions', {})[shapes.glTF_extension_name] = extension_data
+    if collider_type in shapes.mesh_collider_types: node['mesh'] = mesh_index
+
+    nodes.modify_node_json(node)
+
+    offset_rotation = None
+    if args.offset_rotation is not None:
+        offset_rotation = transforms.euler_to_quaternion([math.radians(v) for v in args.offset_rotation])
+
+    nodes.apply_offsets_to_node_json(node, args.offset_location, offset_rotation, args.offset_scale)
+
+def postprocess(input_path, output_path, args):
+    temporary_path = output_path + '.tmp'
+
+    with GlbFile(input_path) as glb:
+        parents = nodes.get_node_parents(glb.json)
+        node_indices = [_find_node_index(glb.json, name) for name in args.node]
+
+        for node_index in node_indices:
+            if args.remove: _remove_collider(glb.json['nodes'][node_index])
+            else: _update_collider(glb, node_index, parents, args)
+
+        nodes.update_extensions_used(glb.json)
+
+        glb.write(temporary_path)
+
+    os.replace(temporary_path, output_path)
+
+def main(argv=None):
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+
+    try: postprocess(args.input, args.output, args)
+    except (GlbError, OSError) as e:
+        print('error: {}'.format(e), file=sys.stderr)
+        return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
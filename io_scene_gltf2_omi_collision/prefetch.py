@@ -0,0 +1,65 @@
+# Collider results computed ahead of an export on a pool of workers.
+#
+# glTF2_pre_export_callback() snapshots the buffers of every collider mesh on the
+# main thread, since only it may touch bpy, and the pool computes bounds, hull
+# checks, fingerprints and fitted shapes from the snapshots with the bpy-free
+# core functions. Threads run in parallel where NumPy and hashlib release the
+# GIL, processes also for the pure Python fitting and hull checks. Results are
+# stored like baked results and looked up by the export hooks.
+
+import multiprocessing
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .core import bounds, hull, conversion, fitting
+
+# fingerprint_buffers are the edge, loop and polygon buffers hashed with the
+# coordinates, fitted_shapes lists (collider_type, is_y_up, allow_rotation)
+MeshSnapshot = namedtuple('MeshSnapshot', ['key', 'coords', 'topology', 'fingerprint_buffers', 'fitted_shapes'])
+
+# snapshots sent to a worker process at a time
+process_chunk_size = 16
+
+def compute_mesh_results(snapshot):
+    coords = snapshot.coords
+    results = [('bounds', bounds.get_coordinate_bounds(coords))]
+
+    if snapshot.fingerprint_buffers is not None:
+        results.append(('fingerprint', hull.get_hull_fingerprint(coords, *snapshot.fingerprint_buffers)))
+
+    if snapshot.topology is not None:
+        results.append(('hull_validation', hull.validate_hull_topology(snapshot.topology)))
+
+    y_up_coords = None
+    for collider_type, is_y_up, allow_rotation in snapshot.fitted_shapes:
+        if is_y_up and y_up_coords is None: y_up_coords = conversion.convert_coordinates_to_y_up(coords)
+
+        fitted_shape = fitting.fit_shape(y_up_coords if is_y_up else coords, collider_type, allow_rotation)
+        results.append((('fitted_shape', collider_type, is_y_up, allow_rotation), fitted_shape))
+
+    return snapshot.key, results
+
+def _run(executor, snapshots, chunk_size=1):
+    with executor: return list(executor.map(compute_mesh_results, snapshots, chunksize=chunk_size))
+
+def prefetch_collider_results(snapshots, store, workers=None, use_processes=False):
+    # fills store and returns the number of meshes computed
+    if len(snapshots) == 0: return 0
+
+    computed = None
+    if use_processes:
+        # spawned workers import only the bpy-free modules, a failed start falls back to threads
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            computed = _run(executor, snapshots, process_chunk_size)
+        except (BrokenProcessPool, OSError):
+            computed = None
+
+    if computed is None: computed = _run(ThreadPoolExecutor(max_workers=workers), snapshots)
+
+    for key, results in computed:
+        for name, value in results: store.put(key, name, value)
+
+    return len(computed)
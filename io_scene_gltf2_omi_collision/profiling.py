@@ -0,0 +1,99 @@
+# Wall-clock stage timers, counters and an optional cProfile capture for exports.
+#
+# The add-on starts the profiler from glTF2_pre_export_callback() and writes the
+# report from glTF2_post_export_callback(). While it is not active every call is
+# a cheap no-op, so the instrumentation can stay in the export hooks.
+
+import json
+import time
+import pstats
+import cProfile
+
+from contextlib import contextmanager
+
+report_function_count = 30
+
+class ExportProfiler:
+
+    def __init__(self):
+        self.is_active = False
+        self.reset()
+
+    def reset(self):
+        self.stages = {}
+        self.counters = {}
+        self.seconds = None
+
+        self._profile = None
+        self._start = None
+
+    def start(self, use_cprofile=False):
+        self.reset()
+        self.is_active = True
+
+        if use_cprofile:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+        self._start = time.perf_counter()
+
+    def stop(self):
+        if not self.is_active: return
+
+        self.seconds = time.perf_counter() - self._start
+        if self._profile is not None: self._profile.disable()
+
+        self.is_active = False
+
+    @contextmanager
+    def stage(self, name):
+        if not self.is_active:
+            yield
+            return
+
+        start = time.perf_counter()
+        try: yield
+        finally:
+            stage = self.stages.setdefault(name, {'calls': 0, 'seconds': 0.0})
+            stage['calls'] += 1
+            stage['seconds'] += time.perf_counter() - start
+
+    def count(self, name, amount=1):
+        if self.is_active: self.counters[name] = self.counters.get(name, 0) + amount
+
+    def _get_profile_functions(self):
+        stats = pstats.Stats(self._profile)
+
+        functions = []
+        for (filename, line, function), (calls, primitive_calls, total, cumulative, callers) in stats.stats.items():
+            functions.append({
+                'function': '{}:{}({})'.format(filename, line, function),
+                'calls': calls,
+                'total_seconds': total,
+                'cumulative_seconds': cumulative
+            })
+
+        functions.sort(key=lambda f: f['cumulative_seconds'], reverse=True)
+
+        return functions[:report_function_count]
+
+    def get_report(self):
+        report = {
+            'seconds': self.seconds,
+            'stages': self.stages,
+            'counters': self.counters
+        }
+
+        if self._profile is not None: report['profile'] = self._get_profile_functions()
+
+        return report
+
+    def write_report(self, report_path, profile_path=None, extra=None):
+        report = self.get_report()
+        if extra is not None: report.update(extra)
+
+        if self._profile is not None and profile_path is not None:
+            self._profile.dump_stats(profile_path)
+            report['profile_path'] = profile_path
+
+        with open(report_path, 'w', encoding='utf-8') as f: json.dump(report, f, indent=2)
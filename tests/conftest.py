@@ -0,0 +1,84 @@
+import os
+import sys
+import json
+import array
+import struct
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from io_scene_gltf2_omi_collision.core.hull import HullTopology
+
+def _padded(data, pad_byte):
+    return data + pad_byte * (-len(data) % 4)
+
+def write_glb(path, gltf_json, bin_bytes=None):
+    json_bytes = _padded(json.dumps(gltf_json).encode('utf-8'), b' ')
+
+    chunks = struct.pack('<I4s', len(json_bytes), b'JSON') + json_bytes
+    if bin_bytes is not None:
+        chunks += struct.pack('<I4s', len(bin_bytes), b'BIN\x00') + _padded(bin_bytes, b'\x00')
+
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<4sII', b'glTF', 2, 12 + len(chunks)))
+        f.write(chunks)
+
+def get_mesh_glb_json(coords, nodes):
+    # one mesh with a POSITION accessor over coords, without min and max so it is read from the BIN chunk
+    return {
+        'asset': {'version': '2.0'},
+        'scenes': [{'nodes': [0]}],
+        'nodes': nodes,
+        'meshes': [{'primitives': [{'attributes': {'POSITION': 0}}]}],
+        'accessors': [{'bufferView': 0, 'componentType': 5126, 'count': len(coords), 'type': 'VEC3'}],
+        'bufferViews': [{'buffer': 0, 'byteLength': len(coords) * 12}],
+        'buffers': [{'byteLength': len(coords) * 12}]
+    }
+
+def get_coords_bytes(coords):
+    return b''.join(struct.pack('<3f', *c) for c in coords)
+
+def get_hull_topology(coords, faces):
+    # the buffers Blender fills for a mesh, with normals and centers of planar faces
+    edges = {}
+    loop_starts = []
+    loop_vertices = []
+    loop_edges = []
+    normals = []
+    centers = []
+
+    for face in faces:
+        loop_starts.append(len(loop_vertices))
+        for i, vertex in enumerate(face):
+            edge = tuple(sorted((vertex, face[(i + 1) % len(face)])))
+            loop_vertices.append(vertex)
+            loop_edges.append(edges.setdefault(edge, len(edges)))
+
+        a, b, c = (coords[face[i]] for i in range(3))
+        u = [b[i] - a[i] for i in range(3)]
+        v = [c[i] - a[i] for i in range(3)]
+        normal = [u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0]]
+        length = sum(n * n for n in normal) ** 0.5
+
+        normals.extend(n / length for n in normal)
+        centers.extend(sum(coords[vertex][axis] for vertex in face) / len(face) for axis in range(3))
+
+    return HullTopology(
+        array.array('i', [v for edge in edges for v in edge]),
+        array.array('i', loop_vertices),
+        array.array('i', loop_edges),
+        array.array('i', loop_starts),
+        array.array('i', [len(face) for face in faces]),
+        array.array('f', normals),
+        array.array('f', centers))
+
+@pytest.fixture
+def mesh_glb(tmp_path):
+    # writes a glb with a single mesh over coords and returns its path
+    def create(coords, nodes, name='input.glb'):
+        path = str(tmp_path / name)
+        write_glb(path, get_mesh_glb_json(coords, nodes), get_coords_bytes(coords))
+        return path
+
+    return create
@@ -0,0 +1,46 @@
+import json
+import os
+
+import pytest
+
+from io_scene_gltf2_omi_collision import batch_export
+
+def _touch(tmp_path, *paths):
+    for path in paths:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_bytes(b'')
+
+def _get_stems(jobs):
+    return [output_stem.replace(os.sep, '/') for _, output_stem in jobs]
+
+def test_directory_keeps_structure(tmp_path):
+    _touch(tmp_path, 'levels/a/scene.blend', 'levels/b/scene.blend', 'levels/readme.txt')
+    assert _get_stems(batch_export._collect_jobs([str(tmp_path / 'levels')])) == ['a/scene', 'b/scene']
+
+def test_manifest_keeps_structure(tmp_path):
+    _touch(tmp_path, 'a/scene.blend', 'b/scene.blend', 'b/props/crate.blend')
+    (tmp_path / 'manifest.json').write_text(json.dumps(['a/scene.blend', 'b/scene.blend', 'b/props/crate.blend']))
+
+    jobs = batch_export._collect_jobs([str(tmp_path / 'manifest.json')])
+
+    assert _get_stems(jobs) == ['a/scene', 'b/scene', 'b/props/crate']
+    assert jobs[0][0] == str(tmp_path / 'a' / 'scene.blend')
+
+def test_single_file(tmp_path):
+    _touch(tmp_path, 'a/scene.blend')
+    assert _get_stems(batch_export._collect_jobs([str(tmp_path / 'a' / 'scene.blend')])) == ['scene']
+
+def test_repeated_file_is_exported_once(tmp_path):
+    _touch(tmp_path, 'a/scene.blend')
+    (tmp_path / 'manifest.txt').write_text('a/scene.blend\n# comment\na/scene.blend\n')
+
+    assert len(batch_export._collect_jobs([str(tmp_path / 'manifest.txt')])) == 1
+
+def test_colliding_outputs_fail(tmp_path):
+    # both directories have a scene.blend at their top
+    _touch(tmp_path, 'a/scene.blend', 'b/scene.blend')
+
+    with pytest.raises(SystemExit) as e:
+        batch_export._collect_jobs([str(tmp_path / 'a'), str(tmp_path / 'b')])
+
+    assert 'scene' in str(e.value)
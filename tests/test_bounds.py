@@ -0,0 +1,33 @@
+import array
+
+import pytest
+
+from io_scene_gltf2_omi_collision.core import bounds
+
+coords = array.array('f', [-1.0, 2.0, 0.5, 3.0, -4.0, 1.5, 0.0, 0.0, -2.5])
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_coordinate_bounds(monkeypatch, use_numpy):
+    if not use_numpy: monkeypatch.setattr(bounds, 'np', None)
+    elif bounds.np is None: pytest.skip('needs numpy')
+
+    assert bounds.get_coordinate_bounds(coords) == ((-1.0, 3.0), (-4.0, 2.0), (-2.5, 1.5))
+
+def test_empty_bounds():
+    assert bounds.get_coordinate_bounds([]) == bounds.empty_bounds
+
+def test_geometry_from_axes():
+    geometry = bounds.get_geometry_from_axes(((-1.0, 3.0), (-4.0, 2.0), (-2.5, 1.5)))
+
+    assert geometry.extents == (2.0, 3.0, 2.0)
+    assert geometry.radius == 3.0
+    assert geometry.height == 4.0
+    assert geometry.center == [1.0, -1.0, -0.5]
+
+def test_geometry_from_coordinates_y_up():
+    # blender z becomes glTF y, blender y becomes glTF -z
+    geometry = bounds.get_geometry_from_coordinates(coords, is_y_up=True)
+
+    assert geometry.extents == (2.0, 2.0, 3.0)
+    assert geometry.center == [1.0, -0.5, 1.0]
+    assert geometry.height == 6.0
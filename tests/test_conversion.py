@@ -0,0 +1,31 @@
+import pytest
+
+from io_scene_gltf2_omi_collision.core import conversion
+
+def test_location():
+    assert conversion.convert_to_y_up_location([1.0, 2.0, 3.0]) == [1.0, 3.0, -2.0]
+    assert conversion.convert_from_y_up_location(conversion.convert_to_y_up_location([1.0, 2.0, 3.0])) == [1.0, 2.0, 3.0]
+
+def test_scale_keeps_sign():
+    assert conversion.convert_to_y_up_scale([1.0, 2.0, 3.0]) == [1.0, 3.0, 2.0]
+
+def test_rotation():
+    # a quarter turn around blender z is a quarter turn around glTF y
+    s = 0.5 ** 0.5
+    assert conversion.convert_to_y_up_rotation([s, 0.0, 0.0, s]) == [s, 0.0, s, 0.0]
+    assert conversion.convert_to_y_up_rotation([s, 0.0, s, 0.0]) == [s, 0.0, 0.0, -s]
+
+def test_flat_coordinates():
+    assert conversion.convert_coordinates_to_y_up([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]) == [1.0, 3.0, -2.0, 4.0, 6.0, -5.0]
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_batched_conversions_match(monkeypatch, use_numpy):
+    if not use_numpy: monkeypatch.setattr(conversion, 'np', None)
+    elif conversion.np is None: pytest.skip('needs numpy')
+
+    vectors = [[1.0, 2.0, 3.0], [-4.0, 5.0, -6.0]]
+    quaternions = [[1.0, 0.0, 0.0, 0.0], [0.5, 0.5, -0.5, 0.5]]
+
+    assert [list(v) for v in conversion.convert_to_y_up_locations(vectors)] == [conversion.convert_to_y_up_location(v) for v in vectors]
+    assert [list(v) for v in conversion.convert_to_y_up_scales(vectors)] == [conversion.convert_to_y_up_scale(v) for v in vectors]
+    assert [list(q) for q in conversion.convert_to_y_up_rotations(quaternions)] == [conversion.convert_to_y_up_rotation(q) for q in quaternions]
@@ -0,0 +1,78 @@
+import pytest
+
+from io_scene_gltf2_omi_collision.core import decomposition, quickhull
+
+def _get_prism(outline, center, height=1.0):
+    # closed prism over a counter clockwise outline, the caps are fans around a center every corner can see
+    count = len(outline)
+    points = outline + [center]
+    coords = [v for x, y in points for v in (x, y, 0.0)] + [v for x, y in points for v in (x, y, height)]
+
+    top = count + 1
+    triangles = []
+    for i in range(count):
+        j = (i + 1) % count
+        triangles.extend((count, j, i))
+        triangles.extend((top + count, top + i, top + j))
+        triangles.extend((i, j, top + j, i, top + j, top + i))
+
+    return coords, triangles
+
+# a 2 x 2 square without its 1 x 1 corner
+l_outline = [(0.0, 0.0), (2.0, 0.0), (2.0, 1.0), (1.0, 1.0), (1.0, 2.0), (0.0, 2.0)]
+l_center = (0.5, 0.5)
+
+def test_convex_mesh_is_one_hull():
+    coords, triangles = _get_prism([(0.0, 0.0), (2.0, 0.0), (2.0, 1.0), (0.0, 1.0)], (1.0, 0.5))
+    assert len(decomposition.decompose_convex(coords, triangles)) == 1
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_l_prism_is_two_hulls(monkeypatch, use_numpy):
+    if not use_numpy: monkeypatch.setattr(decomposition, 'np', None)
+    elif decomposition.np is None: pytest.skip('needs numpy')
+
+    coords, triangles = _get_prism(l_outline, l_center)
+    hulls = decomposition.decompose_convex(coords, triangles)
+
+    assert len(hulls) == 2
+    assert sum(quickhull.get_convex_hull_volume(*h) for h in hulls) == pytest.approx(3.0)
+
+def test_hulls_cover_the_mesh():
+    coords, triangles = _get_prism(l_outline, l_center)
+    hulls = decomposition.decompose_convex(coords, triangles)
+
+    for i in range(0, len(coords), 3):
+        point = coords[i:i + 3]
+        assert any(
+            all(sum(n[a] * point[a] for a in range(3)) <= o + 1e-6 for n, o in zip(*quickhull.get_convex_hull_planes(*h)))
+            for h in hulls)
+
+def test_hull_budget():
+    # a plus sign needs three hulls
+    outline = [
+        (1.0, 0.0), (2.0, 0.0), (2.0, 1.0), (3.0, 1.0), (3.0, 2.0), (2.0, 2.0),
+        (2.0, 3.0), (1.0, 3.0), (1.0, 2.0), (0.0, 2.0), (0.0, 1.0), (1.0, 1.0)]
+    coords, triangles = _get_prism(outline, (1.5, 1.5))
+
+    hulls = decomposition.decompose_convex(coords, triangles)
+    assert len(hulls) == 3
+    assert sum(quickhull.get_convex_hull_volume(*h) for h in hulls) == pytest.approx(5.0)
+
+    assert len(decomposition.decompose_convex(coords, triangles, max_hulls=2)) == 2
+
+def test_flat_mesh_raises():
+    with pytest.raises(quickhull.HullError):
+        decomposition.decompose_convex([0.0, 0.0, 0.0] * 3, [0, 1, 2])
+
+def test_split_adds_only_used_vertices():
+    coords, triangles = _get_prism(l_outline, l_center)
+    coords = list(coords)
+    vertex_count = len(coords) // 3
+
+    scale = 3.0
+    children = decomposition._split_part(coords, decomposition._create_part(coords, triangles, scale), scale)
+
+    # rejected candidate planes leave nothing behind, every added vertex is on the chosen cut
+    used = set(v for child in children for v in child.triangles)
+    assert max(used) < len(coords) // 3
+    assert set(range(vertex_count, len(coords) // 3)) <= used
@@ -0,0 +1,172 @@
+import math
+
+import pytest
+
+bpy = pytest.importorskip('bpy')
+
+from mathutils import Matrix, Quaternion, Vector
+
+from io_scene_gltf2_omi_collision import addon, batch_export
+from io_scene_gltf2_omi_collision.core.glb import GlbFile
+
+@pytest.fixture
+def scene():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    batch_export._enable_addon()
+
+    scene = bpy.context.scene
+    scene.OMIColliderExportExtensionProperties.enabled = True
+
+    return scene
+
+def _create_collider(scene, name, collider_type, mesh=None, is_display_mesh=False):
+    if mesh is None:
+        mesh = bpy.data.meshes.new(name)
+        mesh.from_pydata([(-1, -1, -1), (1, -1, -1), (0, 1, -1), (0, 0, 1)], [], [(0, 2, 1), (0, 1, 3), (1, 2, 3), (2, 0, 3)])
+
+    obj = bpy.data.objects.new(name, mesh)
+    scene.collection.objects.link(obj)
+
+    collider_props = obj.OMIColliderProperties
+    collider_props.is_collider = True
+    collider_props.collider_type = collider_type
+    collider_props.is_display_mesh = is_display_mesh
+
+    return obj
+
+def _export(tmp_path, **kwargs):
+    path = str(tmp_path / 'export.glb')
+    bpy.ops.export_scene.gltf(filepath=path, export_format='GLB', **kwargs)
+
+    with GlbFile(path) as glb: return glb.json
+
+def _get_node(gltf_json, name):
+    return next(n for n in gltf_json['nodes'] if n.get('name') == name)
+
+def _get_world_matrix(gltf_json, name):
+    parents = {c: i for i, n in enumerate(gltf_json['nodes']) for c in n.get('children', [])}
+    node_index = gltf_json['nodes'].index(_get_node(gltf_json, name))
+
+    matrix = Matrix.Identity(4)
+    while node_index is not None:
+        node = gltf_json['nodes'][node_index]
+        x, y, z, w = node.get('rotation', [0, 0, 0, 1])
+        local_matrix = (
+            Matrix.Translation(node.get('translation', [0, 0, 0])) @ Quaternion((w, x, y, z)).to_matrix().to_4x4() @
+            Matrix.Diagonal(node.get('scale', [1, 1, 1])).to_4x4())
+
+        matrix = local_matrix @ matrix
+        node_index = parents.get(node_index, None)
+
+    return addon._from_y_up_matrix @ matrix
+
+def _get_collider_mesh(gltf_json, name):
+    return _get_node(gltf_json, name)['extensions']['OMI_collider']['mesh']
+
+def test_shared_data_with_different_modifiers(scene, tmp_path):
+    plain = _create_collider(scene, 'Plain', 'mesh')
+    modified = _create_collider(scene, 'Modified', 'mesh', mesh=plain.data)
+    modified.modifiers.new('Subdivision', 'SUBSURF')
+
+    gltf_json = _export(tmp_path, export_apply=True)
+
+    assert _get_collider_mesh(gltf_json, 'Plain') != _get_collider_mesh(gltf_json, 'Modified')
+
+def test_shared_data_without_modifiers(scene, tmp_path):
+    first = _create_collider(scene, 'First', 'mesh')
+    _create_collider(scene, 'Second', 'mesh', mesh=first.data)
+
+    gltf_json = _export(tmp_path, export_apply=True)
+
+    assert _get_collider_mesh(gltf_json, 'First') == _get_collider_mesh(gltf_json, 'Second')
+
+def test_primitive_colliders_write_no_render_mesh(scene, tmp_path):
+    _create_collider(scene, 'Box', 'box')
+    _create_collider(scene, 'Sphere', 'sphere', is_display_mesh=True)
+    _create_collider(scene, 'Mesh', 'mesh')
+
+    gltf_json = _export(tmp_path)
+
+    # the display mesh and the mesh collider, nothing for the box
+    assert len(gltf_json['meshes']) == 2
+    assert _get_collider_mesh(gltf_json, 'Mesh') in (0, 1)
+
+@pytest.mark.parametrize('is_display_mesh', [False, True])
+@pytest.mark.parametrize('use_tight_fit', [False, True])
+def test_placement_matches_export(scene, tmp_path, is_display_mesh, use_tight_fit):
+    scene.OMIColliderExportExtensionProperties.use_tight_fit = use_tight_fit
+
+    # off center, so the mesh center or fit moves the collider
+    mesh = bpy.data.meshes.new('Box')
+    mesh.from_pydata([(x, y, z) for x in (1, 3) for y in (-1, 0) for z in (2, 5)], [], [])
+
+    obj = _create_collider(scene, 'Box', 'box', mesh=mesh, is_display_mesh=is_display_mesh)
+    obj.location = (1.0, -2.0, 0.5)
+    obj.rotation_euler = (0.3, -0.2, 1.1)
+    obj.scale = (2.0, 2.0, 2.0)
+
+    collider_props = obj.OMIColliderProperties
+    collider_props.use_offsets = True
+    collider_props.offset_location = (0.5, 0.25, -1.0)
+    collider_props.offset_rotation = (0.0, 0.4, 0.0)
+
+    gltf_json = _export(tmp_path)
+    _, geometry, matrix = addon._get_collider_placement(obj)
+
+    assert list(geometry.extents) == pytest.approx(_get_node(gltf_json, 'Box')['extensions']['OMI_collider']['extents'], abs=1e-5)
+
+    exported_matrix = _get_world_matrix(gltf_json, 'Box')
+    for point in [(0, 0, 0), (1, 0, 0), (0, 1, 0), (0, 0, 1)]:
+        assert list(matrix @ Vector(point)) == pytest.approx(list(exported_matrix @ Vector(point)), abs=1e-4)
+
+def test_substituted_hull_placement_matches_export(scene, tmp_path):
+    scene.OMIColliderExportExtensionProperties.use_collider_lod = True
+
+    # a box shaped hull, exported as a box fitted around it
+    mesh = bpy.data.meshes.new('Hull')
+    mesh.from_pydata([(x, y, z) for x in (1, 3) for y in (-1, 0) for z in (2, 5)], [], [])
+
+    obj = _create_collider(scene, 'Hull', 'hull', mesh=mesh)
+    obj.rotation_euler = (0.0, 0.0, 0.6)
+
+    gltf_json = _export(tmp_path)
+    collider_type, geometry, matrix = addon._get_collider_placement(obj)
+
+    extension_data = _get_node(gltf_json, 'Hull')['extensions']['OMI_collider']
+    assert collider_type == extension_data['type'] == 'box'
+    assert list(geometry.extents) == pytest.approx(extension_data['extents'], abs=1e-5)
+
+    exported_matrix = _get_world_matrix(gltf_json, 'Hull')
+    assert list(matrix @ Vector((0, 0, 0))) == pytest.approx(list(exported_matrix @ Vector((0, 0, 0))), abs=1e-4)
+
+    # the 2 x 1 x 3 box turned around z, not the bounds of the mesh
+    box_min, box_max = addon._get_collider_world_bounds(obj)
+    c, s = math.cos(0.6), math.sin(0.6)
+    assert [box_max[i] - box_min[i] for i in range(3)] == pytest.approx([2.0 * c + s, 2.0 * s + c, 3.0], abs=1e-4)
+
+def test_mesh_collider_contains_nothing(scene):
+    # a prop resting inside a room shell stays a collider when stripping
+    room = bpy.data.meshes.new('Room')
+    room.from_pydata([(x, y, z) for x in (-5, 5) for y in (-5, 5) for z in (0, 3)], [], [])
+    _create_collider(scene, 'Room', 'mesh', mesh=room)
+
+    prop = _create_collider(scene, 'Prop', 'box')
+    prop.location = (1.0, 1.0, 1.5)
+    prop.scale = (0.25, 0.25, 0.25)
+
+    colliders, report = addon.analyze_collider_overlaps(scene.objects)
+
+    assert len(colliders) == 2
+    assert report.contained == []
+
+def test_moved_collider_reuses_fit(scene):
+    scene.OMIColliderExportExtensionProperties.use_tight_fit = True
+    obj = _create_collider(scene, 'Box', 'box')
+
+    addon._get_collider_placement(obj)
+    hits = addon._fitted_shape_cache.hits
+
+    obj.location = (3.0, 0.0, 0.0)
+    addon._get_collider_placement(obj)
+
+    assert addon._fitted_shape_cache.hits == hits + 1
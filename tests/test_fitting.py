@@ -0,0 +1,118 @@
+import math
+import random
+
+import pytest
+
+from io_scene_gltf2_omi_collision.core import fitting, quickhull
+from io_scene_gltf2_omi_collision.core.transforms import quaternion_rotate_vector
+
+# about 98 degrees around a tilted axis, so no fitted axis lines up with the world
+rotation = [0.6532815, 0.2705981, 0.2705981, 0.6532815]
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'python'])
+def use_numpy(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(fitting, 'np', None)
+        monkeypatch.setattr(quickhull, 'np', None)
+    elif fitting.np is None:
+        pytest.skip('needs numpy')
+
+def _transform(points, offset=(1.0, -2.0, 3.0)):
+    coords = []
+    for p in points:
+        rotated = quaternion_rotate_vector(rotation, p)
+        coords.extend(rotated[i] + offset[i] for i in range(3))
+    return coords
+
+def _get_box_points(extents, count, seed=0):
+    rng = random.Random(seed)
+    corners = [(x * extents[0], y * extents[1], z * extents[2]) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]
+    return corners + [tuple(rng.uniform(-e, e) for e in extents) for _ in range(count)]
+
+def _get_local_points(coords, fitted_shape):
+    w, x, y, z = fitted_shape.rotation
+    inverse = [w, -x, -y, -z]
+    center = fitted_shape.center
+
+    return [
+        quaternion_rotate_vector(inverse, [coords[i + axis] - center[axis] for axis in range(3)])
+        for i in range(0, len(coords), 3)]
+
+def _assert_contains(coords, collider_type, fitted_shape, tolerance=1e-5):
+    geometry = fitted_shape.geometry
+
+    for x, y, z in _get_local_points(coords, fitted_shape):
+        if collider_type == 'box':
+            assert all(abs(v) <= e + tolerance for v, e in zip((x, y, z), geometry.extents))
+        elif collider_type == 'sphere':
+            assert math.sqrt(x * x + y * y + z * z) <= geometry.radius + tolerance
+        else:
+            half_segment = max(geometry.height * 0.5 - geometry.radius, 0.0)
+            dz = max(abs(z) - half_segment, 0.0)
+            assert math.sqrt(x * x + y * y + dz * dz) <= geometry.radius + tolerance
+
+@pytest.mark.parametrize('collider_type', ['box', 'sphere', 'capsule'])
+@pytest.mark.parametrize('allow_rotation', [True, False])
+def test_shapes_contain_all_points(use_numpy, collider_type, allow_rotation):
+    rng = random.Random(1)
+    coords = [rng.gauss(0.0, 1.0) * scale for _ in range(300) for scale in (3.0, 1.0, 0.5)]
+
+    _assert_contains(coords, collider_type, fitting.fit_shape(coords, collider_type, allow_rotation))
+
+def test_rotated_box_is_tight(use_numpy):
+    coords = _transform(_get_box_points((1.0, 0.5, 0.25), 100))
+    fitted_shape = fitting.fit_oriented_box(coords)
+
+    _assert_contains(coords, 'box', fitted_shape)
+    assert sorted(fitted_shape.geometry.extents) == pytest.approx([0.25, 0.5, 1.0], rel=1e-3)
+    assert fitted_shape.center == pytest.approx([1.0, -2.0, 3.0], abs=1e-4)
+
+def test_box_without_rotation_is_axis_aligned(use_numpy):
+    coords = _transform(_get_box_points((1.0, 0.5, 0.25), 20))
+    fitted_shape = fitting.fit_oriented_box(coords, allow_rotation=False)
+
+    assert fitted_shape.rotation == [1.0, 0.0, 0.0, 0.0]
+    _assert_contains(coords, 'box', fitted_shape)
+
+def test_sphere_is_minimal(use_numpy):
+    rng = random.Random(2)
+
+    points = []
+    for _ in range(500):
+        v = [rng.gauss(0.0, 1.0) for _ in range(3)]
+        length = math.sqrt(sum(c * c for c in v))
+        points.append(tuple(2.0 * c / length for c in v))
+
+    fitted_shape = fitting.fit_sphere(_transform(points))
+
+    assert fitted_shape.geometry.radius == pytest.approx(2.0, rel=1e-2)
+    assert fitted_shape.center == pytest.approx([1.0, -2.0, 3.0], abs=2e-2)
+
+def test_capsule_follows_the_long_axis(use_numpy):
+    rng = random.Random(3)
+
+    # a capsule of radius 0.5 along x, two caps and the cylinder between
+    points = []
+    for _ in range(1000):
+        angle = rng.uniform(0.0, 2.0 * math.pi)
+        x = rng.uniform(-1.5, 1.5)
+        points.append((x, 0.5 * math.cos(angle), 0.5 * math.sin(angle)))
+    for sign in (-1.0, 1.0):
+        for _ in range(200):
+            v = [rng.gauss(0.0, 1.0) for _ in range(3)]
+            length = math.sqrt(sum(c * c for c in v))
+            points.append((sign * (1.5 + 0.5 * abs(v[0]) / length), 0.5 * v[1] / length, 0.5 * v[2] / length))
+
+    coords = _transform(points)
+    fitted_shape = fitting.fit_capsule(coords)
+
+    _assert_contains(coords, 'capsule', fitted_shape)
+    assert fitted_shape.geometry.radius == pytest.approx(0.5, rel=2e-2)
+    assert fitted_shape.geometry.height == pytest.approx(4.0, rel=2e-2)
+
+def test_flat_points(use_numpy):
+    # no hull, every point is used
+    coords = [0.0, 0.0, 0.0, 2.0, 0.0, 0.0, 0.0, 1.0, 0.0, 2.0, 1.0, 0.0]
+
+    for collider_type in ['box', 'sphere', 'capsule']:
+        _assert_contains(coords, collider_type, fitting.fit_shape(coords, collider_type))
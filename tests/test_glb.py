@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from io_scene_gltf2_omi_collision.core.glb import GlbFile, GlbError
+
+coords = [(-1.0, 0.0, 2.0), (3.0, -4.0, 0.5), (0.0, 1.0, -2.0)]
+
+def test_read_bounds(mesh_glb):
+    path = mesh_glb(coords, [{'mesh': 0}])
+
+    with GlbFile(path) as glb:
+        assert glb.get_mesh_bounds(0) == ((-1.0, 3.0), (-4.0, 1.0), (-2.0, 2.0))
+        assert list(glb.read_accessor_floats(0)) == [v for c in coords for v in c]
+
+def test_round_trip(mesh_glb, tmp_path):
+    path = mesh_glb(coords, [{'mesh': 0}])
+    output_path = str(tmp_path / 'output.glb')
+
+    with GlbFile(path) as glb:
+        glb.json['nodes'][0]['name'] = 'Renamed'
+        glb.write(output_path)
+
+    with GlbFile(path) as glb, GlbFile(output_path) as written:
+        assert written.json['nodes'][0]['name'] == 'Renamed'
+        assert bytes(written.get_bin_chunk()) == bytes(glb.get_bin_chunk())
+        assert written.get_mesh_bounds(0) == glb.get_mesh_bounds(0)
+
+    assert os.path.getsize(output_path) % 4 == 0
+
+def test_failed_write_closes(mesh_glb, tmp_path):
+    path = mesh_glb(coords, [{'mesh': 0}])
+
+    # the BIN chunk is mapped before the write fails, closing must not raise BufferError over the OSError
+    with pytest.raises(FileNotFoundError):
+        with GlbFile(path) as glb:
+            glb.get_mesh_bounds(0)
+            glb.write(str(tmp_path / 'missing' / 'output.glb'))
+
+@pytest.mark.skipif(not os.path.exists('/dev/full'), reason='needs /dev/full')
+def test_failed_write_during_copy(mesh_glb):
+    path = mesh_glb(coords, [{'mesh': 0}])
+
+    with pytest.raises(OSError):
+        with GlbFile(path) as glb:
+            glb.get_mesh_bounds(0)
+            glb.write('/dev/full')
+
+def test_not_a_glb(tmp_path):
+    path = tmp_path / 'input.glb'
+    path.write_bytes(b'not a glb file')
+
+    with pytest.raises(GlbError): GlbFile(str(path))
@@ -0,0 +1,63 @@
+import array
+
+from conftest import get_hull_topology
+
+from io_scene_gltf2_omi_collision.core import hull
+
+cube_coords = [(x, y, z) for x in (-1.0, 1.0) for y in (-1.0, 1.0) for z in (-1.0, 1.0)]
+
+# counter clockwise seen from outside
+cube_faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+
+def test_cube_is_valid():
+    validation = hull.validate_hull_topology(get_hull_topology(cube_coords, cube_faces))
+
+    assert validation.is_valid
+    assert validation.invalid_edges == ()
+
+def test_open_mesh_is_invalid():
+    validation = hull.validate_hull_topology(get_hull_topology(cube_coords, cube_faces[:-1]))
+
+    # the four edges around the missing face
+    assert not validation.is_valid
+    assert len(validation.invalid_edges) == 4
+
+def test_flipped_face_is_invalid():
+    faces = cube_faces[:-1] + [tuple(reversed(cube_faces[-1]))]
+    validation = hull.validate_hull_topology(get_hull_topology(cube_coords, faces))
+
+    assert not validation.is_valid
+    assert len(validation.invalid_edges) == 4
+
+def test_concave_mesh_is_invalid():
+    # a cube with its top face split and the middle pushed down, the pyramid points inwards
+    coords = cube_coords + [(0.0, 0.0, 0.5)]
+    faces = [f for f in cube_faces if f != (1, 5, 7, 3)] + [(1, 5, 8), (5, 7, 8), (7, 3, 8), (3, 1, 8)]
+
+    validation = hull.validate_hull_topology(get_hull_topology(coords, faces))
+
+    # the edges between the four inner triangles
+    assert not validation.is_valid
+    assert len(validation.invalid_edges) == 4
+
+def test_fingerprint():
+    topology = get_hull_topology(cube_coords, cube_faces)
+    coords = array.array('f', [v for c in cube_coords for v in c])
+    buffers = (topology.edge_vertices, topology.loop_vertices, topology.polygon_loop_starts)
+
+    moved_coords = array.array('f', coords)
+    moved_coords[0] += 0.5
+
+    assert hull.get_hull_fingerprint(coords, *buffers) == hull.get_hull_fingerprint(array.array('f', coords), *buffers)
+    assert hull.get_hull_fingerprint(coords, *buffers) != hull.get_hull_fingerprint(moved_coords, *buffers)
+
+def test_validation_cache_evicts_least_recently_used():
+    cache = hull.HullValidationCache(max_size=2)
+
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
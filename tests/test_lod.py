@@ -0,0 +1,76 @@
+import math
+
+import pytest
+
+from io_scene_gltf2_omi_collision.core import fitting, lod, primitives
+
+def _get_box_mesh(extents, offset=(0.0, 0.0, 0.0), skip_faces=0, is_inverted=False):
+    coords, faces = primitives.get_box_geometry(extents)
+    coords = [v + offset[i % 3] for i, v in enumerate(coords)]
+
+    triangles = []
+    for face in faces[skip_faces:]:
+        if is_inverted: face = tuple(reversed(face))
+        for i in range(1, len(face) - 1): triangles.extend((face[0], face[i], face[i + 1]))
+
+    return coords, triangles
+
+def test_primitive_volumes():
+    box = fitting.fit_shape([v for x in (-1, 1) for y in (-2, 2) for z in (-3, 3) for v in (x, y, z)], 'box')
+    assert lod.get_primitive_volume('box', box.geometry) == pytest.approx(48.0)
+
+    sphere = fitting.fit_shape([1.0, 0.0, 0.0, -1.0, 0.0, 0.0], 'sphere')
+    assert lod.get_primitive_volume('sphere', sphere.geometry) == pytest.approx(4.0 / 3.0 * math.pi)
+
+def test_closed_box_becomes_box():
+    coords, triangles = _get_box_mesh((1.0, 2.0, 3.0))
+    collider_lod = lod.choose_collider_lod(coords, triangles, tolerance=0.05)
+
+    assert collider_lod.collider_type == 'box'
+    assert collider_lod.error == pytest.approx(0.0, abs=1e-6)
+
+def test_box_hull_becomes_box():
+    coords, _ = _get_box_mesh((1.0, 2.0, 3.0))
+    assert lod.choose_collider_lod(coords, None, tolerance=0.05).collider_type == 'box'
+
+def test_sphere_hull_becomes_sphere():
+    coords, _ = primitives.get_sphere_geometry(1.0, segments=32, rings=16)
+    assert lod.choose_collider_lod(coords, None, tolerance=0.1).collider_type == 'sphere'
+
+def test_outside_tolerance_is_kept():
+    # a tetrahedron fills a sixth of its bounding box at best
+    coords = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+    assert lod.choose_collider_lod(coords, None, tolerance=0.1) is None
+
+@pytest.mark.parametrize('z_offset', [-1.0, 0.0, 1.0])
+def test_open_box_is_kept(z_offset):
+    # without the bottom face the signed volume depends on the origin
+    coords, triangles = _get_box_mesh((1.0, 1.0, 1.0), (0.0, 0.0, z_offset), skip_faces=1)
+
+    assert not lod.is_closed_mesh(triangles)
+    assert lod.choose_collider_lod(coords, triangles, tolerance=0.5) is None
+
+def test_inward_box_is_kept():
+    # a room shell, the inside is walkable
+    coords, triangles = _get_box_mesh((5.0, 5.0, 2.0), is_inverted=True)
+
+    assert lod.is_closed_mesh(triangles)
+    assert lod.choose_collider_lod(coords, triangles, tolerance=0.5) is None
+
+def test_unwelded_faces_are_open():
+    triangles = [0, 1, 2, 3, 5, 4]
+    assert not lod.is_closed_mesh(triangles)
+    assert not lod.is_closed_mesh([])
+
+def test_non_uniform_scale_only_allows_boxes():
+    coords, _ = primitives.get_sphere_geometry(1.0, segments=32, rings=16)
+    collider_lod = lod.choose_collider_lod(coords, None, tolerance=0.5, collider_types=['box'], allow_rotation=False)
+
+    assert collider_lod.collider_type == 'box'
+
+def test_scores_cover_every_type():
+    coords, triangles = _get_box_mesh((1.0, 1.0, 1.0))
+    scores = lod.score_primitives(coords, triangles)
+
+    assert [s.collider_type for s in scores] == lod.primitive_cost_order
+    assert all(0.0 <= s.error <= 1.0 for s in scores)
@@ -0,0 +1,89 @@
+import pytest
+
+from io_scene_gltf2_omi_collision.core import meshopt, primitives
+
+def _get_triangle_soup(coords, faces):
+    # every face with its own vertices, like a mesh split along all its edges
+    soup_coords = []
+    triangles = []
+
+    for face in faces:
+        base = len(soup_coords) // 3
+        for vertex in face: soup_coords.extend(coords[vertex * 3:vertex * 3 + 3])
+        for i in range(1, len(face) - 1): triangles.extend((base, base + i, base + i + 1))
+
+    return soup_coords, triangles
+
+def _is_closed(triangles):
+    edges = set()
+    for i in range(0, len(triangles), 3):
+        a, b, c = triangles[i:i + 3]
+        edges.update(((a, b), (b, c), (c, a)))
+
+    return all((b, a) in edges for a, b in edges)
+
+def test_weld_closes_split_box():
+    coords, triangles = _get_triangle_soup(*primitives.get_box_geometry((1.0, 2.0, 3.0)))
+    welded_coords, welded_triangles = meshopt.weld_vertices(coords, triangles)
+
+    assert len(welded_coords) // 3 == 8
+    assert len(welded_triangles) // 3 == 12
+    assert _is_closed(welded_triangles)
+
+def test_weld_keeps_distant_vertices():
+    coords = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.01, 0.0]
+    welded_coords, welded_triangles = meshopt.weld_vertices(coords, [0, 1, 2, 0, 1, 3], distance=1e-3)
+
+    assert len(welded_coords) // 3 == 4
+    assert len(welded_triangles) // 3 == 2
+
+def test_weld_drops_degenerate_and_repeated_triangles():
+    coords = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.00001, 0.0, 0.0]
+    triangles = [0, 1, 2, 1, 2, 0, 0, 3, 1, 0, 2, 1]
+
+    _, welded_triangles = meshopt.weld_vertices(coords, triangles, distance=1e-4)
+
+    # the rotated repeat and the collapsed triangle go, the opposite winding stays
+    assert len(welded_triangles) // 3 == 2
+
+def test_decimate_keeps_within_budget():
+    coords, faces = primitives.get_sphere_geometry(1.0, segments=48, rings=24)
+    coords, triangles = meshopt.weld_vertices(*_get_triangle_soup(coords, faces))
+
+    for max_triangles in [500, 100, 20]:
+        decimated_coords, decimated_triangles = meshopt.decimate_triangles(coords, triangles, max_triangles)
+
+        assert 0 < len(decimated_triangles) // 3 <= max_triangles
+        assert max(decimated_triangles) < len(decimated_coords) // 3
+
+        # cluster means stay inside the sphere
+        assert all(sum(v * v for v in decimated_coords[i:i + 3]) <= 1.0 + 1e-6 for i in range(0, len(decimated_coords), 3))
+
+def test_decimate_under_budget_is_unchanged():
+    coords, triangles = meshopt.weld_vertices(*_get_triangle_soup(*primitives.get_box_geometry((1.0, 1.0, 1.0))))
+    assert meshopt.decimate_triangles(coords, triangles, 12) == (coords, triangles)
+
+def test_optimize_collision_mesh():
+    coords, triangles = _get_triangle_soup(*primitives.get_capsule_geometry(0.5, 2.0))
+
+    optimized_coords, optimized_triangles = meshopt.optimize_collision_mesh(coords, triangles, max_triangles=64)
+
+    assert len(optimized_triangles) // 3 <= 64
+    assert len(optimized_coords) < len(coords)
+
+def test_empty_mesh():
+    assert meshopt.optimize_collision_mesh([], [], max_triangles=10) == ([], [])
+
+@pytest.mark.parametrize('max_triangles', [1, 3, 5])
+def test_decimate_small_budget_keeps_mesh(max_triangles):
+    # no grid gets a box down to so few triangles without collapsing it
+    coords, triangles = meshopt.weld_vertices(*_get_triangle_soup(*primitives.get_box_geometry((1.0, 1.0, 1.0))))
+    decimated_coords, decimated_triangles = meshopt.decimate_triangles(coords, triangles, max_triangles)
+
+    assert len(decimated_triangles) > 0
+    assert max(decimated_triangles) < len(decimated_coords) // 3
+
+def test_optimize_degenerate_mesh_keeps_mesh():
+    # every vertex within the weld distance
+    coords = [0.0, 0.0, 0.0, 1e-6, 0.0, 0.0, 0.0, 1e-6, 0.0]
+    assert meshopt.optimize_collision_mesh(coords, [0, 1, 2], max_triangles=1) == (coords, [0, 1, 2])
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+from io_scene_gltf2_omi_collision.core.nodes import NodeGraph
+
+def _create_node(name, children=None):
+    return SimpleNamespace(name=name, children=children)
+
+def _create_gltf(nodes, scene_nodes):
+    # the attributes of the exporter's glTF, Node and Scene objects the graph uses
+    return SimpleNamespace(nodes=nodes, scenes=[SimpleNamespace(nodes=scene_nodes)])
+
+def _get_children(gltf, node):
+    return [gltf.nodes[i].name for i in node.children or []]
+
+def test_root_collider():
+    collider = _create_node('Collider')
+    gltf = _create_gltf([_create_node('Other'), collider], [0, 1])
+
+    graph = NodeGraph(gltf)
+    parent_index = graph.insert_parent(collider, _create_node('Collider_DisplayMesh'))
+
+    # the parent takes the collider's place in the scene
+    assert parent_index == 2
+    assert gltf.scenes[0].nodes == [0, 2]
+    assert _get_children(gltf, gltf.nodes[2]) == ['Collider']
+    assert graph.index(gltf.nodes[2]) == 2
+
+def test_nested_collider():
+    collider = _create_node('Collider')
+    root = _create_node('Root', [1])
+    gltf = _create_gltf([root, collider], [0])
+
+    NodeGraph(gltf).insert_parent(collider, _create_node('Collider_DisplayMesh'))
+
+    assert gltf.scenes[0].nodes == [0]
+    assert _get_children(gltf, root) == ['Collider_DisplayMesh']
+    assert _get_children(gltf, gltf.nodes[2]) == ['Collider']
+
+def test_sibling_order_is_kept():
+    colliders = [_create_node(name) for name in ('A', 'B', 'C', 'D')]
+    root = _create_node('Root', [1, 2, 3, 4])
+    gltf = _create_gltf([root] + colliders, [0])
+
+    graph = NodeGraph(gltf)
+    for collider in (colliders[2], colliders[0], colliders[3]):
+        graph.insert_parent(collider, _create_node('{}_DisplayMesh'.format(collider.name)))
+
+    assert _get_children(gltf, root) == ['A_DisplayMesh', 'B', 'C_DisplayMesh', 'D_DisplayMesh']
+    for name in ('A', 'C', 'D'):
+        parent = next(n for n in gltf.nodes if n.name == '{}_DisplayMesh'.format(name))
+        assert _get_children(gltf, parent) == [name]
+
+def test_parent_of_wrapped_collider_is_tracked():
+    # wrapping a node twice nests the second parent between the first and the scene
+    collider = _create_node('Collider')
+    gltf = _create_gltf([collider], [0])
+
+    graph = NodeGraph(gltf)
+    graph.insert_parent(collider, _create_node('Inner'))
+    graph.insert_parent(gltf.nodes[1], _create_node('Outer'))
+
+    assert gltf.scenes[0].nodes == [2]
+    assert _get_children(gltf, gltf.nodes[2]) == ['Inner']
+    assert _get_children(gltf, gltf.nodes[1]) == ['Collider']
@@ -0,0 +1,49 @@
+import pytest
+
+from io_scene_gltf2_omi_collision import postprocess
+from io_scene_gltf2_omi_collision.core.glb import GlbFile
+
+# bounds center (1, 2, 3)
+coords = [(0.0, 0.0, 0.0), (2.0, 4.0, 6.0), (1.0, 1.0, 1.0)]
+
+def _get_display_nodes(collider_translation):
+    # a display mesh parent carrying the mesh and the object transform, and a box collider child centered on the mesh
+    return [
+        {'name': 'Cube', 'mesh': 0, 'children': [1], 'translation': [5.0, 0.0, 0.0], 'rotation': [0.0, 0.0, 0.7071068, 0.7071068]},
+        {'name': 'Collider', 'translation': collider_translation, 'extensions': {
+            'OMI_collider': {'type': 'box', 'extents': [1.0, 2.0, 3.0]}}}
+    ]
+
+def _run(input_path, output_path, *args):
+    return postprocess.main([input_path, output_path] + list(args))
+
+@pytest.mark.parametrize('offset', [[0.0, 0.0, 0.0], [0.5, -1.0, 2.0]])
+def test_primitive_to_hull_under_display_mesh(mesh_glb, tmp_path, offset):
+    center = [1.0, 2.0, 3.0]
+    path = mesh_glb(coords, _get_display_nodes([center[i] + offset[i] for i in range(3)]))
+    output_path = str(tmp_path / 'output.glb')
+
+    assert _run(path, output_path, '--node', 'Collider', '--type', 'hull') == 0
+
+    with GlbFile(output_path) as glb:
+        node = glb.json['nodes'][1]
+        assert node['extensions']['OMI_collider'] == {'type': 'hull', 'mesh': 0}
+        assert node['translation'] == pytest.approx(offset)
+
+def test_mesh_to_box_centers(mesh_glb, tmp_path):
+    path = mesh_glb(coords, [{'name': 'Cube', 'mesh': 0, 'translation': [5.0, 0.0, 0.0]}])
+    output_path = str(tmp_path / 'output.glb')
+
+    assert _run(path, output_path, '--node', 'Cube', '--type', 'box') == 0
+
+    with GlbFile(output_path) as glb:
+        node = glb.json['nodes'][0]
+        assert 'mesh' not in node
+        assert node['extensions']['OMI_collider']['extents'] == pytest.approx([1.0, 2.0, 3.0])
+        assert node['translation'] == pytest.approx([6.0, 2.0, 3.0])
+
+def test_unwritable_output(mesh_glb, tmp_path, capsys):
+    path = mesh_glb(coords, _get_display_nodes([1.0, 2.0, 3.0]))
+
+    assert _run(path, str(tmp_path / 'missing' / 'output.glb'), '--node', 'Collider', '--type', 'sphere') == 1
+    assert 'error:' in capsys.readouterr().err
@@ -0,0 +1,62 @@
+import array
+
+import pytest
+
+from conftest import get_hull_topology
+
+from io_scene_gltf2_omi_collision.baking import ColliderBakeStore
+from io_scene_gltf2_omi_collision.core import bounds, conversion, fitting, hull, primitives
+from io_scene_gltf2_omi_collision.prefetch import MeshSnapshot, compute_mesh_results, prefetch_collider_results
+
+def _get_box_snapshot(key, extents=(1.0, 2.0, 3.0), offset=(0.0, 0.0, 0.0), fitted_shapes=()):
+    # a box mesh with the buffers the add-on copies from Blender
+    flat_coords, faces = primitives.get_box_geometry(extents)
+    coords = array.array('f', [v + offset[i % 3] for i, v in enumerate(flat_coords)])
+
+    topology = get_hull_topology([tuple(coords[i:i + 3]) for i in range(0, len(coords), 3)], faces)
+    fingerprint_buffers = (topology.edge_vertices, topology.loop_vertices, topology.polygon_loop_starts)
+
+    return MeshSnapshot(key, coords, topology, fingerprint_buffers, list(fitted_shapes))
+
+def test_bounds_only():
+    snapshot = _get_box_snapshot('box', offset=(1.0, 0.0, 0.0))._replace(topology=None, fingerprint_buffers=None)
+    key, results = compute_mesh_results(snapshot)
+
+    assert key == 'box'
+    assert [name for name, _ in results] == ['bounds']
+    assert results[0][1] == bounds.get_coordinate_bounds(snapshot.coords)
+
+def test_results_match_direct_computation():
+    fitted_shapes = [('box', False, True), ('sphere', True, True), ('capsule', True, False)]
+    snapshot = _get_box_snapshot('box', offset=(0.5, -1.0, 2.0), fitted_shapes=fitted_shapes)
+
+    _, results = compute_mesh_results(snapshot)
+    results = dict(results)
+
+    assert results['fingerprint'] == hull.get_hull_fingerprint(snapshot.coords, *snapshot.fingerprint_buffers)
+    assert results['hull_validation'].is_valid
+
+    y_up_coords = conversion.convert_coordinates_to_y_up(snapshot.coords)
+    for collider_type, is_y_up, allow_rotation in fitted_shapes:
+        expected = fitting.fit_shape(y_up_coords if is_y_up else snapshot.coords, collider_type, allow_rotation)
+        assert results[('fitted_shape', collider_type, is_y_up, allow_rotation)] == expected
+
+def test_y_up_fit_is_rotated():
+    snapshot = _get_box_snapshot('box', extents=(1.0, 2.0, 3.0), fitted_shapes=[('box', True, False)])
+    _, results = compute_mesh_results(snapshot)
+
+    # blender z is glTF y
+    assert list(dict(results)[('fitted_shape', 'box', True, False)].geometry.extents) == pytest.approx([1.0, 3.0, 2.0])
+
+def test_prefetch_fills_store():
+    snapshots = [_get_box_snapshot(i, offset=(float(i), 0.0, 0.0), fitted_shapes=[('sphere', False, True)]) for i in range(5)]
+    store = ColliderBakeStore()
+
+    assert prefetch_collider_results(snapshots, store, workers=2) == 5
+
+    for snapshot in snapshots:
+        assert store.get(snapshot.key, 'bounds') == bounds.get_coordinate_bounds(snapshot.coords)
+        assert store.get(snapshot.key, ('fitted_shape', 'sphere', False, True)) is not None
+
+def test_nothing_to_prefetch():
+    assert prefetch_collider_results([], ColliderBakeStore()) == 0
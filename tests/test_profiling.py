@@ -0,0 +1,88 @@
+import json
+import pstats
+
+import pytest
+
+from io_scene_gltf2_omi_collision import profiling
+from io_scene_gltf2_omi_collision.profiling import ExportProfiler
+
+def test_inactive_profiler_records_nothing():
+    profiler = ExportProfiler()
+
+    with profiler.stage('hulls'): pass
+    profiler.count('hulls')
+
+    assert profiler.stages == {}
+    assert profiler.counters == {}
+
+def test_stages_and_counters():
+    profiler = ExportProfiler()
+    profiler.start()
+
+    for _ in range(3):
+        with profiler.stage('hulls'): pass
+    profiler.count('hulls')
+    profiler.count('hulls', 4)
+
+    profiler.stop()
+
+    assert not profiler.is_active
+    assert profiler.stages['hulls']['calls'] == 3
+    assert profiler.counters == {'hulls': 5}
+    assert profiler.seconds >= profiler.stages['hulls']['seconds'] >= 0.0
+
+    # stopped profilers ignore further calls
+    profiler.count('hulls')
+    assert profiler.counters == {'hulls': 5}
+
+def test_stage_is_timed_when_it_raises():
+    profiler = ExportProfiler()
+    profiler.start()
+
+    with pytest.raises(ValueError):
+        with profiler.stage('fitting'): raise ValueError()
+
+    assert profiler.stages['fitting']['calls'] == 1
+
+def test_start_resets():
+    profiler = ExportProfiler()
+    profiler.start()
+    profiler.count('meshes')
+    profiler.stop()
+
+    profiler.start()
+    assert profiler.counters == {}
+    assert profiler.seconds is None
+
+def test_write_report(tmp_path):
+    profiler = ExportProfiler()
+    profiler.start(use_cprofile=True)
+
+    with profiler.stage('work'): sum(i * i for i in range(1000))
+
+    profiler.stop()
+
+    report_path = str(tmp_path / 'report.json')
+    profile_path = str(tmp_path / 'export.prof')
+    profiler.write_report(report_path, profile_path, {'filepath': 'scene.glb'})
+
+    with open(report_path, encoding='utf-8') as f: report = json.load(f)
+
+    assert report['filepath'] == 'scene.glb'
+    assert report['profile_path'] == profile_path
+    assert report['stages']['work']['calls'] == 1
+    assert 0 < len(report['profile']) <= profiling.report_function_count
+    assert len(pstats.Stats(profile_path).stats) > 0
+
+def test_write_report_without_cprofile(tmp_path):
+    profiler = ExportProfiler()
+    profiler.start()
+    profiler.stop()
+
+    report_path = str(tmp_path / 'report.json')
+    profiler.write_report(report_path, str(tmp_path / 'export.prof'))
+
+    with open(report_path, encoding='utf-8') as f: report = json.load(f)
+
+    assert 'profile' not in report and 'profile_path' not in report
+    assert not (tmp_path / 'export.prof').exists()
@@ -0,0 +1,86 @@
+import math
+import random
+
+import pytest
+
+from io_scene_gltf2_omi_collision.core import quickhull
+
+def _get_random_coords(count, seed=0):
+    rng = random.Random(seed)
+    return [rng.uniform(-1.0, 1.0) for _ in range(count * 3)]
+
+def _get_sphere_coords(count, seed=0):
+    rng = random.Random(seed)
+
+    coords = []
+    for _ in range(count):
+        z = rng.uniform(-1.0, 1.0)
+        angle = rng.uniform(0.0, 2.0 * math.pi)
+        r = math.sqrt(1.0 - z * z)
+        coords.extend((r * math.cos(angle), r * math.sin(angle), z))
+
+    return coords
+
+def _assert_closed(triangles):
+    # every edge is walked once in each direction
+    edges = {}
+    for i in range(0, len(triangles), 3):
+        a, b, c = triangles[i:i + 3]
+        for edge in ((a, b), (b, c), (c, a)): edges[edge] = edges.get(edge, 0) + 1
+
+    assert all(count == 1 and edges.get((b, a), 0) == 1 for (a, b), count in edges.items())
+
+def _assert_contains(hull, coords, tolerance=1e-6):
+    normals, offsets = quickhull.get_convex_hull_planes(*hull)
+
+    for i in range(0, len(coords), 3):
+        point = coords[i:i + 3]
+        assert all(sum(n[a] * point[a] for a in range(3)) <= o + tolerance for n, o in zip(normals, offsets))
+
+def _get_points(coords):
+    return set(tuple(coords[i:i + 3]) for i in range(0, len(coords), 3))
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+@pytest.mark.parametrize('count', [10, 200, 3000])
+def test_hull_contains_all_points(monkeypatch, use_numpy, count):
+    if not use_numpy: monkeypatch.setattr(quickhull, 'np', None)
+    elif quickhull.np is None: pytest.skip('needs numpy')
+
+    coords = _get_random_coords(count)
+    hull = quickhull.compute_convex_hull(coords)
+
+    _assert_closed(hull[1])
+    _assert_contains(hull, coords)
+    assert _get_points(hull[0]) <= _get_points(coords)
+    assert quickhull.get_convex_hull_volume(*hull) > 0.0
+
+def test_cube_grid():
+    # points on the faces and inside are dropped, coplanar faces still close the hull
+    coords = [float(v) for x in range(5) for y in range(5) for z in range(5) for v in (x, y, z)]
+    hull = quickhull.compute_convex_hull(coords)
+
+    _assert_closed(hull[1])
+    assert quickhull.get_convex_hull_volume(*hull) == pytest.approx(64.0)
+    assert _get_points(hull[0]) == set((x, y, z) for x in (0.0, 4.0) for y in (0.0, 4.0) for z in (0.0, 4.0))
+
+@pytest.mark.parametrize('max_vertices', [4, 16, 64])
+def test_vertex_budget(max_vertices):
+    coords = _get_sphere_coords(2000)
+    hull = quickhull.compute_convex_hull(coords, max_vertices)
+
+    _assert_closed(hull[1])
+    assert 4 <= len(hull[0]) // 3 <= max_vertices
+    assert _get_points(hull[0]) <= _get_points(coords)
+
+def test_budget_above_vertex_count_keeps_hull():
+    coords = _get_sphere_coords(50)
+    assert quickhull.compute_convex_hull(coords, 1000) == quickhull.compute_convex_hull(coords)
+
+@pytest.mark.parametrize('coords', [
+    [0.0, 0.0, 0.0] * 4,
+    [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 2.0, 0.0, 0.0, 3.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+])
+def test_degenerate_input_raises(coords):
+    with pytest.raises(quickhull.HullError): quickhull.compute_convex_hull(coords)
@@ -0,0 +1,107 @@
+import random
+
+import pytest
+
+from io_scene_gltf2_omi_collision.core import bounds, spatial
+
+def _get_random_boxes(count, seed=0, spread=100.0):
+    rng = random.Random(seed)
+
+    boxes = []
+    for _ in range(count):
+        center = [rng.uniform(-spread, spread) for _ in range(3)]
+        size = [rng.uniform(0.5, 10.0) for _ in range(3)]
+        boxes.append((tuple(center[i] - size[i] for i in range(3)), tuple(center[i] + size[i] for i in range(3))))
+
+    return boxes
+
+def _get_brute_force_pairs(boxes):
+    return set(
+        (i, j) for i in range(len(boxes)) for j in range(i + 1, len(boxes))
+        if spatial._overlaps(boxes[i][0], boxes[i][1], boxes[j][0], boxes[j][1]))
+
+@pytest.mark.parametrize('count', [0, 1, 4, 5, 300])
+def test_pairs_match_brute_force(count):
+    boxes = _get_random_boxes(count)
+    assert set(spatial.BoundsTree(boxes).find_overlapping_pairs()) == _get_brute_force_pairs(boxes)
+
+def test_query_matches_brute_force():
+    boxes = _get_random_boxes(500, seed=1)
+    tree = spatial.BoundsTree(boxes)
+
+    for query_min, query_max in _get_random_boxes(50, seed=2):
+        expected = [i for i, (box_min, box_max) in enumerate(boxes) if spatial._overlaps(box_min, box_max, query_min, query_max)]
+        assert sorted(tree.query(query_min, query_max)) == expected
+
+def test_touching_boxes_overlap():
+    boxes = [((0.0, 0.0, 0.0), (1.0, 1.0, 1.0)), ((1.0, 0.0, 0.0), (2.0, 1.0, 1.0))]
+    assert list(spatial.BoundsTree(boxes).find_overlapping_pairs()) == [(0, 1)]
+
+def test_analyze_overlaps():
+    boxes = [
+        ((0.0, 0.0, 0.0), (10.0, 10.0, 10.0)),
+        ((1.0, 1.0, 1.0), (2.0, 2.0, 2.0)),
+        ((0.0, 0.0, 0.0), (10.0, 10.0, 10.0)),
+        ((0.5, 0.0, 0.0), (10.5, 10.0, 10.0)),
+        ((50.0, 50.0, 50.0), (51.0, 51.0, 51.0)),
+        ((1.0, 1.0, 1.0), (3.0, 3.0, 3.0)),
+    ]
+    is_trigger = [False, False, False, False, True, True]
+
+    report = spatial.analyze_overlaps(boxes, is_trigger)
+
+    # the later of two identical boxes is the redundant one, a trigger inside a collider is not
+    assert report.contained == [(1, 0), (2, 0)]
+    assert [(i, j) for i, j, _ in report.overlapping] == [(0, 3), (2, 3)]
+    assert report.overlapping[0][2] == pytest.approx(0.95)
+    assert report.isolated_triggers == [4]
+
+def test_analyze_overlaps_matches_brute_force():
+    boxes = _get_random_boxes(300, seed=3, spread=30.0)
+    report = spatial.analyze_overlaps(boxes, overlap_ratio=0.5)
+
+    expected = []
+    for i, j in sorted(_get_brute_force_pairs(boxes)):
+        if spatial._contains(*boxes[i], *boxes[j], 1e-6) or spatial._contains(*boxes[j], *boxes[i], 1e-6): continue
+
+        smallest_volume = min(spatial._get_volume(*boxes[i]), spatial._get_volume(*boxes[j]))
+        ratio = spatial._get_intersection_volume(*boxes[i], *boxes[j]) / smallest_volume
+        if ratio >= 0.5: expected.append((i, j))
+
+    assert len(expected) > 0
+    assert sorted((i, j) for i, j, _ in report.overlapping) == expected
+
+def _get_shape(collider_type, geometry, center=(0.0, 0.0, 0.0)):
+    world_to_local = [[1.0 if row == column else 0.0 for column in range(3)] + [-center[row] if row < 3 else 1.0] for row in range(4)]
+    return spatial.ColliderShape(collider_type, geometry, world_to_local)
+
+def test_mesh_container_contains_nothing():
+    # a prop inside a room shell
+    boxes = [((0.0, 0.0, 0.0), (10.0, 10.0, 3.0)), ((1.0, 1.0, 0.0), (2.0, 2.0, 1.0))]
+    report = spatial.analyze_overlaps(boxes, shapes=[None, None])
+
+    assert report.contained == []
+    assert report.overlapping == []
+
+def test_sphere_contains_only_inside_its_shape():
+    sphere = _get_shape('sphere', bounds.MeshGeometry((1.0, 1.0, 1.0), 1.0, 2.0, (0.0, 0.0, 0.0)), (5.0, 5.0, 5.0))
+    boxes = [
+        ((4.0, 4.0, 4.0), (6.0, 6.0, 6.0)),
+        ((4.8, 4.8, 4.8), (5.2, 5.2, 5.2)),
+        # in the sphere's bounds but past its surface
+        ((5.7, 5.7, 5.7), (5.9, 5.9, 5.9)),
+    ]
+
+    report = spatial.analyze_overlaps(boxes, shapes=[sphere, None, None])
+    assert report.contained == [(1, 0)]
+
+def test_capsule_contains_along_its_axis():
+    capsule = _get_shape('capsule', bounds.MeshGeometry((1.0, 1.0, 2.0), 1.0, 4.0, (0.0, 0.0, 0.0)))
+    boxes = [
+        ((-1.0, -1.0, -2.0), (1.0, 1.0, 2.0)),
+        ((-0.5, -0.5, 0.5), (0.5, 0.5, 1.5)),
+        ((0.7, 0.7, 1.7), (0.9, 0.9, 1.9)),
+    ]
+
+    report = spatial.analyze_overlaps(boxes, shapes=[capsule, None, None])
+    assert report.contained == [(1, 0)]
@@ -0,0 +1,69 @@
+import math
+
+import pytest
+
+from io_scene_gltf2_omi_collision.core import transforms
+
+# a quarter turn around z, [w, x, y, z]
+s = 0.5 ** 0.5
+quarter_turn = [s, 0.0, 0.0, s]
+identity = [1.0, 0.0, 0.0, 0.0]
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'python'])
+def use_numpy(request, monkeypatch):
+    if not request.param: monkeypatch.setattr(transforms, 'np', None)
+    elif transforms.np is None: pytest.skip('needs numpy')
+
+def _apply(nodes):
+    # nodes are dicts of the corrections that differ from identity
+    defaults = {
+        'translation': [0.0, 0.0, 0.0], 'rotation': identity, 'scale': [1.0, 1.0, 1.0],
+        'mesh_center': [0.0, 0.0, 0.0], 'fit_center': [0.0, 0.0, 0.0], 'fit_rotation': identity,
+        'offset_translation': [0.0, 0.0, 0.0], 'offset_rotation': identity, 'offset_scale': [1.0, 1.0, 1.0]}
+    columns = [[dict(defaults, **node)[name] for node in nodes] for name in defaults]
+
+    translations, rotations, scales = transforms.apply_collider_corrections(*columns)
+    return [list(t) for t in translations], [list(r) for r in rotations], [list(v) for v in scales]
+
+def test_identity_is_unchanged(use_numpy):
+    translations, rotations, scales = _apply([{'translation': [1.0, 2.0, 3.0], 'rotation': quarter_turn, 'scale': [2.0, 2.0, 2.0]}])
+
+    assert translations[0] == pytest.approx([1.0, 2.0, 3.0])
+    assert rotations[0] == pytest.approx(quarter_turn)
+    assert scales[0] == pytest.approx([2.0, 2.0, 2.0])
+
+def test_fit_center_is_scaled_and_rotated(use_numpy):
+    # the fit center is in the mesh frame, so it turns and scales with the node
+    translations, _, _ = _apply([{
+        'translation': [1.0, 0.0, 0.0], 'rotation': quarter_turn, 'scale': [2.0, 3.0, 1.0],
+        'mesh_center': [0.0, 0.0, 5.0], 'fit_center': [1.0, 1.0, 0.0]}])
+
+    assert translations[0] == pytest.approx([1.0 - 3.0, 2.0, 5.0])
+
+def test_rotations_and_offsets_compose(use_numpy):
+    fit_rotation = transforms.euler_to_quaternion([0.3, 0.0, 0.0])
+    offset_rotation = transforms.euler_to_quaternion([0.0, 0.0, -0.7])
+
+    translations, rotations, scales = _apply([{
+        'rotation': quarter_turn, 'fit_rotation': fit_rotation, 'offset_rotation': offset_rotation,
+        'offset_translation': [0.5, -1.0, 0.0], 'scale': [2.0, 2.0, 2.0], 'offset_scale': [1.0, 0.5, 3.0]}])
+
+    expected = transforms.quaternion_multiply(transforms.quaternion_multiply(quarter_turn, fit_rotation), offset_rotation)
+
+    # offsets are in the parent frame, not turned by the node
+    assert translations[0] == pytest.approx([0.5, -1.0, 0.0])
+    assert rotations[0] == pytest.approx(expected)
+    assert scales[0] == pytest.approx([2.0, 1.0, 6.0])
+
+def test_nodes_are_independent(use_numpy):
+    nodes = [
+        {'translation': [1.0, 0.0, 0.0]},
+        {'rotation': quarter_turn, 'fit_center': [1.0, 0.0, 0.0]},
+        {'mesh_center': [0.0, 0.0, -1.0], 'offset_scale': [2.0, 2.0, 2.0]}]
+
+    translations, rotations, scales = _apply(nodes)
+
+    assert translations == [pytest.approx(t) for t in ([1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, -1.0])]
+    assert rotations[1] == pytest.approx(quarter_turn)
+    assert scales[2] == pytest.approx([2.0, 2.0, 2.0])
+    assert math.isclose(sum(v * v for v in rotations[0]), 1.0)